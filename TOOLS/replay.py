@@ -5,6 +5,7 @@ Replay Tool: Re-execute a logged provenance event with exact payload
 from __future__ import annotations
 from pathlib import Path
 import json
+import os
 import sys
 import subprocess
 import time
@@ -12,7 +13,7 @@ import hashlib
 
 ROOT = Path(__file__).resolve().parents[1]
 OVERLAYS_DIR = ROOT / ".aal" / "overlays"
-LOG_PATH = ROOT / "logs" / "provenance.jsonl"
+LOG_PATH = Path(os.environ.get("AAL_LOGS_DIR") or ROOT / "logs") / "provenance.jsonl"
 
 
 def compute_manifest_hash(manifest: dict) -> str:
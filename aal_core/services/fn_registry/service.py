@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
@@ -86,7 +87,10 @@ class FunctionRegistry:
         self._bus = bus
         self._overlays_root = overlays_root
         self._last_hash: Optional[str] = None
+        # Replaced wholesale (single attribute store), so readers never lock.
         self._snapshot: Optional[CatalogSnapshot] = None
+        self._tick_lock = threading.Lock()
+        self._tick_pending = False
 
     def _compute_catalog_hash(self, descriptors: List[Dict[str, Any]]) -> str:
         """
@@ -196,6 +200,46 @@ class FunctionRegistry:
                 },
             )
 
+    def request_tick(self) -> bool:
+        """
+        tick(), coalescing concurrent callers.
+
+        If a rebuild is already in flight, the call only marks it to run
+        once more when done, and returns immediately. At most one rebuild
+        runs at a time, and any request that arrives during a rebuild is
+        covered by a rebuild that starts after it.
+
+        Returns:
+            True if this call ran at least one rebuild, False if coalesced
+        """
+        ran = False
+        while True:
+            if not self._tick_lock.acquire(blocking=False):
+                self._tick_pending = True
+                return ran
+            try:
+                self._tick_pending = False
+                self.tick()
+                ran = True
+            finally:
+                self._tick_lock.release()
+            if not self._tick_pending:
+                return ran
+
+    def prime(self) -> CatalogSnapshot:
+        """
+        Build catalog and adopt its hash as already announced (no bus event).
+
+        For secondary worker processes whose launcher has already published
+        the current catalog; later tick() calls emit only on real changes.
+
+        Returns:
+            The built CatalogSnapshot
+        """
+        snapshot = self.build_catalog()
+        self._last_hash = snapshot.catalog_hash
+        return snapshot
+
     def get_snapshot(self) -> CatalogSnapshot:
         """
         Get current catalog snapshot.
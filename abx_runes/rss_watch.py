@@ -0,0 +1,88 @@
+# abx_runes/rss_watch.py
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Optional
+
+from .memory_runes import MemoryProfile
+from .scheduler_memory_layer import apply_degrade_step
+
+# Degrade actions applied at SOFT pressure: cheap, reversible shrinks. At HARD
+# pressure the profile's whole DEGRADE path applies.
+SOFT_ACTIONS = frozenset({"SHRINK_KV", "CONTEXT"})
+
+
+def read_rss_mb() -> Optional[float]:
+    """
+    Current resident set size of this process in MiB, from /proc/self/status
+    (VmRSS). Returns None if unavailable (non-Linux).
+    """
+    try:
+        with open("/proc/self/status", "rb") as f:
+            for line in f:
+                if line.startswith(b"VmRSS:"):
+                    return int(line.split()[1]) / 1024.0
+    except (FileNotFoundError, ValueError, IndexError):
+        return None
+    return None
+
+
+def classify_rss(rss_mb: Optional[float], profile: Optional[MemoryProfile]) -> str:
+    """NORMAL / SOFT / HARD tier of `rss_mb` against a profile's MEM caps."""
+    if rss_mb is None or profile is None:
+        return "NORMAL"
+    if rss_mb >= profile.mem.hard_cap_mb:
+        return "HARD"
+    if rss_mb >= profile.mem.soft_cap_mb:
+        return "SOFT"
+    return "NORMAL"
+
+
+def degradation_for(profile: Optional[MemoryProfile], tier: str) -> Dict[str, Any]:
+    """
+    Runtime parameters (kv_shrink_factor, max_context_tokens, ...) for a tier.
+
+    NORMAL yields {}; SOFT applies only SOFT_ACTIONS steps; HARD applies every
+    step, in DEGRADE order. Sets are returned as sorted lists (JSON-ready).
+    """
+    params: Dict[str, Any] = {}
+    if tier == "NORMAL" or profile is None or not profile.degrade:
+        return params
+    for step in profile.degrade.sorted_steps():
+        if tier == "HARD" or step.action.upper() in SOFT_ACTIONS:
+            apply_degrade_step(step, params)
+    if "disabled_features" in params:
+        params["disabled_features"] = sorted(params["disabled_features"])
+    return params
+
+
+class RssWatcher:
+    """
+    Samples this process's RSS every `interval_s` on a daemon thread.
+
+    Readers use `current_rss_mb` (a plain attribute, replaced per sample)
+    and never block on the sampler.
+    """
+
+    def __init__(self, interval_s: float = 0.1) -> None:
+        self.interval_s = interval_s
+        self.current_rss_mb: Optional[float] = read_rss_mb()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "RssWatcher":
+        if self._thread is None and self.current_rss_mb is not None:
+            self._thread = threading.Thread(target=self._run, name="rss-watch", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            self.current_rss_mb = read_rss_mb()
@@ -95,53 +95,57 @@ class MemoryAwareScheduler:
         return result
 
     def _apply_single_step(self, step: DegradeStep, params: Dict[str, Any], stress: float) -> None:
-        """
-        Map degrade actions onto concrete runtime parameters.
+        apply_degrade_step(step, params)
 
-        This layer does *not* perform the actual KV/context changes;
-        it sets flags and values that your LLM / pipeline code consumes.
 
-        Supported actions:
-          - SHRINK_KV(fraction)
-          - CONTEXT(tokens)
-          - DISABLE(flag_name)
-          - BATCH(mode)
-          - OFFLOAD(tier)
-        """
-        action = step.action.upper()
-
-        if action == "SHRINK_KV":
-            if not step.args:
-                return
-            factor = float(step.args[0])
-            # Compose multiplicatively if already set
-            existing = params.get("kv_shrink_factor", 1.0)
-            params["kv_shrink_factor"] = existing * factor
-
-        elif action == "CONTEXT":
-            if not step.args:
-                return
-            max_tokens = int(step.args[0])
-            current = params.get("max_context_tokens")
-            params["max_context_tokens"] = min(current, max_tokens) if current else max_tokens
-
-        elif action == "DISABLE":
-            if not step.args:
-                return
-            flag = step.args[0]
-            disabled = params.setdefault("disabled_features", set())
-            disabled.add(flag)
-
-        elif action == "BATCH":
-            if not step.args:
-                return
-            mode = step.args[0]
-            params["batch_mode"] = mode
-
-        elif action == "OFFLOAD":
-            if not step.args:
-                return
-            tier = step.args[0]
-            params["offload_tier"] = tier
-
-        # You can extend this mapping with project-specific actions as needed.
+def apply_degrade_step(step: DegradeStep, params: Dict[str, Any]) -> None:
+    """
+    Map degrade actions onto concrete runtime parameters.
+
+    This layer does *not* perform the actual KV/context changes;
+    it sets flags and values that your LLM / pipeline code consumes.
+
+    Supported actions:
+      - SHRINK_KV(fraction)
+      - CONTEXT(tokens)
+      - DISABLE(flag_name)
+      - BATCH(mode)
+      - OFFLOAD(tier)
+    """
+    action = step.action.upper()
+
+    if action == "SHRINK_KV":
+        if not step.args:
+            return
+        factor = float(step.args[0])
+        # Compose multiplicatively if already set
+        existing = params.get("kv_shrink_factor", 1.0)
+        params["kv_shrink_factor"] = existing * factor
+
+    elif action == "CONTEXT":
+        if not step.args:
+            return
+        max_tokens = int(step.args[0])
+        current = params.get("max_context_tokens")
+        params["max_context_tokens"] = min(current, max_tokens) if current else max_tokens
+
+    elif action == "DISABLE":
+        if not step.args:
+            return
+        flag = step.args[0]
+        disabled = params.setdefault("disabled_features", set())
+        disabled.add(flag)
+
+    elif action == "BATCH":
+        if not step.args:
+            return
+        mode = step.args[0]
+        params["batch_mode"] = mode
+
+    elif action == "OFFLOAD":
+        if not step.args:
+            return
+        tier = step.args[0]
+        params["offload_tier"] = tier
+
+    # You can extend this mapping with project-specific actions as needed.
@@ -1,38 +1,68 @@
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, Tuple
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
 
 from .hashing import canonical_json_dumps, sha256_hex
 
 
-ALLOWED_PATCH_FIELDS = {"allowed_lanes", "evidence_required", "required_evidence_ports"}
+ALLOWED_PATCH_FIELDS = frozenset({"allowed_lanes", "evidence_required", "required_evidence_ports"})
 
+# Derived once at import instead of per patch
+_KNOWN_PATCH_FIELDS = ALLOWED_PATCH_FIELDS | {"id", "from_node", "to_node"}
+_ALLOWED_SORTED = tuple(sorted(ALLOWED_PATCH_FIELDS))
 
-def find_link_index(manifest: Dict[str, Any], patch: Dict[str, Any]) -> int:
-    links = manifest.get("links", []) or []
+
+# (by_id, by_edge): str(link id) -> indices, (str(from), str(to)) -> indices
+LinkIndex = Tuple[Dict[str, List[int]], Dict[Tuple[str, str], List[int]]]
+
+
+def build_link_index(manifest: Dict[str, Any]) -> LinkIndex:
+    """
+    Index manifest links by id and by (from_node, to_node) in one pass.
+
+    Patches only touch ALLOWED_PATCH_FIELDS, so the index stays valid while
+    patches are applied.
+    """
+    by_id: Dict[str, List[int]] = defaultdict(list)
+    by_edge: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+    for i, link in enumerate(manifest.get("links", []) or []):
+        by_id[str(link.get("id", ""))].append(i)
+        by_edge[(str(link.get("from_node", "")), str(link.get("to_node", "")))].append(i)
+    return by_id, by_edge
+
+
+def find_link_index(
+    manifest: Dict[str, Any],
+    patch: Dict[str, Any],
+    index: Optional[LinkIndex] = None,
+) -> int:
+    """
+    Index of the single link a patch targets (by id, or by from_node/to_node).
+
+    Pass a build_link_index() result when applying many patches to skip the
+    per-patch scan of every link.
+    """
+    by_id, by_edge = index if index is not None else build_link_index(manifest)
     pid = patch.get("id", "")
     frm = patch.get("from_node", "")
     to = patch.get("to_node", "")
 
-    matches = []
-    for i, l in enumerate(links):
-        if pid and str(l.get("id", "")) == str(pid):
-            matches.append(i)
-            continue
-        if frm and to and str(l.get("from_node", "")) == str(frm) and str(l.get("to_node", "")) == str(to):
-            matches.append(i)
+    # A link matching both by id and by edge counts once
+    matches = set(by_id.get(str(pid), ())) if pid else set()
+    if frm and to:
+        matches.update(by_edge.get((str(frm), str(to)), ()))
 
     if len(matches) == 0:
         raise ValueError("No matching link found for patch (by id or from_node/to_node).")
     if len(matches) > 1:
         raise ValueError("Ambiguous patch: multiple matching links found.")
-    return matches[0]
+    return matches.pop()
 
 
 def apply_patch_to_link(link: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
     out = dict(link)
-    for k in sorted(ALLOWED_PATCH_FIELDS):
+    for k in _ALLOWED_SORTED:
         if k in patch:
             out[k] = patch[k]
     return out
@@ -42,20 +72,21 @@ def relock_manifest_hash(manifest: Dict[str, Any]) -> Dict[str, Any]:
     """
     Self-hash safe: set provenance.manifest_hash="" during hashing, then fill it.
     """
-    m = json.loads(canonical_json_dumps(manifest))
+    # Only provenance is written, so copy just the top level and that dict
+    # (no serialize/parse deep copy); the caller's manifest is left untouched.
+    m = dict(manifest)
     prov = m.get("provenance", {})
-    if not isinstance(prov, dict):
-        prov = {}
+    prov = dict(prov) if isinstance(prov, dict) else {}
     prov["manifest_hash"] = ""
     m["provenance"] = prov
     payload = canonical_json_dumps(m).encode("utf-8")
     h = sha256_hex(payload)
-    m["provenance"]["manifest_hash"] = h
+    prov["manifest_hash"] = h
     return m
 
 
 def validate_patch_fields(patch: Dict[str, Any]) -> Tuple[bool, str]:
-    unknown = set(patch.keys()) - (ALLOWED_PATCH_FIELDS | {"id", "from_node", "to_node"})
+    unknown = patch.keys() - _KNOWN_PATCH_FIELDS
     if unknown:
         return False, f"unknown_fields:{sorted(unknown)}"
     return True, "ok"
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import Any, Dict, Mapping, Optional, Tuple
 
 
@@ -116,9 +117,18 @@ class YggdrasilManifest:
     nodes: Tuple[YggdrasilNode, ...]
     links: Tuple[RuneLink, ...] = ()
 
-    def node_index(self) -> Dict[str, YggdrasilNode]:
+    @cached_property
+    def _node_index(self) -> Dict[str, YggdrasilNode]:
+        # `nodes` is an immutable tuple on a frozen dataclass, so the index can
+        # never go stale; build it once per manifest instance.
         return {n.id: n for n in self.nodes}
 
+    def node_index(self) -> Dict[str, YggdrasilNode]:
+        """
+        Id -> node index, built once per manifest. Treat as read-only.
+        """
+        return self._node_index
+
 
 @dataclass(frozen=True)
 class PlanOptions:
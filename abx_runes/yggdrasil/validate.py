@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import Dict, List, Set, Tuple
 
-from .schema import Lane, RuneLink, YggdrasilManifest, YggdrasilNode
+from .schema import Lane, YggdrasilManifest, YggdrasilNode
 from .linkgen import evidence_port_name
 
 
@@ -10,6 +11,16 @@ class ValidationError(Exception):
     pass
 
 
+@dataclass
+class _EdgeSummary:
+    """
+    Union of everything the RuneLinks on one (from, to) edge permit/require.
+    """
+    lanes: Set[str] = field(default_factory=set)
+    evidence: Set[str] = field(default_factory=set)
+    ports: Set[Tuple[str, str]] = field(default_factory=set)  # required (name, dtype)
+
+
 def _lane_pair(src: Lane, dst: Lane) -> str:
     return f"{src.value}->{dst.value}"
 
@@ -35,27 +46,33 @@ def validate_manifest(m: YggdrasilManifest) -> None:
                 f"Authority violation: parent '{p.id}' ({p.authority_level}) < child '{n.id}' ({n.authority_level})."
             )
 
-    # Edge->links index
-    by_edge: Dict[Tuple[str, str], List[RuneLink]] = {}
+    # Edge->summary index, built in a single pass over links
+    by_edge: Dict[Tuple[str, str], _EdgeSummary] = {}
     for l in m.links:
-        by_edge.setdefault((l.from_node, l.to_node), []).append(l)
+        key = (l.from_node, l.to_node)
+        summary = by_edge.get(key)
+        if summary is None:
+            summary = by_edge[key] = _EdgeSummary()
+        summary.lanes.update(l.allowed_lanes)
+        summary.evidence.update(l.evidence_required or ())
+        for p in getattr(l, "required_evidence_ports", ()) or ():
+            if bool(p.required):
+                summary.ports.add((p.name, p.dtype))
 
     def has_link(frm: str, to: str) -> bool:
         return (frm, to) in by_edge
 
     def link_allows_lane(frm: str, to: str, lp: str) -> bool:
-        return any(lp in l.allowed_lanes for l in by_edge.get((frm, to), []))
+        summary = by_edge.get((frm, to))
+        return summary is not None and lp in summary.lanes
 
     def link_requires_evidence_tag(frm: str, to: str, tag: str) -> bool:
-        return any(tag in (l.evidence_required or ()) for l in by_edge.get((frm, to), []))
+        summary = by_edge.get((frm, to))
+        return summary is not None and tag in summary.evidence
 
     def link_requires_port(frm: str, to: str, port_name: str, dtype: str) -> bool:
-        for l in by_edge.get((frm, to), []):
-            ports = getattr(l, "required_evidence_ports", ()) or ()
-            for p in ports:
-                if p.name == port_name and p.dtype == dtype and bool(p.required):
-                    return True
-        return False
+        summary = by_edge.get((frm, to))
+        return summary is not None and (port_name, dtype) in summary.ports
 
     # Lane + realm + existence rules over depends_on
     for n in m.nodes:
@@ -100,24 +117,39 @@ def validate_manifest(m: YggdrasilManifest) -> None:
 
 
 def _assert_acyclic_depends_on(nodes: Dict[str, YggdrasilNode]) -> None:
-    temp: Set[str] = set()
-    perm: Set[str] = set()
-
-    def deps(nid: str) -> List[str]:
-        return sorted(list(nodes[nid].depends_on))
-
-    def visit(nid: str) -> None:
-        if nid in perm:
-            return
-        if nid in temp:
-            raise ValidationError(f"Cycle detected in depends_on graph at '{nid}'.")
-        temp.add(nid)
-        for d in deps(nid):
-            if d not in nodes:
-                raise ValidationError(f"Missing dependency '{d}' referenced by '{nid}'.")
-            visit(d)
-        temp.remove(nid)
-        perm.add(nid)
-
-    for nid in sorted(nodes.keys()):
-        visit(nid)
+    # Precondition: every depends_on target exists in `nodes` (checked by
+    # validate_manifest before this runs), so traversal does no membership test.
+    #
+    # Iterative DFS over an integer-flattened graph: node ids are mapped to
+    # their rank in sorted order, so visiting ascending ints reproduces the
+    # sorted-by-id traversal (and therefore the reported cycle node), without
+    # string hashing in the inner loop or Python recursion limits on deep chains.
+    ids = sorted(nodes.keys())
+    rank = {nid: i for i, nid in enumerate(ids)}
+    adj: List[List[int]] = [sorted(rank[d] for d in nodes[nid].depends_on) for nid in ids]
+
+    # DFS colours: unseen, on the current path, finished
+    unseen, on_path, done = 0, 1, 2
+    state = bytearray(len(ids))
+
+    for root in range(len(ids)):
+        if state[root] != unseen:
+            continue
+        state[root] = on_path
+        stack: List[Tuple[int, int]] = [(root, 0)]
+        while stack:
+            v, i = stack[-1]
+            kids = adj[v]
+            if i == len(kids):
+                state[v] = done
+                stack.pop()
+                continue
+            stack[-1] = (v, i + 1)
+            w = kids[i]
+            st = state[w]
+            if st == done:
+                continue
+            if st == on_path:
+                raise ValidationError(f"Cycle detected in depends_on graph at '{ids[w]}'.")
+            state[w] = on_path
+            stack.append((w, 0))
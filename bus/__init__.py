@@ -1,6 +1,6 @@
 """AAL-Core bus module for overlay orchestration."""
 from .types import Phase, OverlayManifest, InvocationResult
-from .overlay_registry import load_overlays
+from .overlay_registry import load_overlays, load_one
 from .policy import enforce_phase_policy, PolicyDecision
 
 __all__ = [
@@ -8,6 +8,7 @@ __all__ = [
     "OverlayManifest",
     "InvocationResult",
     "load_overlays",
+    "load_one",
     "enforce_phase_policy",
     "PolicyDecision",
 ]
@@ -0,0 +1,66 @@
+"""
+Digest selection for provenance / fingerprint hashing.
+
+SHA-256 stays the default so existing logs, pinned fixtures and the
+documented "SHA256 hex digest" contracts keep verifying. Set
+``AAL_HASH=blake2b`` to switch to BLAKE2b-256 (same 64-char hex length,
+cheaper on small inputs without SHA-NI). The choice is read once at import;
+logs written under one setting must be verified under the same setting.
+
+BLAKE2b is also keyed-hash capable (``key=``) should MAC'd events be needed.
+``blake3`` (256-bit output) is accepted when the optional ``blake3`` package
+is installed.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import Any, Callable, Dict, Optional
+
+HASH_ALGO = os.environ.get("AAL_HASH", "sha256").strip().lower() or "sha256"
+
+
+def _blake2b_256(raw: bytes) -> Any:
+    return hashlib.blake2b(raw, digest_size=32)
+
+
+_DIGESTS: Dict[str, Callable[[bytes], Any]] = {
+    "sha256": hashlib.sha256,
+    "blake2b": _blake2b_256,
+}
+
+try:
+    import blake3 as _blake3
+except ImportError:  # optional dependency
+    _blake3 = None
+else:
+    _DIGESTS["blake3"] = _blake3.blake3
+
+
+def check_algo(algo: str, var: str = "AAL_HASH") -> str:
+    """Validate a digest name (as configured via env `var`) and return it."""
+    if algo in _DIGESTS:
+        return algo
+    if algo == "blake3":
+        raise ValueError(f"{var}=blake3 requires the optional 'blake3' package")
+    raise ValueError(f"Unsupported {var}={algo!r}; expected one of {sorted(_DIGESTS)}")
+
+
+_DIGEST = _DIGESTS[check_algo(HASH_ALGO)]
+
+
+def new_hasher() -> Any:
+    """Incremental hasher (``update``/``hexdigest``) for the configured algorithm."""
+    return _DIGEST(b"")
+
+
+def digest_hex(raw: bytes, algo: Optional[str] = None) -> str:
+    """
+    Hex digest (64 chars) of raw bytes.
+
+    Uses the configured algorithm unless ``algo`` is given, which lets
+    verifiers re-check logs written under a different AAL_HASH setting.
+    """
+    if algo is None:
+        return _DIGEST(raw).hexdigest()
+    return _DIGESTS[algo](raw).hexdigest()
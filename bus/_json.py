@@ -0,0 +1,56 @@
+"""
+JSON helpers for bus hot paths.
+
+orjson is an optional accelerator for parsing and for ``dumps`` (compact
+bytes for logs and transport). Its float formatting differs from the stdlib
+(``1e16`` vs ``1e+16``), so anything that gets hashed keeps the stdlib
+canonical form to keep provenance hashes stable.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+_COMPACT = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(raw: Union[str, bytes]) -> Any:
+    """Parse JSON from str or UTF-8 bytes (orjson when available)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity are rejected by orjson but accepted by the stdlib.
+            pass
+    return json.loads(raw)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Compact UTF-8 JSON bytes, insertion-ordered (orjson when available).
+
+    Not for hashing. Falls back to the stdlib for values orjson rejects
+    (non-str keys, >64-bit ints); note orjson writes NaN/Infinity as null.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return _COMPACT.encode(obj).encode("utf-8")
+
+
+def dumps_line(obj: Any) -> bytes:
+    """dumps(obj) plus a trailing newline, as one JSONL record."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    return (_COMPACT.encode(obj) + "\n").encode("utf-8")
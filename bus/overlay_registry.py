@@ -1,45 +1,137 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
 import hashlib
-from typing import Dict, Tuple
+import os
+from typing import Any, Dict, List, Tuple
 
-from .types import OverlayManifest, Phase
+from ._json import loads as _loads
+from .types import PHASE_INTERN, OverlayManifest, Phase
 
 def _as_phase_list(raw) -> list[Phase]:
     phases = []
     for p in raw:
-        if p not in ("OPEN", "ALIGN", "ASCEND", "CLEAR", "SEAL"):
+        phase = PHASE_INTERN.get(p) if isinstance(p, str) else None
+        if phase is None:
             raise ValueError(f"Invalid phase in manifest: {p}")
-        phases.append(p)  # type: ignore
+        phases.append(phase)
     return phases
 
+# Manifest hashes are provenance: always the stdlib canonical form, never
+# orjson (which writes 1e16 where the stdlib writes 1e+16). orjson only parses.
+_ENC = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
 def _canonical_json(obj: dict) -> str:
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return _ENC.encode(obj)
 
 def _hash_manifest(data: dict) -> str:
     raw = _canonical_json(data).encode("utf-8")
     return hashlib.sha256(raw).hexdigest()
 
+def _read_manifest(manifest_path: Path) -> Tuple[Dict[str, Any], str]:
+    # Pure IO + parse + hash; safe to run off the main thread.
+    raw_data = _loads(manifest_path.read_bytes())
+    return raw_data, _hash_manifest(raw_data)
+
+def _max_workers(n: int) -> int:
+    return max(1, min(32, (os.cpu_count() or 1) * 4, n))
+
+def _build_manifest(raw_data: Dict[str, Any], manifest_path: Path) -> OverlayManifest:
+    capabilities = raw_data.get("capabilities", [])
+    if not isinstance(capabilities, list) or not all(isinstance(x, str) for x in capabilities):
+        raise ValueError("manifest.capabilities must be a list[str]")
+
+    # NEW: op_policy (trusted allowlist + required caps)
+    op_policy = raw_data.get("op_policy", {})
+    if not isinstance(op_policy, dict):
+        raise ValueError("manifest.op_policy must be an object/dict")
+
+    # normalize: op -> list[str]
+    norm_op_policy: Dict[str, list[str]] = {}
+    for op, caps in op_policy.items():
+        if not isinstance(op, str):
+            raise ValueError("manifest.op_policy keys must be strings")
+        if not isinstance(caps, list) or not all(isinstance(c, str) for c in caps):
+            raise ValueError(f"manifest.op_policy['{op}'] must be list[str]")
+        norm_op_policy[op] = list(caps)
+
+    mf = OverlayManifest(
+        name=str(raw_data["name"]),
+        version=str(raw_data.get("version", "unknown")),
+        status=str(raw_data.get("status", "unknown")),
+        phases=_as_phase_list(raw_data.get("phases", [])),
+        entrypoint=str(raw_data.get("entrypoint", "")).strip(),
+        capabilities=list(capabilities),
+        op_policy=norm_op_policy,
+        timeout_ms=int(raw_data.get("timeout_ms", 2500)),
+    )
+
+    if not mf.entrypoint:
+        raise ValueError(f"Missing entrypoint in manifest: {manifest_path}")
+
+    return mf
+
+def load_one(manifest_path: Path) -> Tuple[Path, OverlayManifest, str]:
+    """Read, validate and hash a single overlay manifest.json (no registry cache)."""
+    raw_data, manifest_hash = _read_manifest(manifest_path)
+    return manifest_path.parent, _build_manifest(raw_data, manifest_path), manifest_hash
+
 _CACHE: Dict[str, Tuple[Path, OverlayManifest, str]] = {}
 
+# manifest.json path -> (st_mtime_ns, st_size, raw_data, manifest_hash), so an
+# unchanged manifest costs one stat() instead of read + parse + hash.
+_READ_CACHE: Dict[Path, Tuple[int, int, Dict[str, Any], str]] = {}
+
 def load_overlays(overlays_dir: Path, use_cache: bool = True) -> Dict[str, Tuple[Path, OverlayManifest, str]]:
     overlays: Dict[str, Tuple[Path, OverlayManifest, str]] = {}
 
     if not overlays_dir.exists():
         _CACHE.clear()
+        _READ_CACHE.clear()
         return overlays
 
+    entries: List[Tuple[Path, Path]] = []
+    stats: List[Tuple[int, int]] = []
     for overlay_dir in overlays_dir.iterdir():
         if not overlay_dir.is_dir():
             continue
 
         manifest_path = overlay_dir / "manifest.json"
-        if not manifest_path.exists():
+        try:
+            st = manifest_path.stat()
+        except FileNotFoundError:
             continue
 
-        raw_data = json.loads(manifest_path.read_text(encoding="utf-8"))
-        manifest_hash = _hash_manifest(raw_data)
+        entries.append((overlay_dir, manifest_path))
+        stats.append((st.st_mtime_ns, st.st_size))
+
+    parsed: List[Any] = [None] * len(entries)
+    stale: List[int] = []
+    for i, ((_, manifest_path), sig) in enumerate(zip(entries, stats)):
+        hit = _READ_CACHE.get(manifest_path) if use_cache else None
+        if hit is not None and hit[:2] == sig:
+            parsed[i] = hit[2:]
+        else:
+            stale.append(i)
+
+    # Read/parse/hash changed manifests concurrently (IO-bound on cold caches).
+    # Results are consumed in directory order on this thread, so _CACHE is
+    # only ever mutated here and error precedence matches the serial loop.
+    paths = [entries[i][1] for i in stale]
+    if len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=_max_workers(len(paths))) as pool:
+            fresh = list(pool.map(_read_manifest, paths))
+    else:
+        fresh = [_read_manifest(path) for path in paths]
+    for i, result in zip(stale, fresh):
+        parsed[i] = result
+        _READ_CACHE[entries[i][1]] = (*stats[i], *result)
+
+    for dead in set(_READ_CACHE) - {manifest_path for _, manifest_path in entries}:
+        del _READ_CACHE[dead]
+
+    for (overlay_dir, manifest_path), (raw_data, manifest_hash) in zip(entries, parsed):
         name = str(raw_data["name"])
 
         if use_cache and name in _CACHE:
@@ -48,38 +140,7 @@ def load_overlays(overlays_dir: Path, use_cache: bool = True) -> Dict[str, Tuple
                 overlays[name] = (cached_dir, cached_mf, cached_hash)
                 continue
 
-        capabilities = raw_data.get("capabilities", [])
-        if not isinstance(capabilities, list) or not all(isinstance(x, str) for x in capabilities):
-            raise ValueError("manifest.capabilities must be a list[str]")
-
-        # NEW: op_policy (trusted allowlist + required caps)
-        op_policy = raw_data.get("op_policy", {})
-        if not isinstance(op_policy, dict):
-            raise ValueError("manifest.op_policy must be an object/dict")
-
-        # normalize: op -> list[str]
-        norm_op_policy: Dict[str, list[str]] = {}
-        for op, caps in op_policy.items():
-            if not isinstance(op, str):
-                raise ValueError("manifest.op_policy keys must be strings")
-            if not isinstance(caps, list) or not all(isinstance(c, str) for c in caps):
-                raise ValueError(f"manifest.op_policy['{op}'] must be list[str]")
-            norm_op_policy[op] = list(caps)
-
-        mf = OverlayManifest(
-            name=name,
-            version=str(raw_data.get("version", "unknown")),
-            status=str(raw_data.get("status", "unknown")),
-            phases=_as_phase_list(raw_data.get("phases", [])),
-            entrypoint=str(raw_data.get("entrypoint", "")).strip(),
-            capabilities=list(capabilities),
-            op_policy=norm_op_policy,
-            timeout_ms=int(raw_data.get("timeout_ms", 2500)),
-        )
-
-        if not mf.entrypoint:
-            raise ValueError(f"Missing entrypoint in manifest: {manifest_path}")
-
+        mf = _build_manifest(raw_data, manifest_path)
         _CACHE[name] = (overlay_dir, mf, manifest_hash)
         overlays[name] = (overlay_dir, mf, manifest_hash)
 
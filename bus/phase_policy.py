@@ -1,9 +1,17 @@
 from __future__ import annotations
+
 from pathlib import Path
 from typing import Any, Dict, List, Optional
+
 import yaml
 
-from .types import Phase
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+from .types import PHASE_INTERN, Phase
+
 
 class PolicyViolation(Exception):
     """Raised when a phase policy is violated"""
@@ -89,15 +97,15 @@ class PolicyRegistry:
         if not self.policy_file.exists():
             raise FileNotFoundError(f"Policy file not found: {self.policy_file}")
 
-        with self.policy_file.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = yaml.load(self.policy_file.read_bytes(), Loader=_SafeLoader)
 
-        for phase_name, config in data.items():
-            if phase_name not in ("OPEN", "ALIGN", "ASCEND", "CLEAR", "SEAL"):
+        for raw_phase, config in data.items():
+            phase_name = PHASE_INTERN.get(raw_phase) if isinstance(raw_phase, str) else None
+            if phase_name is None:
                 continue
 
             policy = PhasePolicy(
-                phase=phase_name,  # type: ignore
+                phase=phase_name,
                 description=config.get("description", ""),
                 allowed_capabilities=config.get("allowed_capabilities", []),
                 forbidden_capabilities=config.get("forbidden_capabilities", []),
@@ -110,7 +118,7 @@ class PolicyRegistry:
                 immutable=config.get("immutable", False),
                 notes=config.get("notes"),
             )
-            self.policies[phase_name] = policy  # type: ignore
+            self.policies[phase_name] = policy
 
     def get(self, phase: Phase) -> PhasePolicy:
         if phase not in self.policies:
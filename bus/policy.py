@@ -1,15 +1,19 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List
+import functools
+from typing import Dict, FrozenSet, Iterable, Tuple
 
 from .types import Phase
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PolicyDecision:
     """Result of a policy enforcement check."""
     ok: bool
     reason: str = ""
 
+# Immutable, so the success path can share a single instance.
+_OK = PolicyDecision(True, "Policy check passed")
+
 # Phase-based permission rules with granular capability enforcement
 PHASE_RULES = {
     "OPEN":   {"allow_external_io": True,  "allow_writes": True,  "allow_exec": False},
@@ -28,31 +32,48 @@ PHASE_REQUIREMENTS = {
     "SEAL": [],
 }
 
-def enforce_phase_policy(phase: Phase, overlay_caps: List[str]) -> PolicyDecision:
+# Requirements frozen once at import; tuples keep declaration order for messages.
+_REQUIRED: Dict[str, Tuple[str, ...]] = {p: tuple(r) for p, r in PHASE_REQUIREMENTS.items()}
+
+def enforce_phase_policy(phase: Phase, overlay_caps: Iterable[str]) -> PolicyDecision:
     """
     Enforce phase-based capability policy with granular permission checks.
 
     Args:
         phase: The phase being invoked
-        overlay_caps: List of capabilities declared by the overlay
+        overlay_caps: Capabilities declared by the overlay (list or frozenset)
 
     Returns:
         PolicyDecision indicating if the invocation is allowed
     """
+    caps: FrozenSet[str] = (
+        overlay_caps if isinstance(overlay_caps, frozenset) else frozenset(overlay_caps)
+    )
+    return _enforce_cached(phase, caps)
+
+@functools.lru_cache(maxsize=256)
+def _enforce_cached(phase: str, caps: FrozenSet[str]) -> PolicyDecision:
+    # Pure in (phase, caps) and PolicyDecision is frozen, so identical
+    # inputs can safely share one decision instance.
+    #
     # v0.6+ semantics:
     # Declared capabilities are permissions, not proof of use.
     # We therefore *do not* reject an overlay for merely declaring "exec"/"writes"/etc.
     # Instead, we only enforce phase-level required capabilities.
-    if phase == "ASCEND" and "exec" not in overlay_caps:
+    if phase == "ASCEND" and "exec" not in caps:
         return PolicyDecision(False, "ASCEND requires explicit 'exec' capability")
 
-    required = PHASE_REQUIREMENTS.get(phase, [])
-    missing = [cap for cap in required if cap not in overlay_caps]
+    required = _REQUIRED.get(phase)
+    if not required:
+        return _OK
 
+    missing = [cap for cap in required if cap not in caps]
     if missing:
         return PolicyDecision(
             False,
             f"Phase '{phase}' requires missing capabilities: {missing}"
         )
 
-    return PolicyDecision(True, "Policy check passed")
+    return _OK
+
+enforce_phase_policy.cache_clear = _enforce_cached.cache_clear  # type: ignore[attr-defined]
@@ -1,21 +1,486 @@
 from __future__ import annotations
 from pathlib import Path
+import atexit
+import gzip
+import io
 import json
-import hashlib
+import logging
+import mmap
+import os
+import queue
+import re
+import shutil
+import threading
 import time
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ._hash import digest_hex
+
+log = logging.getLogger(__name__)
+
+try:
+    import zstandard as _zstd
+except ImportError:  # optional; rotated segments fall back to gzip
+    _zstd = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX; rotation is then single-process only
+    fcntl = None  # type: ignore[assignment]
+
+_LOCK_SH, _LOCK_EX, _LOCK_UN = (
+    (fcntl.LOCK_SH, fcntl.LOCK_EX, fcntl.LOCK_UN) if fcntl is not None else (0, 0, 0)
+)
+
+# One shared encoder: json.dumps would rebuild a JSONEncoder from kwargs per call.
+_ENC = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
 def canonical_json(obj: Dict[str, Any]) -> str:
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return _ENC.encode(obj)
+
+def canonical_json_bytes(obj: Dict[str, Any]) -> bytes:
+    return canonical_json(obj).encode("utf-8")
+
+def hash_event_bytes(raw: bytes) -> str:
+    return digest_hex(raw)
 
 def hash_event(event: Dict[str, Any]) -> str:
-    raw = canonical_json(event).encode("utf-8")
-    return hashlib.sha256(raw).hexdigest()
+    return hash_event_bytes(canonical_json_bytes(event))
 
-def append_jsonl(log_path: Path, event: Dict[str, Any]) -> None:
+def append_jsonl_bytes(log_path: Path, raw: bytes) -> None:
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    with log_path.open("a", encoding="utf-8") as f:
-        f.write(canonical_json(event) + "\n")
+    with log_path.open("ab") as f:
+        f.write(raw + b"\n")
+
+def append_jsonl(log_path: Path, event: Dict[str, Any]) -> None:
+    append_jsonl_bytes(log_path, canonical_json_bytes(event))
+
+def append_and_hash(log_path: Path, event: Dict[str, Any]) -> str:
+    """Append `event` and return its hash, serializing it only once."""
+    raw = canonical_json_bytes(event)
+    append_jsonl_bytes(log_path, raw)
+    return hash_event_bytes(raw)
+
+_STOP = object()
+
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
+def _writev_all(fd: int, chunks: List[bytes]) -> None:
+    """Write `chunks` in order, IOV_MAX buffers per syscall, resuming short writes."""
+    if not hasattr(os, "writev"):
+        data = memoryview(b"".join(chunks))
+        while data:
+            data = data[os.write(fd, data):]
+        return
+    pending: List[Any] = [c for c in chunks if c]
+    i = 0
+    while i < len(pending):
+        n = os.writev(fd, pending[i:i + _IOV_MAX])
+        while n:
+            size = len(pending[i])
+            if n < size:
+                pending[i] = memoryview(pending[i])[n:]
+                break
+            n -= size
+            i += 1
+
+class BackgroundJsonlWriter:
+    """
+    Append-only JSONL writer that moves file I/O off the request path.
+
+    Producers serialize and enqueue (``append``); one daemon thread drains
+    the queue in batches of up to `batch_max` lines, writes each batch with a
+    single os.writev on an O_APPEND descriptor (no join into one buffer;
+    batches over IOV_MAX lines take several calls) and, when `sync_interval_s` is
+    set, fdatasyncs at most that often. ``flush`` blocks until everything
+    queued before it is written, for read-after-write callers. If the file is
+    removed or replaced, the next batch reopens `path`. ``close`` drains and
+    stops the thread; a later append starts it again.
+
+    A batch that fails to write is logged (``log.exception``) and counted in
+    ``stats()`` (`errors`, `dropped_lines`, `last_error`); the thread keeps
+    running and flush waiters are always released.
+
+    With `max_bytes`, a batch that would grow the file past it first rotates
+    the file to a ``<stem>.<ms>.jsonl`` segment (see rotate_segment), which is
+    compressed on a separate thread; read across segments with
+    tail_lines_rotated. Several processes may share `path`: each batch is
+    written under a shared flock on ``<path>.lock`` after re-checking the
+    inode, and rotation takes the lock exclusively, so no process writes to a
+    segment once it has been renamed (and later compressed and unlinked).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        batch_max: int = 256,
+        sync_interval_s: Optional[float] = 0.05,
+        max_bytes: Optional[int] = None,
+    ):
+        self.path = path
+        self.batch_max = batch_max
+        self.sync_interval_s = sync_interval_s
+        self.max_bytes = max_bytes
+        self._compressors: List[threading.Thread] = []
+        self.errors = 0
+        self.dropped_lines = 0
+        self.last_error: Optional[BaseException] = None
+        self._q: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._fd = -1
+        self._lock_fd = -1
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def append_line(self, line: bytes) -> None:
+        """Enqueue one serialized line (without trailing newline)."""
+        self._ensure_started()
+        self._q.put(line + b"\n")
+
+    def append_record(self, record: bytes) -> None:
+        """Enqueue one serialized line that already ends with a newline."""
+        self._ensure_started()
+        self._q.put(record)
+
+    def append(self, event: Dict[str, Any]) -> None:
+        self.append_line(canonical_json_bytes(event))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until everything queued before this call has been handled.
+
+        Returns False if `timeout` (seconds) elapsed first.
+        """
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return True
+        done = threading.Event()
+        self._q.put(done)
+        return done.wait(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """Writer health: thread liveness and failure counters."""
+        thread = self._thread
+        return {
+            "alive": thread is not None and thread.is_alive(),
+            "errors": self.errors,
+            "dropped_lines": self.dropped_lines,
+            "last_error": repr(self.last_error) if self.last_error is not None else None,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self._q.put(_STOP)
+        thread.join()
+        for compressor in self._compressors:
+            compressor.join()
+        self._compressors.clear()
+        atexit.unregister(self.close)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"jsonl-writer:{self.path.name}", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _open(self) -> None:
+        if self._fd >= 0:
+            try:
+                st, fst = os.stat(self.path), os.fstat(self._fd)
+                if (st.st_dev, st.st_ino) == (fst.st_dev, fst.st_ino):
+                    return
+            except FileNotFoundError:
+                pass
+            os.close(self._fd)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(str(self.path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def _flock(self, op: int) -> None:
+        if fcntl is None:
+            return
+        if self._lock_fd < 0:
+            lock_path = self.path.with_name(self.path.name + ".lock")
+            self._lock_fd = os.open(str(lock_path), os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o644)
+        fcntl.flock(self._lock_fd, op)
+
+    def _over_limit(self, incoming: int) -> bool:
+        size = os.fstat(self._fd).st_size
+        return bool(size) and size + incoming > self.max_bytes  # type: ignore[operator]
+
+    def _write(self, chunks: List[bytes]) -> None:
+        if self.max_bytes is None:
+            self._open()
+            _writev_all(self._fd, chunks)
+            return
+
+        incoming = sum(map(len, chunks))
+        # Shared lock for the write; rotation (in any process) needs it
+        # exclusively. _open re-checks the inode under the lock, so the fd
+        # can't point at a segment another process already rotated away.
+        self._flock(_LOCK_SH)
+        try:
+            self._open()
+            if self._over_limit(incoming):
+                # Not atomic (flock drops SH before taking EX): re-check both
+                # the inode and the size, another process may have rotated.
+                self._flock(_LOCK_EX)
+                self._open()
+                if self._over_limit(incoming):
+                    self._rotate()
+            _writev_all(self._fd, chunks)
+        finally:
+            self._flock(_LOCK_UN)
+
+    def _rotate(self) -> None:
+        self._sync()
+        os.close(self._fd)
+        self._fd = -1
+        segment = rotate_segment(self.path)
+        if segment is not None:
+            compressor = threading.Thread(
+                target=compress_segment, args=(segment,), name=f"jsonl-compress:{segment.name}"
+            )
+            compressor.start()
+            self._compressors = [t for t in self._compressors if t.is_alive()] + [compressor]
+        self._open()
+
+    def _record_failure(self, exc: BaseException, lines: int) -> None:
+        self.errors += 1
+        self.dropped_lines += lines
+        self.last_error = exc
+        if lines:
+            log.exception("writing %d line(s) to %s failed; dropped", lines, self.path)
+        else:
+            log.exception("syncing %s failed", self.path)
+
+    def _sync(self) -> None:
+        if self._fd < 0:
+            return
+        if hasattr(os, "fdatasync"):
+            os.fdatasync(self._fd)
+        else:
+            os.fsync(self._fd)
+
+    def _run(self) -> None:
+        q = self._q
+        dirty = False
+        last_sync = time.monotonic()
+        while True:
+            try:
+                if dirty and self.sync_interval_s is not None:
+                    wait = last_sync + self.sync_interval_s - time.monotonic()
+                    item = q.get(timeout=max(0.0, wait))
+                else:
+                    item = q.get()
+            except queue.Empty:
+                item = None
+
+            batch: List[bytes] = []
+            waiters: List[threading.Event] = []
+            stop = False
+            while item is not None:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if len(batch) >= self.batch_max:
+                    break
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    item = None
+
+            try:
+                if batch:
+                    try:
+                        self._write(batch)
+                        dirty = True
+                    except Exception as e:
+                        self._record_failure(e, len(batch))
+                if dirty and self.sync_interval_s is not None and (
+                    stop or time.monotonic() - last_sync >= self.sync_interval_s
+                ):
+                    dirty = False
+                    last_sync = time.monotonic()
+                    try:
+                        self._sync()
+                    except Exception as e:
+                        self._record_failure(e, 0)
+            finally:
+                for done in waiters:
+                    done.set()
+            if stop:
+                if self._fd >= 0:
+                    os.close(self._fd)
+                    self._fd = -1
+                if self._lock_fd >= 0:
+                    os.close(self._lock_fd)
+                    self._lock_fd = -1
+                return
 
 def now_unix_ms() -> int:
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
+
+def tail_lines(log_path: Path, limit: int) -> List[bytes]:
+    """
+    Last `limit` lines of a file, as ``readlines()[-limit:]`` would return
+    them (bytes, newlines kept), for limit >= 1.
+
+    Scans backward from EOF over an mmap, so cost is proportional to the
+    bytes returned rather than the size of the log.
+    """
+    with log_path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0 or limit < 1:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            stop = size
+            # A trailing newline terminates the last line; it doesn't start one.
+            search_end = size - 1 if mm[size - 1] == 0x0A else size
+            lines: List[bytes] = []
+            while len(lines) < limit:
+                nl = mm.rfind(b"\n", 0, search_end)
+                lines.append(mm[nl + 1:stop])
+                if nl < 0:
+                    break
+                stop, search_end = nl + 1, nl
+    lines.reverse()
+    return lines
+
+def _segment_re(log_path: Path) -> "re.Pattern[str]":
+    return re.compile(
+        rf"^{re.escape(log_path.stem)}\.(\d+)(?:-(\d+))?{re.escape(log_path.suffix)}(\.zst|\.gz)?$"
+    )
+
+def _event_ms(line: bytes) -> Optional[int]:
+    try:
+        value = json.loads(line).get("timestamp_ms")
+    except (ValueError, AttributeError):
+        return None
+    return value if isinstance(value, int) else None
+
+def rotate_segment(log_path: Path) -> Optional[Path]:
+    """
+    Move `log_path` aside as ``<stem>.<now_ms>[-n]<suffix>`` and append its
+    bounds (first/last event ``timestamp_ms``, byte size) to
+    ``<stem>.index.jsonl``. Returns the segment path (None if no file).
+    """
+    rotated_ms = now_unix_ms()
+    n = 0
+    while True:
+        tag = f"{rotated_ms}-{n}" if n else str(rotated_ms)
+        segment = log_path.with_name(f"{log_path.stem}.{tag}{log_path.suffix}")
+        if not any(segment.with_name(segment.name + ext).exists() for ext in ("", ".zst", ".gz")):
+            break
+        n += 1
+    try:
+        os.rename(log_path, segment)
+    except FileNotFoundError:
+        return None
+
+    with segment.open("rb") as f:
+        first = f.readline()
+    last = tail_lines(segment, 1)
+    append_jsonl(log_path.with_name(f"{log_path.stem}.index.jsonl"), {
+        "segment": segment.name,
+        "start_ms": _event_ms(first) if first else None,
+        "end_ms": _event_ms(last[0]) if last else None,
+        "bytes": segment.stat().st_size,
+        "rotated_ms": rotated_ms,
+    })
+    return segment
+
+def compress_segment(segment: Path) -> Path:
+    """
+    Compress a rotated segment to ``.zst`` (zstandard, level 3) or, without
+    the optional zstandard package, ``.gz``; the source is removed once the
+    compressed file is complete.
+    """
+    if _zstd is not None:
+        dst = segment.with_name(segment.name + ".zst")
+        tmp = dst.with_name(dst.name + ".tmp")
+        with segment.open("rb") as src, tmp.open("wb") as out:
+            _zstd.ZstdCompressor(level=3).copy_stream(src, out)
+    else:
+        dst = segment.with_name(segment.name + ".gz")
+        tmp = dst.with_name(dst.name + ".tmp")
+        with segment.open("rb") as src, gzip.open(tmp, "wb", compresslevel=6) as out:
+            shutil.copyfileobj(src, out, 1 << 20)
+    os.replace(tmp, dst)
+    segment.unlink()
+    return dst
+
+def list_segments(log_path: Path) -> List[Path]:
+    """Rotated segments of `log_path`, oldest first (raw copy wins over compressed)."""
+    pattern = _segment_re(log_path)
+    found: Dict[Tuple[int, int], Tuple[int, Path]] = {}
+    if not log_path.parent.exists():
+        return []
+    for entry in log_path.parent.iterdir():
+        m = pattern.match(entry.name)
+        if m is None:
+            continue
+        key = (int(m.group(1)), int(m.group(2) or 0))
+        rank = 0 if m.group(3) is None else 1
+        if key not in found or rank < found[key][0]:
+            found[key] = (rank, entry)
+    return [found[key][1] for key in sorted(found)]
+
+def read_segment_lines(segment: Path) -> List[bytes]:
+    """All lines of a (possibly compressed) segment, newlines kept."""
+    if segment.name.endswith(".zst"):
+        if _zstd is None:
+            raise RuntimeError(f"reading {segment.name} requires the zstandard package")
+        with segment.open("rb") as f, _zstd.ZstdDecompressor().stream_reader(f) as r:
+            return io.BufferedReader(r).readlines()
+    opener = gzip.open if segment.name.endswith(".gz") else open
+    with opener(segment, "rb") as f:
+        return f.readlines()
+
+def _compressed_sibling_lines(segment: Path) -> List[bytes]:
+    for ext in (".zst", ".gz"):
+        sibling = segment.with_name(segment.name + ext)
+        if sibling.exists():
+            return read_segment_lines(sibling)
+    raise FileNotFoundError(f"segment {segment.name} vanished without a compressed copy")
+
+def tail_lines_rotated(log_path: Path, limit: int) -> List[bytes]:
+    """
+    Like tail_lines, continuing into rotated segments (newest first) when the
+    live file holds fewer than `limit` lines.
+    """
+    try:
+        lines = tail_lines(log_path, limit)
+    except FileNotFoundError:  # not written yet, or renamed by a rotation just now
+        lines = []
+    if limit < 1:
+        return lines
+    for segment in reversed(list_segments(log_path)):
+        need = limit - len(lines)
+        if need <= 0:
+            break
+        if segment.suffix == log_path.suffix:
+            try:
+                older = tail_lines(segment, need)
+            except FileNotFoundError:
+                # compress_segment unlinked it after we listed it; the
+                # compressed copy is complete before the raw file goes.
+                older = _compressed_sibling_lines(segment)[-need:]
+        else:
+            older = read_segment_lines(segment)[-need:]
+        lines = older + lines
+    return lines
@@ -2,21 +2,63 @@ from __future__ import annotations
 from pathlib import Path
 import os
 import shlex
+import shutil
 import subprocess
 import time
-import json
-from typing import Any, Dict, Optional
+import functools
+from typing import Any, Dict, Optional, Tuple
 
 from .types import OverlayManifest, Phase, InvocationResult
-from .provenance import hash_event
+from ._json import loads as _json_loads
+from .provenance import _ENC as _CANONICAL_ENCODER, hash_event_bytes
+
+_ENC = _CANONICAL_ENCODER.encode
+
+_ENV_KEEP = ("PATH", "PYTHONPATH")
+_ENV_CACHE: Optional[Dict[str, str]] = None
+_ENV_SIG: Optional[tuple] = None
 
 def _clean_env() -> dict[str, str]:
     # Minimal environment — deterministic-ish, avoids inheriting noisy vars.
-    keep = ["PATH", "PYTHONPATH"]
-    env = {k: v for k, v in os.environ.items() if k in keep}
-    env["PYTHONUNBUFFERED"] = "1"
-    env["AAL_SANDBOX"] = "1"
-    return env
+    # Rebuilt only when one of the inherited vars changes; callers get a copy.
+    global _ENV_CACHE, _ENV_SIG
+    sig = tuple(os.environ.get(k) for k in _ENV_KEEP)
+    if _ENV_CACHE is None or sig != _ENV_SIG:
+        env = {k: v for k, v in zip(_ENV_KEEP, sig) if v is not None}
+        env["PYTHONUNBUFFERED"] = "1"
+        env["PYTHONIOENCODING"] = "utf-8"
+        env["AAL_SANDBOX"] = "1"
+        _ENV_CACHE, _ENV_SIG = env, sig
+    return _ENV_CACHE.copy()
+
+def _as_text(out: Any) -> str:
+    if not out:
+        return ""
+    if isinstance(out, bytes):
+        return out.decode("utf-8", errors="replace")
+    return out
+
+@functools.lru_cache(maxsize=256)
+def _argv(entrypoint: str, path: Optional[str]) -> Tuple[str, ...]:
+    # Split once per entrypoint and resolve a bare program against PATH, so
+    # the child execs an absolute path (no per-spawn PATH search).
+    cmd = shlex.split(entrypoint)
+    if cmd and os.sep not in cmd[0]:
+        cmd[0] = shutil.which(cmd[0], path=path) or cmd[0]
+    return tuple(cmd)
+
+@functools.lru_cache(maxsize=256)
+def _envelope_parts(
+    name: str, version: str, entrypoint: str, manifest_hash: str
+) -> Tuple[str, str, str]:
+    """Pre-encoded static parts of the stdin / provenance envelopes for one manifest."""
+    stdin_head = f'{{"overlay":{_ENC(name)},"payload":'
+    prov_head = (
+        f'{{"entrypoint":{_ENC(entrypoint)},"manifest_hash":{_ENC(manifest_hash)},'
+        f'"overlay":{_ENC(name)},"payload":'
+    )
+    tail = f',"version":{_ENC(version)}}}'
+    return stdin_head, prov_head, tail
 
 def run_overlay(
     overlay_dir: Path,
@@ -29,55 +71,52 @@ def run_overlay(
     policy_checked: bool = False,
 ) -> InvocationResult:
     start = time.time()
-    cmd = shlex.split(manifest.entrypoint)
+    env = _clean_env()
+    cmd = list(_argv(manifest.entrypoint, env.get("PATH")))
 
-    # Provide input via stdin as canonical JSON
-    stdin_obj = {
-        "overlay": manifest.name,
-        "version": manifest.version,
-        "phase": phase,
-        "request_id": request_id,
-        "timestamp_ms": timestamp_ms,
-        "payload": payload,
-    }
-    stdin_str = json.dumps(stdin_obj, sort_keys=True)
+    # Provide input via stdin as canonical JSON. stdin and the provenance
+    # event share the payload and per-call fields, so those are encoded once
+    # and spliced between per-manifest pre-encoded heads/tails. Keys are laid
+    # out in sorted order, making the result identical to canonical_json() of
+    # the equivalent dicts.
+    stdin_head, prov_head, tail = _envelope_parts(
+        manifest.name, manifest.version, manifest.entrypoint, manifest_hash
+    )
+    body = (
+        f'{_ENC(payload)},"phase":{_ENC(phase)},"request_id":{_ENC(request_id)},'
+        f'"timestamp_ms":{_ENC(timestamp_ms)}'
+    )
+    stdin_str = stdin_head + body + tail
 
     # Provenance hash includes what we *intend* to execute + inputs
-    prov_event = {
-        "overlay": manifest.name,
-        "version": manifest.version,
-        "manifest_hash": manifest_hash,
-        "phase": phase,
-        "entrypoint": manifest.entrypoint,
-        "request_id": request_id,
-        "timestamp_ms": timestamp_ms,
-        "payload": payload,
-    }
-    prov_hash = hash_event(prov_event)
+    prov_hash = hash_event_bytes((prov_head + body + tail).encode("utf-8"))
 
     try:
         p = subprocess.run(
             cmd,
-            input=stdin_str.encode("utf-8"),
+            input=stdin_str,
             cwd=str(overlay_dir),
-            env=_clean_env(),
+            env=env,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             timeout=max(0.1, manifest.timeout_ms / 1000.0),
             check=False,
+            encoding="utf-8",
+            errors="replace",
         )
         duration_ms = int((time.time() - start) * 1000)
-        stdout = p.stdout.decode("utf-8", errors="replace")
-        stderr = p.stderr.decode("utf-8", errors="replace")
+        stdout = p.stdout
+        stderr = p.stderr
 
-        # Optional: if stdout is JSON, parse it
+        # Optional: if stdout is a JSON object, parse it. The parser rejects
+        # non-JSON quickly, so no strip/startswith pre-scan is needed.
         out_json: Optional[Dict[str, Any]] = None
-        s = stdout.strip()
-        if s.startswith("{") and s.endswith("}"):
-            try:
-                out_json = json.loads(s)
-            except Exception:
-                out_json = None
+        try:
+            parsed = _json_loads(stdout)
+        except Exception:
+            parsed = None
+        if isinstance(parsed, dict):
+            out_json = parsed
 
         return InvocationResult(
             ok=(p.returncode == 0),
@@ -98,7 +137,8 @@ def run_overlay(
             ok=False,
             overlay=manifest.name,
             phase=phase,
-            stdout=(e.stdout.decode("utf-8", errors="replace") if e.stdout else ""),
+            # TimeoutExpired carries raw bytes even in text mode.
+            stdout=_as_text(e.stdout),
             stderr="TIMEOUT",
             exit_code=124,
             duration_ms=duration_ms,
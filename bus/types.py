@@ -1,10 +1,20 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional
+import sys
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 Phase = Literal["OPEN", "ALIGN", "ASCEND", "CLEAR", "SEAL"]
 
-@dataclass(frozen=True)
+PHASES: Tuple[Phase, ...] = ("OPEN", "ALIGN", "ASCEND", "CLEAR", "SEAL")
+
+# str -> canonical interned phase object. Loaders map parsed strings through
+# this so phase comparisons/dict lookups downstream hit the identity fast path.
+PHASE_INTERN: Dict[str, Phase] = {p: sys.intern(p) for p in PHASES}  # type: ignore[misc]
+
+def _intern(s: Any) -> Any:
+    return sys.intern(s) if type(s) is str else s
+
+@dataclass(frozen=True, slots=True)
 class OverlayManifest:
     name: str
     version: str
@@ -15,7 +25,15 @@ class OverlayManifest:
     op_policy: Dict[str, List[str]]  # NEW: op -> required capabilities
     timeout_ms: int = 2500
 
-@dataclass(frozen=True)
+    def __post_init__(self) -> None:
+        # Identity strings recur in every policy check / invocation event;
+        # intern them once at load so comparisons and dict probes are cheap.
+        object.__setattr__(self, "name", _intern(self.name))
+        object.__setattr__(self, "version", _intern(self.version))
+        object.__setattr__(self, "phases", [PHASE_INTERN.get(p, p) for p in self.phases])
+        object.__setattr__(self, "capabilities", [_intern(c) for c in self.capabilities])
+
+@dataclass(frozen=True, slots=True)
 class InvocationResult:
     ok: bool
     overlay: str
@@ -26,3 +44,4 @@ class InvocationResult:
     duration_ms: int
     provenance_hash: str
     output_json: Optional[Dict[str, Any]] = None
+    policy_checked: bool = False
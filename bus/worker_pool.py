@@ -0,0 +1,301 @@
+"""
+Persistent overlay workers.
+
+Overlays that declare a ``worker_entrypoint`` in their manifest are started
+once and kept alive, so repeated invocations skip interpreter startup and
+imports. The worker speaks a length-prefixed JSON protocol on stdin/stdout:
+
+    request:  b"<len>\\n" + <len bytes of UTF-8 JSON object>
+    response: b"<len>\\n" + <len bytes of UTF-8 JSON object>
+
+one response per request, in order. Overlays written in Python can call
+``serve(handler)``. A worker that times out, exits, or answers with a
+malformed frame is killed and respawned on the next call; the failing
+request is reported to the caller, never retried.
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import select
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .sandbox import _clean_env
+
+_ENC = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+# Frame headers are short decimal lengths; anything longer is a broken stream.
+_MAX_HEADER = 32
+
+
+class WorkerError(RuntimeError):
+    """Worker died or produced a malformed response frame."""
+
+
+class OverlayWorker:
+    """One long-lived overlay process; calls are serialized by a lock."""
+
+    def __init__(self, cmd: Sequence[str], cwd: Path, env: Optional[Dict[str, str]] = None):
+        self.cmd = list(cmd)
+        self.cwd = Path(cwd)
+        self.env = env
+        self.lock = threading.Lock()
+        # Dispatch bookkeeping, maintained by OverlayWorkerPool under its lock.
+        self.inflight = 0
+        self.hits = 0
+        self.misses = 0
+        self._proc: Optional[subprocess.Popen] = None
+        self._buf = bytearray()
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def _start(self) -> subprocess.Popen:
+        self._buf.clear()
+        self._proc = subprocess.Popen(
+            self.cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=str(self.cwd),
+            env=self.env,
+            bufsize=0,
+        )
+        # Writes wait in select() so they share the call's deadline
+        os.set_blocking(self._proc.stdin.fileno(), False)
+        return self._proc
+
+    def kill(self) -> None:
+        proc, self._proc = self._proc, None
+        self._buf.clear()
+        if proc is None:
+            return
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        for stream in (proc.stdin, proc.stdout):
+            if stream is not None:
+                stream.close()
+
+    def _write_all(self, fd: int, data: bytes, deadline: float) -> None:
+        # A worker that stops reading stdin would block a plain write forever
+        view = memoryview(data)
+        while view:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([], [fd], [], remaining)[1]:
+                raise subprocess.TimeoutExpired(self.cmd, max(0.0, remaining))
+            try:
+                view = view[os.write(fd, view):]
+            except BlockingIOError:
+                continue
+
+    def _fill(self, fd: int, deadline: float) -> None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+            raise subprocess.TimeoutExpired(self.cmd, max(0.0, remaining))
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            raise WorkerError("worker closed stdout")
+        self._buf += chunk
+
+    def _read_frame(self, fd: int, deadline: float) -> bytes:
+        while True:
+            nl = self._buf.find(b"\n")
+            if nl >= 0:
+                break
+            if len(self._buf) > _MAX_HEADER:
+                raise WorkerError("malformed frame header")
+            self._fill(fd, deadline)
+        header = bytes(self._buf[:nl])
+        if not header.isdigit():
+            raise WorkerError(f"malformed frame header: {header[:_MAX_HEADER]!r}")
+        size = int(header)
+        end = nl + 1 + size
+        while len(self._buf) < end:
+            self._fill(fd, deadline)
+        frame = bytes(self._buf[nl + 1:end])
+        del self._buf[:end]
+        return frame
+
+    def call(self, request: Dict[str, Any], timeout_s: float) -> Dict[str, Any]:
+        """Send one request and wait up to `timeout_s` for its response."""
+        return self.call_raw(_ENC.encode(request).encode("utf-8"), timeout_s)
+
+    def call_raw(self, data: bytes, timeout_s: float) -> Dict[str, Any]:
+        """Like call(), for a request that is already UTF-8 JSON bytes."""
+        with self.lock:
+            proc = self._proc if self.alive else self._start()
+            deadline = time.monotonic() + timeout_s
+            try:
+                self._write_all(proc.stdin.fileno(), b"%d\n" % len(data) + data, deadline)
+                frame = self._read_frame(proc.stdout.fileno(), deadline)
+                response = json.loads(frame)
+            except subprocess.TimeoutExpired:
+                self.kill()
+                raise
+            except (OSError, ValueError, WorkerError) as e:
+                self.kill()
+                if isinstance(e, WorkerError):
+                    raise
+                raise WorkerError(f"{type(e).__name__}: {e}") from e
+            if not isinstance(response, dict):
+                self.kill()
+                raise WorkerError("worker response must be a JSON object")
+            return response
+
+
+class OverlayWorkerPool:
+    """
+    Up to `size` workers per overlay, spawned lazily.
+
+    Requests that carry a dispatch key (see dispatch_key) are routed to the
+    worker that last served that key while it has fewer than
+    `affinity_max_inflight` requests in flight, so overlay-side warm state
+    gets reused; otherwise the least-loaded worker is used (growing the pool
+    first if every worker is busy) and becomes the key's new home. The
+    key -> worker map is an LRU of `affinity_size` entries.
+
+    A worker whose command or directory no longer matches the manifest is
+    replaced, so edited manifests take effect on the next call. Workers get
+    the same minimal environment as one-shot sandbox runs.
+    """
+
+    def __init__(self, size: int = 1, affinity_size: int = 4096, affinity_max_inflight: int = 2):
+        self.size = max(1, size)
+        self.affinity_size = affinity_size
+        self.affinity_max_inflight = affinity_max_inflight
+        self._workers: Dict[str, Tuple[Tuple[Tuple[str, ...], str], List[OverlayWorker]]] = {}
+        self._affinity: "OrderedDict[Tuple[str, str], OverlayWorker]" = OrderedDict()
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def _pick(
+        self, name: str, cmd: Sequence[str], cwd: Path, key: Optional[str], reserve: bool
+    ) -> OverlayWorker:
+        sig = (tuple(cmd), str(cwd))
+        stale: List[OverlayWorker] = []
+        with self._lock:
+            entry = self._workers.get(name)
+            if entry is None or entry[0] != sig:
+                if entry is not None:
+                    stale = entry[1]
+                entry = self._workers[name] = (sig, [])
+            workers = entry[1]
+
+            worker: Optional[OverlayWorker] = None
+            if key is not None:
+                home = self._affinity.get((name, key))
+                if (
+                    home is not None
+                    and home in workers
+                    and home.inflight < self.affinity_max_inflight
+                ):
+                    self._affinity.move_to_end((name, key))
+                    home.hits += 1
+                    worker = home
+            if worker is None:
+                worker = min(workers, key=_load, default=None)
+                if worker is None or (_load(worker) > 0 and len(workers) < self.size):
+                    worker = OverlayWorker(cmd, cwd, _clean_env())
+                    workers.append(worker)
+                if key is not None:
+                    worker.misses += 1
+                    self._affinity[(name, key)] = worker
+                    self._affinity.move_to_end((name, key))
+                    if len(self._affinity) > self.affinity_size:
+                        self._affinity.popitem(last=False)
+            if reserve:
+                worker.inflight += 1
+        for old in stale:
+            with old.lock:
+                old.kill()
+        return worker
+
+    def get(self, name: str, cmd: Sequence[str], cwd: Path) -> OverlayWorker:
+        """Least-loaded worker for `name` (spawning one if all are busy)."""
+        return self._pick(name, cmd, cwd, None, reserve=False)
+
+    def call_raw(
+        self,
+        name: str,
+        cmd: Sequence[str],
+        cwd: Path,
+        data: bytes,
+        timeout_s: float,
+        key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Dispatch one encoded request (with optional affinity `key`)."""
+        worker = self._pick(name, cmd, cwd, key, reserve=True)
+        try:
+            return worker.call_raw(data, timeout_s)
+        finally:
+            with self._lock:
+                worker.inflight -= 1
+
+    def stats(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Per-overlay worker metrics: pid, inflight, affinity hits/misses."""
+        with self._lock:
+            return {
+                name: [
+                    {
+                        "worker": i,
+                        "pid": w._proc.pid if w.alive else None,
+                        "inflight": w.inflight,
+                        "hits": w.hits,
+                        "misses": w.misses,
+                    }
+                    for i, w in enumerate(workers)
+                ]
+                for name, (_, workers) in sorted(self._workers.items())
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            entries = list(self._workers.values())
+            self._workers.clear()
+            self._affinity.clear()
+        for _, workers in entries:
+            for worker in workers:
+                with worker.lock:
+                    worker.kill()
+
+
+def _load(worker: OverlayWorker) -> int:
+    # Reserved dispatches plus an unreserved caller holding the lock.
+    return worker.inflight + (1 if worker.lock.locked() and not worker.inflight else 0)
+
+
+def dispatch_key(
+    payload: Dict[str, Any], fields: Sequence[str] = ("cache_key", "op", "simulation_type")
+) -> Optional[str]:
+    """
+    Affinity key for a request payload: the canonical JSON of whichever of
+    `fields` it carries, or None when it has none (pure load balancing).
+    """
+    picked = {f: payload[f] for f in fields if f in payload}
+    if not picked:
+        return None
+    return json.dumps(
+        picked, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+
+
+def serve(handler: Callable[[Dict[str, Any]], Dict[str, Any]]) -> None:
+    """Worker-side loop: answer framed requests on stdin until EOF."""
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+    while True:
+        header = stdin.readline()
+        if not header:
+            return
+        request = json.loads(stdin.read(int(header)))
+        data = _ENC.encode(handler(request)).encode("utf-8")
+        stdout.write(b"%d\n" % len(data) + data)
+        stdout.flush()
@@ -39,7 +39,7 @@ from .types import (
 )
 from .context_keys import build_context_key, hash_key
 from .reset import new_game_state
-from .modifiers import select_modifiers, apply_modifiers
+from .modifiers import select_modifiers, apply_modifiers, build_index, CatalogIndex
 from .guards import assert_no_leakage, FORBIDDEN_STATE_KEYS
 from .provenance import fingerprint_inputs, make_provenance
 from .backtest import evaluate_mae, backtest_modifier_effect
@@ -60,6 +60,8 @@ __all__ = [
     # Modifiers
     "select_modifiers",
     "apply_modifiers",
+    "build_index",
+    "CatalogIndex",
     # Guards
     "assert_no_leakage",
     "FORBIDDEN_STATE_KEYS",
@@ -1,7 +1,9 @@
 """
 Backtesting harness for rolling-window validation of modifiers.
 """
-from typing import List, Dict, Any, Callable
+from array import array
+from operator import sub
+from typing import List, Dict, Any, Callable, Iterable, Sized, Tuple
 
 
 def evaluate_mae(preds: List[float], actuals: List[float]) -> float:
@@ -24,20 +26,46 @@ def evaluate_mae(preds: List[float], actuals: List[float]) -> float:
     if len(preds) == 0:
         raise ValueError("Cannot compute MAE on empty lists")
 
-    errors = [abs(pred - actual) for pred, actual in zip(preds, actuals)]
-    return sum(errors) / len(errors)
+    # C-level map/sum pipeline: no per-element bytecode or intermediate list,
+    # and the same left-to-right summation (bit-identical result) as before.
+    return sum(map(abs, map(sub, preds, actuals))) / len(preds)
+
+
+def _row_errors(
+    row: Dict[str, Any],
+    base_predict_fn: Callable[[Dict[str, Any]], float],
+    modifier_apply_fn: Callable[[Dict[str, Any]], float]
+) -> Tuple[float, float]:
+    """Absolute errors (before, after modifiers) for one backtest row."""
+    # Get predictions
+    base_pred = float(base_predict_fn(row))
+    modified_pred = float(modifier_apply_fn(row))
+
+    # Get actual outcome (support both single value and list)
+    actual = row.get("actual") or row.get("actuals")
+    if isinstance(actual, list):
+        actual = actual[0] if actual else 0.0
+    actual = float(actual)
+
+    return abs(base_pred - actual), abs(modified_pred - actual)
 
 
 def backtest_modifier_effect(
-    rows: List[Dict[str, Any]],
+    rows: Iterable[Dict[str, Any]],
     base_predict_fn: Callable[[Dict[str, Any]], float],
     modifier_apply_fn: Callable[[Dict[str, Any]], float]
 ) -> Dict[str, Any]:
     """
     Evaluate the impact of modifiers on prediction accuracy.
 
+    Rows are consumed in a single pass and never materialized, so `rows` may
+    be any iterable, including a generator over a large backtest. Only the
+    per-row absolute errors are kept (two float64 buffers, presized when
+    `rows` has a length), and they are summed with sum() exactly as
+    evaluate_mae does, so the MAEs match evaluate_mae on every Python version.
+
     Args:
-        rows: List of game records, each containing:
+        rows: Iterable of game records, each containing:
             - "ctx": GameContext or dict
             - "base_lines": list of MarketLine or dicts
             - "actuals": list of actual outcomes
@@ -51,7 +79,23 @@ def backtest_modifier_effect(
             - "delta": Improvement (negative = better)
             - "n": Number of games evaluated
     """
-    if not rows:
+    if isinstance(rows, Sized):
+        # Preallocate and fill by index.
+        n = len(rows)
+        errs_before = array("d", bytes(8 * n))
+        errs_after = array("d", bytes(8 * n))
+        for i, row in enumerate(rows):
+            errs_before[i], errs_after[i] = _row_errors(row, base_predict_fn, modifier_apply_fn)
+    else:
+        errs_before = array("d")
+        errs_after = array("d")
+        for row in rows:
+            before, after = _row_errors(row, base_predict_fn, modifier_apply_fn)
+            errs_before.append(before)
+            errs_after.append(after)
+        n = len(errs_before)
+
+    if n == 0:
         return {
             "mae_before": 0.0,
             "mae_after": 0.0,
@@ -59,32 +103,14 @@ def backtest_modifier_effect(
             "n": 0
         }
 
-    base_preds = []
-    modified_preds = []
-    actuals = []
-
-    for row in rows:
-        # Get predictions
-        base_pred = base_predict_fn(row)
-        modified_pred = modifier_apply_fn(row)
-
-        # Get actual outcome (support both single value and list)
-        actual = row.get("actual") or row.get("actuals")
-        if isinstance(actual, list):
-            actual = actual[0] if actual else 0.0
-
-        base_preds.append(base_pred)
-        modified_preds.append(modified_pred)
-        actuals.append(float(actual))
-
     # Compute MAE for both approaches
-    mae_before = evaluate_mae(base_preds, actuals)
-    mae_after = evaluate_mae(modified_preds, actuals)
+    mae_before = sum(errs_before) / n
+    mae_after = sum(errs_after) / n
     delta = mae_after - mae_before
 
     return {
         "mae_before": round(mae_before, 4),
         "mae_after": round(mae_after, 4),
         "delta": round(delta, 4),
-        "n": len(rows)
+        "n": n
     }
@@ -2,11 +2,16 @@
 Context key building and deterministic hashing.
 """
 import json
-import hashlib
 from typing import Dict, Any
+
+from bus._hash import digest_hex
 from .types import GameContext
 
 
+# Shared canonical encoder (avoids constructing a JSONEncoder per json.dumps call).
+_ENC = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
 def build_context_key(ctx: GameContext) -> Dict[str, Any]:
     """
     Build a stable dictionary representation of the game context.
@@ -40,7 +45,7 @@ def build_context_key(ctx: GameContext) -> Dict[str, Any]:
 
 def hash_key(key: Dict[str, Any]) -> str:
     """
-    Compute deterministic SHA256 hash of a context key.
+    Compute deterministic hash of a context key (SHA256 unless AAL_HASH overrides).
 
     Args:
         key: Dictionary to hash
@@ -49,5 +54,5 @@ def hash_key(key: Dict[str, Any]) -> str:
         Hex digest string (64 characters)
     """
     # Ensure stable ordering and formatting
-    canonical = json.dumps(key, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    canonical = _ENC.encode(key)
+    return digest_hex(canonical.encode("utf-8"))
@@ -5,7 +5,7 @@ from .types import GameState
 
 
 # Forbidden keys that indicate cross-game leakage
-FORBIDDEN_STATE_KEYS = {
+FORBIDDEN_STATE_KEYS = frozenset({
     "prior_game_tempo",
     "prior_volatility",
     "last_opponent_profile",
@@ -14,7 +14,7 @@ FORBIDDEN_STATE_KEYS = {
     "previous_outcome",
     "historical_variance",
     "accumulated_stats",
-}
+})
 
 
 def assert_no_leakage(state: GameState, game_id: str) -> None:
@@ -39,9 +39,10 @@ def assert_no_leakage(state: GameState, game_id: str) -> None:
             f"does not match expected '{game_id}'"
         )
 
-    # Check for forbidden state keys
-    state_keys = set(state.internal_state.keys())
-    forbidden_found = state_keys & FORBIDDEN_STATE_KEYS
+    # Check for forbidden state keys (probe the small forbidden set against
+    # internal_state rather than copying internal_state's keys into a set)
+    internal_state = state.internal_state
+    forbidden_found = [k for k in FORBIDDEN_STATE_KEYS if k in internal_state]
 
     if forbidden_found:
         raise ValueError(
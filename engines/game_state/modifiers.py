@@ -1,26 +1,70 @@
 """
 Keyed modifier selection and deterministic application.
 """
-from typing import List
+import threading
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Dict, List, Tuple, Union
+
 from .types import GameContext, MarketLine, Modifier
 
 
-def select_modifiers(ctx: GameContext, catalog: List[Modifier]) -> List[Modifier]:
+class CatalogIndex:
     """
-    Select modifiers that match the current game context.
-
-    A modifier is selected if its key_value matches the corresponding
-    field in the GameContext.
+    Modifier catalog bucketed by (key, key_value).
 
-    Args:
-        ctx: GameContext instance
-        catalog: Full list of available modifiers
+    Selection probes one bucket per context field instead of scanning the
+    catalog; catalog positions are kept so results stay in catalog order.
 
-    Returns:
-        List of modifiers that apply to this context
+    The index is a snapshot of the catalog at build time (Modifier is frozen,
+    so only list edits can go stale): rebuild it after changing the catalog.
+    Because it cannot change, selections are memoized per context, in a
+    bounded LRU shared by the threads using this index.
     """
-    selected = []
 
+    __slots__ = ("buckets", "size", "_selected", "_lock")
+
+    _SELECTED_MAX = 1024
+
+    def __init__(self, catalog: List[Modifier]):
+        buckets: Dict[Tuple[str, str], List[Tuple[int, Modifier]]] = {}
+        for pos, mod in enumerate(catalog):
+            buckets.setdefault((mod.key, mod.key_value), []).append((pos, mod))
+        self.buckets = buckets
+        self.size = len(catalog)
+        self._selected: "OrderedDict[tuple, Tuple[Modifier, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def select(self, context_values: Dict[str, str]) -> List[Modifier]:
+        key = tuple(context_values.items())
+        with self._lock:
+            hit = self._selected.get(key)
+            if hit is not None:
+                self._selected.move_to_end(key)
+                return list(hit)
+
+        hits: List[Tuple[int, Modifier]] = []
+        for item in context_values.items():
+            bucket = self.buckets.get(item)
+            if bucket:
+                hits.extend(bucket)
+        if len(hits) > 1:
+            hits.sort(key=itemgetter(0))
+        selected = [mod for _, mod in hits]
+
+        with self._lock:
+            self._selected[key] = tuple(selected)
+            while len(self._selected) > self._SELECTED_MAX:
+                self._selected.popitem(last=False)
+        return selected
+
+
+def build_index(catalog: List[Modifier]) -> CatalogIndex:
+    """Build a CatalogIndex for repeated select_modifiers calls."""
+    return CatalogIndex(catalog)
+
+
+def _context_values(ctx: GameContext) -> Dict[str, str]:
     # Build lookup map for context values
     context_values = {
         "venue_id": ctx.venue_id,
@@ -39,12 +83,37 @@ def select_modifiers(ctx: GameContext, catalog: List[Modifier]) -> List[Modifier
     if ctx.travel_km_away is not None:
         context_values["travel_km_away"] = str(ctx.travel_km_away)
 
-    # Select modifiers where key matches context
-    for mod in catalog:
-        if mod.key in context_values and context_values[mod.key] == mod.key_value:
-            selected.append(mod)
+    return context_values
+
+
+def select_modifiers(
+    ctx: GameContext, catalog: Union[List[Modifier], CatalogIndex]
+) -> List[Modifier]:
+    """
+    Select modifiers that match the current game context.
+
+    A modifier is selected if its key_value matches the corresponding
+    field in the GameContext. A plain list is scanned on every call, so
+    in-place catalog edits are always seen; hot loops should pass a
+    CatalogIndex, which probes buckets and memoizes per context.
+
+    Args:
+        ctx: GameContext instance
+        catalog: Full list of available modifiers, or a prebuilt CatalogIndex
+            (see build_index) for hot loops
 
-    return selected
+    Returns:
+        List of modifiers that apply to this context
+    """
+    context_values = _context_values(ctx)
+    if isinstance(catalog, CatalogIndex):
+        return catalog.select(context_values)
+
+    # Select modifiers where key matches context
+    return [
+        mod for mod in catalog
+        if mod.key in context_values and context_values[mod.key] == mod.key_value
+    ]
 
 
 def apply_modifiers(lines: List[MarketLine], mods: List[Modifier]) -> List[MarketLine]:
@@ -61,28 +130,29 @@ def apply_modifiers(lines: List[MarketLine], mods: List[Modifier]) -> List[Marke
     Returns:
         New list of MarketLine instances with adjusted values
     """
-    adjusted = []
+    # One pass over mods: per-stat factors, in modifier order. Applying them
+    # sequentially keeps the exact float result of the per-line mod scan.
+    factors_by_stat: Dict[str, List[float]] = {}
+    for mod in mods:
+        # Multiplicative adjustment: weight +0.03 => 1.03x
+        factor = 1.0 + mod.weight
+        for stat in dict.fromkeys(mod.applies_to):
+            factors_by_stat.setdefault(stat, []).append(factor)
+
+    # Hot loop (called per row in backtests): bind lookups to locals and
+    # build lines positionally.
+    factors_for = factors_by_stat.get
+    no_factors: Tuple[float, ...] = ()
+    adjusted: List[MarketLine] = []
+    append = adjusted.append
 
     for line in lines:
-        # Start with original line value
+        # Start with original line value, apply all relevant modifiers
         new_value = line.line
-
-        # Apply all relevant modifiers
-        for mod in mods:
-            if line.stat_name in mod.applies_to:
-                # Multiplicative adjustment: weight +0.03 => 1.03x
-                new_value = new_value * (1.0 + mod.weight)
+        for factor in factors_for(line.stat_name, no_factors):
+            new_value = new_value * factor
 
         # Round to 2 decimals for stability
-        new_value = round(new_value, 2)
-
-        # Create adjusted line
-        adjusted.append(
-            MarketLine(
-                stat_name=line.stat_name,
-                line=new_value,
-                direction=line.direction
-            )
-        )
+        append(MarketLine(line.stat_name, round(new_value, 2), line.direction))
 
     return adjusted
@@ -2,56 +2,87 @@
 Provenance tracking and input fingerprinting for audit trails.
 """
 import json
-import hashlib
-from datetime import datetime
-from typing import List
+from typing import Iterable, List
+
+from bus._hash import new_hasher
+from bus.provenance import now_unix_ms
 from .types import GameState, GameContext, MarketLine, Modifier, ProvenanceRecord
 
 
+# Canonical encoder for leaf values; the container framing below is emitted
+# by hand in sorted-key order so the byte stream equals
+# json.dumps(inputs, sort_keys=True, separators=(",", ":"), ensure_ascii=False).
+_ENC = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode
+
+# GameContext fields in sorted key order.
+_CONTEXT_FIELDS = tuple(sorted((
+    "game_id", "venue_id", "home_away", "coach_id_home", "coach_id_away", "game_date",
+    "days_rest_home", "days_rest_away", "travel_km_home", "travel_km_away",
+)))
+
+
+# ASCII-escaping encoder: the modifier-set hash has always used json.dumps'
+# default ensure_ascii=True, unlike the fingerprint above.
+_ENC_ASCII = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _hash_sorted_strings(names: Iterable[str]) -> str:
+    """
+    Hash of the canonical JSON array of `names` sorted, fed to the hasher
+    element by element (same digest as hashing json.dumps(sorted(names))).
+    """
+    h = new_hasher()
+    h.update(b"[")
+    sep = b""
+    for name in sorted(names):
+        h.update(sep)
+        h.update(_ENC_ASCII(name).encode("ascii"))
+        sep = b","
+    h.update(b"]")
+    return h.hexdigest()
+
+
 def fingerprint_inputs(ctx: GameContext, lines: List[MarketLine], mods: List[Modifier]) -> str:
     """
     Compute stable fingerprint of all inputs to a game execution.
 
+    Canonical JSON is streamed into the hasher one record at a time instead of
+    materializing the full nested document.
+
     Args:
         ctx: GameContext
         lines: List of MarketLine instances
         mods: List of Modifier instances
 
     Returns:
-        SHA256 hex digest of canonical JSON representation
+        Hex digest (SHA256 unless AAL_HASH overrides) of canonical JSON representation
     """
-    # Build canonical representation
-    inputs = {
-        "context": {
-            "game_id": ctx.game_id,
-            "venue_id": ctx.venue_id,
-            "home_away": ctx.home_away,
-            "coach_id_home": ctx.coach_id_home,
-            "coach_id_away": ctx.coach_id_away,
-            "game_date": ctx.game_date,
-            "days_rest_home": ctx.days_rest_home,
-            "days_rest_away": ctx.days_rest_away,
-            "travel_km_home": ctx.travel_km_home,
-            "travel_km_away": ctx.travel_km_away,
-        },
-        "lines": [
-            {"stat_name": line.stat_name, "line": line.line, "direction": line.direction}
-            for line in lines
-        ],
-        "modifiers": [
-            {
-                "name": mod.name,
-                "key": mod.key,
-                "key_value": mod.key_value,
-                "applies_to": sorted(mod.applies_to),
-                "weight": mod.weight,
-            }
-            for mod in mods
-        ],
-    }
-
-    canonical = json.dumps(inputs, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    h = new_hasher()
+
+    context = ",".join(f"{_ENC(k)}:{_ENC(getattr(ctx, k))}" for k in _CONTEXT_FIELDS)
+    h.update(f'{{"context":{{{context}}},"lines":['.encode("utf-8"))
+
+    sep = ""
+    for line in lines:
+        h.update(
+            f'{sep}{{"direction":{_ENC(line.direction)},"line":{_ENC(line.line)},'
+            f'"stat_name":{_ENC(line.stat_name)}}}'.encode("utf-8")
+        )
+        sep = ","
+
+    h.update(b'],"modifiers":[')
+
+    sep = ""
+    for mod in mods:
+        h.update(
+            f'{sep}{{"applies_to":{_ENC(sorted(mod.applies_to))},"key":{_ENC(mod.key)},'
+            f'"key_value":{_ENC(mod.key_value)},"name":{_ENC(mod.name)},'
+            f'"weight":{_ENC(mod.weight)}}}'.encode("utf-8")
+        )
+        sep = ","
+
+    h.update(b"]}")
+    return h.hexdigest()
 
 
 def make_provenance(
@@ -75,15 +106,13 @@ def make_provenance(
         ProvenanceRecord with full audit trail
     """
     # Hash the modifier set
-    mod_names = sorted([mod.name for mod in mods])
-    mod_set_json = json.dumps(mod_names, sort_keys=True, separators=(",", ":"))
-    mod_set_hash = hashlib.sha256(mod_set_json.encode("utf-8")).hexdigest()
+    mod_set_hash = _hash_sorted_strings(mod.name for mod in mods)
 
     # Fingerprint all inputs
     inputs_fp = fingerprint_inputs(ctx, lines, mods)
 
     return ProvenanceRecord(
-        timestamp_iso=datetime.utcnow().isoformat(),
+        timestamp_ms=now_unix_ms(),
         game_id=state.game_id,
         context_key_hash=state.context_key,
         modifier_set_hash=mod_set_hash,
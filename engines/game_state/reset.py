@@ -2,7 +2,7 @@
 Hard reset enforcement for game state initialization.
 Ensures no cross-game leakage via cold-start policy.
 """
-from datetime import datetime
+from bus.provenance import now_unix_ms
 from .types import GameState, GameContext
 from .context_keys import build_context_key, hash_key
 
@@ -31,7 +31,7 @@ def new_game_state(game_id: str, ctx: GameContext) -> GameState:
     # Create state with enforced empty initialization
     state = GameState(
         game_id=game_id,
-        created_at=datetime.utcnow().isoformat(),
+        created_at_ms=now_unix_ms(),
         context_key=context_hash,
         applied_modifiers=[],
         internal_state={}  # MANDATORY: no carryover state
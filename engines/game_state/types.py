@@ -3,10 +3,15 @@ Core data structures for deterministic game state management.
 """
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 
-@dataclass(frozen=True)
+def _iso_from_ms(ms: int) -> str:
+    """Format unix milliseconds as a UTC ISO-8601 string (display only)."""
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).isoformat()
+
+
+@dataclass(frozen=True, slots=True)
 class GameContext:
     """
     Stable contextual variables for a single game.
@@ -24,7 +29,7 @@ class GameContext:
     travel_km_away: Optional[float] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarketLine:
     """
     A single betting line or projection target.
@@ -34,7 +39,7 @@ class MarketLine:
     direction: str  # "over" or "under" (informational)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Modifier:
     """
     A contextual adjustment rule tied to specific key values.
@@ -47,33 +52,43 @@ class Modifier:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """
     The runtime state for a single game execution.
     Must be cold-started (empty internal_state) for each game.
     """
     game_id: str
-    created_at: str  # ISO timestamp
+    created_at_ms: int  # Unix ms; see created_at for ISO display
     context_key: str  # Hash of the GameContext
     applied_modifiers: List[str] = field(default_factory=list)  # Modifier names
     internal_state: Dict[str, Any] = field(default_factory=dict)  # Must start empty
 
+    @property
+    def created_at(self) -> str:
+        """ISO-8601 UTC creation time, formatted on demand."""
+        return _iso_from_ms(self.created_at_ms)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ProvenanceRecord:
     """
     Full audit trail for a game execution.
     """
-    timestamp_iso: str
+    timestamp_ms: int  # Unix ms; see timestamp_iso for ISO display
     game_id: str
     context_key_hash: str
     modifier_set_hash: str
     code_version: str
     inputs_fingerprint: str
 
+    @property
+    def timestamp_iso(self) -> str:
+        """ISO-8601 UTC timestamp, formatted on demand."""
+        return _iso_from_ms(self.timestamp_ms)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunResult:
     """
     Complete output of a game execution.
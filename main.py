@@ -2,53 +2,93 @@
 """
 AAL-Core: Append-only overlay bus with provenance logging + Dynamic Function Discovery
 """
+import asyncio
 import os
 import json
-import hashlib
+import logging
+import shutil
 import subprocess
+import threading
 import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
 
 # AAL-core services
 from aal_core.bus import EventBus
 from aal_core.services.fn_registry import FunctionRegistry, bind_fn_registry_routes
+from abx_runes.memory_runes import MemoryProfile, parse_memory_profile
+from abx_runes.rss_watch import RssWatcher, classify_rss, degradation_for
 from bus import enforce_phase_policy
+from bus.types import Phase
+from bus._hash import HASH_ALGO, check_algo, digest_hex
+from bus._json import (
+    dumps as json_dumps_fast,
+    dumps_line as json_dumps_line,
+    loads as json_loads_fast,
+)
+from bus.provenance import BackgroundJsonlWriter, now_unix_ms, tail_lines_rotated
+from bus.worker_pool import OverlayWorkerPool, dispatch_key
+
+log = logging.getLogger(__name__)
+
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Write out queued provenance events before the process exits
+    await asyncio.to_thread(provenance_writer.close)
 
-app = FastAPI(title="AAL-Core", version="1.0.0")
+
+app = FastAPI(title="AAL-Core", version="1.0.0", lifespan=lifespan)
 
 # Paths
 OVERLAYS_DIR = Path(__file__).parent / ".aal" / "overlays"
-LOGS_DIR = Path(__file__).parent / "logs"
+LOGS_DIR = Path(os.environ.get("AAL_LOGS_DIR") or Path(__file__).parent / "logs")
 PROVENANCE_LOG = LOGS_DIR / "provenance.jsonl"
 EVENTS_LOG = LOGS_DIR / "events.jsonl"
 
 # Ensure logs directory exists
-LOGS_DIR.mkdir(exist_ok=True)
+LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
 # Initialize event bus
 event_bus = EventBus(log_path=EVENTS_LOG)
 
+# Long-lived workers for overlays that declare a worker_entrypoint
+overlay_workers = OverlayWorkerPool(size=int(os.environ.get("AAL_WORKERS_PER_OVERLAY", "1")))
+
 # Initialize function registry
 fn_registry = FunctionRegistry(
     bus=event_bus,
     overlays_root=str(OVERLAYS_DIR)
 )
 
-# Build initial catalog
-fn_registry.tick()
+# Build initial catalog. Under multi-worker uvicorn the launching process has
+# already published it, so worker processes only prime their own copy.
+if os.environ.get("AAL_FN_CATALOG_PUBLISHED") == "1":
+    fn_registry.prime()
+else:
+    fn_registry.tick()
 
 
 class InvokeRequest(BaseModel):
-    phase: str
+    model_config = ConfigDict(extra="forbid")
+
+    # Unknown phases are rejected by pydantic-core (422) before the handler runs
+    phase: Phase
     data: Dict[str, Any]
 
 
+# Built once: /invoke validates the raw body straight from JSON bytes
+_INVOKE_ADAPTER = TypeAdapter(InvokeRequest)
+
+
 class InvokeResponse(BaseModel):
     ok: bool
     overlay: str
@@ -60,79 +100,356 @@ class InvokeResponse(BaseModel):
     payload_hash: str
 
 
-def load_overlay_manifest(overlay_name: str) -> Dict[str, Any]:
-    """Load and parse overlay manifest.json"""
-    manifest_path = OVERLAYS_DIR / overlay_name / "manifest.json"
-    if not manifest_path.exists():
+@dataclass(frozen=True, slots=True)
+class PreparedManifest:
+    """A parsed manifest plus the per-request lookups derived from it."""
+    manifest: Dict[str, Any]
+    argv: Tuple[str, ...]
+    worker_argv: Optional[Tuple[str, ...]]
+    phases: FrozenSet[str]
+    capabilities: FrozenSet[str]
+    memory_profile: Optional[MemoryProfile] = None
+    # b'{"overlay":..,"version":..,' -- the static head of every overlay request
+    envelope_prefix: bytes = b"{"
+
+
+def _resolve_argv(command: str) -> Tuple[str, ...]:
+    """Split a command and resolve a bare program name against PATH once,
+    so each spawn execs an absolute path instead of searching PATH."""
+    argv = command.split()
+    if argv and os.sep not in argv[0]:
+        argv[0] = shutil.which(argv[0]) or argv[0]
+    return tuple(argv)
+
+
+def _prepare_manifest(manifest: Dict[str, Any], overlay_name: str) -> PreparedManifest:
+    worker_entrypoint = manifest.get("worker_entrypoint")
+    envelope_head = json_dumps_fast({"overlay": overlay_name, "version": manifest.get("version")})
+    return PreparedManifest(
+        manifest=manifest,
+        argv=_resolve_argv(manifest.get("entrypoint", "python src/run.py")),
+        worker_argv=_resolve_argv(worker_entrypoint) if worker_entrypoint else None,
+        phases=frozenset(p for p in manifest.get("phases", []) if isinstance(p, str)),
+        capabilities=frozenset(manifest.get("capabilities", [])),
+        memory_profile=(
+            parse_memory_profile(manifest["memory_profile"])
+            if manifest.get("memory_profile")
+            else None
+        ),
+        envelope_prefix=envelope_head[:-1] + b",",
+    )
+
+
+# Prepared manifest.json per path, keyed by (st_mtime_ns, st_size) so a steady
+# server pays one stat() per lookup instead of open+parse. Handlers run in
+# FastAPI's threadpool, hence the lock. Cached dicts are shared: read-only.
+_MANIFEST_CACHE: Dict[str, Tuple[int, int, PreparedManifest]] = {}
+_MANIFEST_LOCK = threading.RLock()
+
+
+def _cached_manifest(manifest_path: Path) -> Optional[PreparedManifest]:
+    """Prepared manifest, re-read only when the file changed; None if missing."""
+    key = str(manifest_path)
+    try:
+        st = manifest_path.stat()
+    except OSError:
+        with _MANIFEST_LOCK:
+            _MANIFEST_CACHE.pop(key, None)
+        return None
+
+    with _MANIFEST_LOCK:
+        hit = _MANIFEST_CACHE.get(key)
+        if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            return hit[2]
+        with open(manifest_path) as f:
+            prepared = _prepare_manifest(json.load(f), manifest_path.parent.name)
+        _MANIFEST_CACHE[key] = (st.st_mtime_ns, st.st_size, prepared)
+        return prepared
+
+
+def load_prepared_manifest(overlay_name: str) -> PreparedManifest:
+    """Cached PreparedManifest for an overlay (404 if it has no manifest)."""
+    prepared = overlay_index.prepared(OVERLAYS_DIR, overlay_name)
+    if prepared is None:
+        prepared = _cached_manifest(OVERLAYS_DIR / overlay_name / "manifest.json")
+    if prepared is None:
         raise HTTPException(404, f"Overlay '{overlay_name}' not found")
+    return prepared
 
-    with open(manifest_path) as f:
-        return json.load(f)
+
+def load_overlay_manifest(overlay_name: str) -> Dict[str, Any]:
+    """Load and parse overlay manifest.json (cached; do not mutate the result)"""
+    return load_prepared_manifest(overlay_name).manifest
+
+
+class OverlayIndex:
+    """
+    Precomputed /overlays listing.
+
+    With the optional `watchdog` package, watch() marks the index dirty on
+    filesystem events under the watched root, and clean lookups return the
+    snapshot with no I/O. Otherwise (or for any other root) each lookup
+    scans the root and stats each manifest (parses come from the manifest
+    cache), and the listing dicts are rebuilt only when a manifest changed.
+    For the watched root, prepared() serves /invoke manifest lookups from
+    the snapshot, so a steady server does no stat() per request. A manifest
+    that fails to parse is logged and left out of the snapshot, so one broken
+    overlay cannot take down the listing or the others' lookups.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._root: Optional[Path] = None
+        self._sources: List[Tuple[str, PreparedManifest]] = []
+        self._by_name: Dict[str, PreparedManifest] = {}
+        self._watched: Optional[Path] = None
+        self._observer: Any = None
+        self._dirty = True
+        self.snapshot: List[Dict[str, Any]] = []
+
+    def watch(self, root: Path) -> bool:
+        """Start a watchdog observer on `root`; False if watchdog is unavailable."""
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return False
+        if not root.is_dir():
+            return False
+
+        index = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event: Any) -> None:
+                index.invalidate()
+
+        observer = Observer()
+        observer.schedule(_Handler(), str(root), recursive=True)
+        observer.daemon = True
+        observer.start()
+        self._observer, self._watched = observer, root
+        self.invalidate()
+        return True
+
+    def invalidate(self) -> None:
+        self._dirty = True
+
+    def prepared(self, root: Path, name: str) -> Optional[PreparedManifest]:
+        """Snapshot entry for `name` under the watched root (None if unwatched or absent)."""
+        if root != self._watched:
+            return None
+        if self._dirty or root != self._root:
+            self.get(root)
+        return self._by_name.get(name)
+
+    def get(self, root: Path) -> List[Dict[str, Any]]:
+        if root == self._watched and root == self._root and not self._dirty:
+            return self.snapshot
+        with self._lock:
+            if root == self._watched:
+                # Cleared before scanning: events during the scan re-dirty it.
+                self._dirty = False
+            try:
+                return self._rebuild(root)
+            except BaseException:
+                # Never leave a failed scan marked clean
+                self._dirty = True
+                raise
+
+    def _rebuild(self, root: Path) -> List[Dict[str, Any]]:
+        # Caller holds self._lock.
+        sources: List[Tuple[str, PreparedManifest]] = []
+        if root.exists():
+            with os.scandir(root) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    try:
+                        prepared = _cached_manifest(Path(entry.path) / "manifest.json")
+                    except Exception:
+                        log.warning(
+                            "Skipping overlay %r: unreadable manifest", entry.name, exc_info=True
+                        )
+                        continue
+                    if prepared is not None:
+                        sources.append((entry.name, prepared))
+        unchanged = root == self._root and len(sources) == len(self._sources) and all(
+            a[0] == b[0] and a[1] is b[1] for a, b in zip(sources, self._sources)
+        )
+        if not unchanged:
+            self.snapshot = [
+                {
+                    "name": name,
+                    "version": prepared.manifest.get("version"),
+                    "status": prepared.manifest.get("status"),
+                    "phases": prepared.manifest.get("phases", []),
+                    "capabilities": prepared.manifest.get("capabilities", []),
+                }
+                for name, prepared in sources
+            ]
+            self._root, self._sources = root, sources
+            self._by_name = dict(sources)
+        return self.snapshot
+
+
+overlay_index = OverlayIndex()
+overlay_index.watch(OVERLAYS_DIR)
+
+
+# Process RSS, sampled off the request path; overlays whose manifest declares
+# a "memory_profile" rune get degradation parameters at SOFT/HARD pressure.
+_RSS_SAMPLE_S = int(os.environ.get("AAL_RSS_SAMPLE_MS", "100")) / 1000.0
+memory_watcher = RssWatcher(interval_s=_RSS_SAMPLE_S).start()
+
+
+# Payload digest: sha256 unless AAL_HASH_ALGO (or AAL_HASH) selects another
+# algorithm; recorded per event as payload_hash_algo so logs stay verifiable.
+PAYLOAD_HASH_ALGO = check_algo(
+    os.environ.get("AAL_HASH_ALGO", "").strip().lower() or HASH_ALGO, "AAL_HASH_ALGO"
+)
+
+
+_CANONICAL = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def canonical_payload(data: Dict[str, Any]) -> bytes:
+    """Canonical JSON bytes of a payload (the input to compute_payload_hash)."""
+    return _CANONICAL.encode(data).encode("utf-8")
 
 
 def compute_payload_hash(data: Dict[str, Any]) -> str:
-    """Compute deterministic SHA256 hash of payload."""
-    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    """Compute deterministic hash (PAYLOAD_HASH_ALGO) of payload."""
+    return digest_hex(canonical_payload(data), PAYLOAD_HASH_ALGO)
 
 
 def append_jsonl(path: Path, event: Dict[str, Any]) -> None:
-    """Append event to JSONL log (atomic, append-only)."""
-    with open(path, "a") as f:
-        f.write(json.dumps(event, separators=(",", ":")) + "\n")
+    """
+    Append event to JSONL log (atomic, append-only).
+
+    Kept for direct callers; the server itself logs provenance through
+    provenance_writer and events through event_bus.
+    """
+    with open(path, "ab") as f:
+        f.write(json_dumps_line(event))
+
+
+# Provenance appends are serialized on the request side and written in
+# batches by a background thread (one O_APPEND fd, coalesced fdatasync).
+# Past AAL_PROVENANCE_MAX_MB (0 disables) the log rolls over to a compressed
+# segment next to it.
+_PROVENANCE_MAX_MB = int(os.environ.get("AAL_PROVENANCE_MAX_MB", "256"))
+# Longest /provenance waits for queued events before reading what is on disk
+_PROVENANCE_FLUSH_TIMEOUT_S = 5.0
+provenance_writer = BackgroundJsonlWriter(
+    PROVENANCE_LOG,
+    max_bytes=_PROVENANCE_MAX_MB * 1024 * 1024 if _PROVENANCE_MAX_MB > 0 else None,
+)
+
+
+def append_provenance(event: Dict[str, Any]) -> None:
+    """Queue a provenance event; same line format as append_jsonl."""
+    provenance_writer.append_record(json_dumps_line(event))
 
 
-def invoke_overlay_subprocess(
+# Max stderr bytes carried into error responses / provenance.
+STDERR_CAP_BYTES = 4096
+
+
+async def invoke_overlay_subprocess(
     overlay_name: str,
     manifest: Dict[str, Any],
     phase: str,
     data: Dict[str, Any],
-    request_id: str
+    request_id: str,
+    payload_bytes: Optional[bytes] = None,
+    prepared: Optional[PreparedManifest] = None,
+    timestamp_ms: Optional[int] = None,
+    metadata: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
-    """Execute overlay via subprocess with timeout."""
+    """
+    Execute overlay via subprocess with timeout (awaits; no thread held).
+
+    `payload_bytes` is canonical_payload(data) when the caller already has
+    it (e.g. from hashing); it is spliced into the request as-is.
+    `prepared` supplies the pre-split argv and envelope head for `manifest`. `timestamp_ms`
+    is the wall-clock time sent to the overlay (defaults to now).
+    `metadata` (e.g. memory degradation parameters) is sent when non-empty.
+    """
     overlay_dir = OVERLAYS_DIR / overlay_name
-    entrypoint = manifest.get("entrypoint", "python src/run.py")
+    if prepared is None:
+        prepared = _prepare_manifest(manifest, overlay_name)
     timeout_ms = manifest.get("timeout_ms", 5000)
 
-    # Build overlay request
-    overlay_request = {
-        "overlay": overlay_name,
-        "version": manifest.get("version"),
-        "phase": phase,
-        "request_id": request_id,
-        "timestamp_ms": int(time.time() * 1000),
-        "payload": data
-    }
-
-    # Execute
-    cmd = entrypoint.split()
+    # Build overlay request: the manifest's pre-encoded envelope head, the
+    # per-request fields, then the pre-encoded payload
+    if payload_bytes is None:
+        payload_bytes = canonical_payload(data)
+    parts = [
+        prepared.envelope_prefix,
+        b'"phase":', json_dumps_fast(phase),
+        b',"request_id":', json_dumps_fast(request_id),
+        b',"timestamp_ms":%d' % (now_unix_ms() if timestamp_ms is None else timestamp_ms),
+    ]
+    if metadata:
+        parts += (b',"metadata":', json_dumps_fast(metadata))
+    parts += (b',"payload":', payload_bytes, b"}")
+    request_bytes = b"".join(parts)
+
+    # Execute: persistent worker when the overlay provides one, else one-shot
+    cmd = prepared.worker_argv or prepared.argv
     try:
-        result = subprocess.run(
-            cmd,
-            input=json.dumps(overlay_request).encode("utf-8"),
-            capture_output=True,
-            timeout=timeout_ms / 1000.0,
+        if prepared.worker_argv:
+            return await asyncio.to_thread(
+                overlay_workers.call_raw,
+                overlay_name,
+                cmd,
+                overlay_dir,
+                request_bytes,
+                timeout_ms / 1000.0,
+                dispatch_key(data),
+            )
+
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
             cwd=overlay_dir,
-            check=False
         )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(input=request_bytes),
+                timeout=timeout_ms / 1000.0,
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout_ms / 1000.0)
 
         # Parse output
-        if result.returncode == 0:
-            return json.loads(result.stdout.decode("utf-8"))
+        if proc.returncode == 0:
+            return json_loads_fast(stdout)
         else:
-            # Non-zero exit
-            try:
-                error_data = json.loads(result.stdout.decode("utf-8"))
-                return error_data
-            except:
-                return {
-                    "ok": False,
-                    "overlay": overlay_name,
-                    "phase": phase,
-                    "request_id": request_id,
-                    "error": result.stderr.decode("utf-8") or "Overlay exited with non-zero status",
-                    "exit_code": result.returncode
-                }
+            # Non-zero exit: prefer the overlay's own JSON error object (parsed
+            # straight from bytes); otherwise report a capped stderr.
+            if stdout:
+                try:
+                    error_data = json_loads_fast(stdout)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    error_data = None
+                if isinstance(error_data, dict):
+                    return error_data
+            return {
+                "ok": False,
+                "overlay": overlay_name,
+                "phase": phase,
+                "request_id": request_id,
+                "error": (
+                    stderr[:STDERR_CAP_BYTES].decode("utf-8", "replace")
+                    or "Overlay exited with non-zero status"
+                ),
+                "exit_code": proc.returncode
+            }
 
     except subprocess.TimeoutExpired:
         return {
@@ -155,122 +472,186 @@ def invoke_overlay_subprocess(
 
 
 @app.get("/")
-def root():
-    """Health check."""
+async def root():
+    """Health check (degraded once a provenance write has failed)."""
+    provenance = provenance_writer.stats()
     return {
         "service": "AAL-Core",
         "version": "1.0.0",
-        "status": "ok"
+        "status": "degraded" if provenance["errors"] else "ok",
+        "provenance_writer": provenance,
     }
 
 
 @app.get("/overlays")
-def list_overlays():
+async def list_overlays():
     """List available overlays."""
-    overlays = []
-    if OVERLAYS_DIR.exists():
-        for overlay_dir in OVERLAYS_DIR.iterdir():
-            if overlay_dir.is_dir():
-                manifest_path = overlay_dir / "manifest.json"
-                if manifest_path.exists():
-                    with open(manifest_path) as f:
-                        manifest = json.load(f)
-                    overlays.append({
-                        "name": overlay_dir.name,
-                        "version": manifest.get("version"),
-                        "status": manifest.get("status"),
-                        "phases": manifest.get("phases", []),
-                        "capabilities": manifest.get("capabilities", [])
-                    })
-    return {"overlays": overlays}
-
-
-@app.post("/invoke/{overlay_name}")
-def invoke_overlay(overlay_name: str, req: InvokeRequest):
+    return {"overlays": overlay_index.get(OVERLAYS_DIR)}
+
+
+@app.post(
+    "/invoke/{overlay_name}",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": InvokeRequest.model_json_schema()}},
+        }
+    },
+)
+async def invoke_overlay(overlay_name: str, request: Request):
     """Invoke overlay with phase and data."""
-    # Generate request ID
-    request_id = f"{overlay_name}-{int(time.time() * 1000)}"
+    try:
+        req = _INVOKE_ADAPTER.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        )
+
+    # One wall-clock read per request (request ID, logged/sent timestamps);
+    # durations use the monotonic clock. The ID sorts by time; 32 random bits
+    # keep same-millisecond requests (across worker processes too) distinct.
+    wall_ms = now_unix_ms()
+    request_id = f"{overlay_name}-{wall_ms}-{os.urandom(4).hex()}"
 
     # Load manifest
-    manifest = load_overlay_manifest(overlay_name)
+    prepared = load_prepared_manifest(overlay_name)
+    manifest = prepared.manifest
 
     # Validate phase
-    valid_phases = manifest.get("phases", [])
-    if req.phase not in valid_phases:
+    if req.phase not in prepared.phases:
+        valid_phases = manifest.get("phases", [])
         raise HTTPException(
             400,
             f"Invalid phase '{req.phase}' for overlay '{overlay_name}'. Valid: {valid_phases}"
         )
 
     # Enforce phase policy
-    capabilities = manifest.get("capabilities", [])
-    policy_decision = enforce_phase_policy(req.phase, capabilities)
+    policy_decision = enforce_phase_policy(req.phase, prepared.capabilities)
     if not policy_decision.ok:
         raise HTTPException(
             403,
             f"Policy violation: {policy_decision.reason}"
         )
 
-    # Compute payload hash for provenance
-    payload_hash = compute_payload_hash(req.data)
+    # Compute payload hash for provenance. The payload is encoded once:
+    # hashed here, spliced into the overlay request.
+    payload_bytes = canonical_payload(req.data)
+    payload_hash = digest_hex(payload_bytes, PAYLOAD_HASH_ALGO)
+
+    # Memory pressure: degrade overlays that declare a memory profile
+    mem_tier = classify_rss(memory_watcher.current_rss_mb, prepared.memory_profile)
+    degraded = degradation_for(prepared.memory_profile, mem_tier)
 
     # Dev mode: log full payload for exact replay
     dev_log_payload = os.environ.get("AAL_DEV_LOG_PAYLOAD", "0") == "1"
 
     # Execute overlay
-    start_ms = int(time.time() * 1000)
-    overlay_response = invoke_overlay_subprocess(
+    start_ns = time.monotonic_ns()
+    overlay_response = await invoke_overlay_subprocess(
         overlay_name,
         manifest,
         req.phase,
         req.data,
-        request_id
+        request_id,
+        payload_bytes,
+        prepared,
+        wall_ms,
+        degraded
     )
-    end_ms = int(time.time() * 1000)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
     # Log to provenance (append-only)
     provenance_event = {
         "request_id": request_id,
-        "timestamp_ms": start_ms,
+        "timestamp_ms": wall_ms,
         "overlay": overlay_name,
         "version": manifest.get("version"),
         "phase": req.phase,
         "payload_hash": payload_hash,
+        "payload_hash_algo": PAYLOAD_HASH_ALGO,
         "ok": overlay_response.get("ok"),
-        "duration_ms": end_ms - start_ms,
+        "duration_ms": duration_ms,
         "error": overlay_response.get("error")
     }
 
+    if mem_tier != "NORMAL":
+        provenance_event["mem_tier"] = mem_tier
+
     # Dev-only: store full payload for exact replay
     if dev_log_payload:
         provenance_event["payload"] = req.data
 
-    append_jsonl(PROVENANCE_LOG, provenance_event)
+    append_provenance(provenance_event)
 
-    # Return response
-    return {
+    # Return response: encoded once to bytes, skipping jsonable_encoder
+    body = {
         "ok": overlay_response.get("ok"),
         "overlay": overlay_name,
         "phase": req.phase,
         "request_id": request_id,
         "result": overlay_response.get("result"),
         "error": overlay_response.get("error"),
-        "timestamp_ms": end_ms,
+        "timestamp_ms": wall_ms + duration_ms,
         "payload_hash": payload_hash
     }
+    return Response(content=json_dumps_fast(body), media_type="application/json")
+
+
+def _read_provenance_lines() -> list:
+    with open(PROVENANCE_LOG, "rb") as f:
+        return f.readlines()
+
+
+def _is_json_object(line: bytes) -> bool:
+    try:
+        return isinstance(json_loads_fast(line), dict)
+    except ValueError:  # JSONDecodeError and UnicodeDecodeError
+        return False
 
 
 @app.get("/provenance")
-def get_provenance(limit: int = 100):
+async def get_provenance(limit: int = 100):
     """Retrieve recent provenance events."""
-    if not PROVENANCE_LOG.exists():
+    # Read-your-writes: wait (bounded) for queued events to hit the file first.
+    await asyncio.to_thread(provenance_writer.flush, _PROVENANCE_FLUSH_TIMEOUT_S)
+    if limit > 0:
+        # Reverse scan from EOF, continuing into rotated segments if needed:
+        # cost follows `limit`, not the log size
+        lines = await asyncio.to_thread(tail_lines_rotated, PROVENANCE_LOG, limit)
+    elif not PROVENANCE_LOG.exists():
         return {"events": []}
+    else:
+        lines = (await asyncio.to_thread(_read_provenance_lines))[-limit:]
+
+    # Lines are already JSON objects: splice them into the response body as
+    # raw bytes instead of re-encoding every event. Each line is still parsed
+    # once so a torn or corrupt line (e.g. from a crash mid-append) is skipped
+    # rather than breaking the whole response body.
+    events = [line for line in (raw.strip() for raw in lines) if line and _is_json_object(line)]
+    body = b'{"events":[' + b",".join(events) + b'],"count":%d}' % len(events)
+    return Response(content=body, media_type="application/json")
+
+
+@app.get("/memory")
+def get_memory():
+    """Process RSS and the memory tier of each overlay with a memory profile."""
+    rss_mb = memory_watcher.current_rss_mb
+    with _MANIFEST_LOCK:
+        prepared = [entry[2] for entry in _MANIFEST_CACHE.values()]
+    overlays = {
+        str(p.manifest.get("name")): classify_rss(rss_mb, p.memory_profile)
+        for p in prepared
+        if p.memory_profile is not None
+    }
+    rank = {"NORMAL": 0, "SOFT": 1, "HARD": 2}
+    tier = max(overlays.values(), key=rank.__getitem__, default="NORMAL")
+    return {"rss_mb": rss_mb, "tier": tier, "overlays": dict(sorted(overlays.items()))}
 
-    with open(PROVENANCE_LOG) as f:
-        lines = f.readlines()
 
-    events = [json.loads(line) for line in lines[-limit:]]
-    return {"events": events, "count": len(events)}
+@app.get("/workers")
+async def get_workers():
+    """Persistent overlay worker metrics (inflight, affinity hits/misses)."""
+    return {"workers": overlay_workers.stats()}
 
 
 @app.get("/events")
@@ -285,16 +666,20 @@ def rebuild_fn_catalog():
     """
     Manually trigger function catalog rebuild.
 
-    Returns updated catalog hash and count.
+    Returns updated catalog hash and count. Concurrent calls are coalesced:
+    while a rebuild is running, others return the current snapshot with
+    "coalesced": true and the running rebuild is repeated once after.
     """
-    fn_registry.tick()
+    ran = fn_registry.request_tick()
+    overlay_index.invalidate()
     snapshot = fn_registry.get_snapshot()
 
     return {
         "ok": True,
         "catalog_hash": snapshot.catalog_hash,
         "count": snapshot.count,
-        "generated_at_unix": snapshot.generated_at_unix
+        "generated_at_unix": snapshot.generated_at_unix,
+        "coalesced": not ran
     }
 
 
@@ -304,4 +689,18 @@ bind_fn_registry_routes(app, fn_registry)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+
+    # One process per core (AAL_WORKERS overrides); uvicorn shares the socket
+    # across workers and, with uvicorn[standard], picks uvloop + httptools.
+    workers = int(os.environ.get("AAL_WORKERS", os.cpu_count() or 1))
+    if workers > 1:
+        os.environ["AAL_FN_CATALOG_PUBLISHED"] = "1"
+        uvicorn.run(
+            "main:app",
+            host="127.0.0.1",
+            port=8000,
+            workers=workers,
+            app_dir=str(Path(__file__).parent),
+        )
+    else:
+        uvicorn.run(app, host="127.0.0.1", port=8000)
@@ -1,4 +1,6 @@
-from typing import List
+import re
+from itertools import chain
+from typing import Dict, FrozenSet, List
 from aal_core.models import ResonanceFrame
 
 
@@ -9,6 +11,26 @@ ARCHETYPE_KEYWORDS = {
 }
 
 
+def _compile_keywords(table: Dict[str, List[str]]):
+    """
+    One pattern for every keyword, plus keyword -> archetypes implied by it.
+
+    The lookahead reports the longest keyword starting at each position; a
+    keyword also implies the archetypes of any keyword contained in it, so
+    the matched set equals the per-keyword ``kw in text`` checks.
+    """
+    keywords = {kw for kws in table.values() for kw in kws if kw}
+    implied: Dict[str, FrozenSet[str]] = {
+        kw: frozenset(a for a, kws in table.items() for other in kws if other and other in kw)
+        for kw in keywords
+    }
+    alternation = "|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))"), implied
+
+
+_KEYWORD_RE, _KEYWORD_ARCHETYPES = _compile_keywords(ARCHETYPE_KEYWORDS)
+
+
 def handle_frame(frame: ResonanceFrame, bus) -> List[ResonanceFrame]:
     """
     v0 Noctis stub:
@@ -16,16 +38,22 @@ def handle_frame(frame: ResonanceFrame, bus) -> List[ResonanceFrame]:
     - Add tags and symbolic_state.
     """
     text = (frame.text or "").lower()
-    new_syms = []
 
-    for archetype, kws in ARCHETYPE_KEYWORDS.items():
-        if any(kw in text for kw in kws):
-            new_syms.append(archetype)
+    # Single pass over the text for all keywords.
+    matched = set()
+    for m in _KEYWORD_RE.finditer(text):
+        matched |= _KEYWORD_ARCHETYPES[m.group(1)]
+
+    # Archetypes in table order, so outputs don't depend on set iteration.
+    new_syms = [a for a in ARCHETYPE_KEYWORDS if a in matched]
 
-    out = frame.copy()
-    out.source = "noctis_stub"
-    out.channel = "dream"
-    out.symbolic_state = list(set(out.symbolic_state + new_syms))
-    out.tags = list(set(out.tags + ["noctis_analysis"]))
+    # One shallow copy with the overrides applied (no per-field reassignment).
+    # dict.fromkeys dedups in one pass and keeps first-seen order.
+    out = frame.model_copy(update={
+        "source": "noctis_stub",
+        "channel": "dream",
+        "symbolic_state": list(dict.fromkeys(chain(frame.symbolic_state, new_syms))),
+        "tags": list(dict.fromkeys(chain(frame.tags, ("noctis_analysis",)))),
+    })
 
     return [out]
@@ -33,7 +33,7 @@ from .types import (
 )
 from .loader import load_normalizer, load_preset
 from .validate import validate_normalizer
-from .hash import stable_hash_dict
+from .hash import stable_hash_dict, stable_hash_items
 from .provenance import ProvenanceRecord, make_provenance, cfg_fingerprint
 
 __version__ = "1.0.0"
@@ -57,6 +57,7 @@ __all__ = [
     "validate_normalizer",
     # Hashing
     "stable_hash_dict",
+    "stable_hash_items",
     # Provenance
     "ProvenanceRecord",
     "make_provenance",
@@ -3,7 +3,14 @@ Stable hashing utilities for normalizer configurations.
 """
 import json
 import hashlib
-from typing import Dict, Any
+from typing import Dict, Any, Iterable
+
+
+_CANONICAL = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _canonical_bytes(d: Dict[str, Any]) -> bytes:
+    return _CANONICAL.encode(d).encode("utf-8")
 
 
 def stable_hash_dict(d: Dict[str, Any]) -> str:
@@ -19,10 +26,30 @@ def stable_hash_dict(d: Dict[str, Any]) -> str:
     Returns:
         SHA256 hex digest (64 characters)
     """
-    canonical = json.dumps(
-        d,
-        sort_keys=True,
-        separators=(",", ":"),
-        ensure_ascii=False
-    )
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return hashlib.sha256(_canonical_bytes(d)).hexdigest()
+
+
+def stable_hash_items(key: str, items: Iterable[Dict[str, Any]]) -> str:
+    """
+    Hash of ``{key: [items...]}``, streamed one item at a time.
+
+    Equal to ``stable_hash_dict({key: list(items)})``: the canonical bytes
+    are fed to the digest per item, so neither the list nor the whole
+    serialized document is built.
+
+    Args:
+        key: The single top-level key
+        items: Dictionaries forming the list value
+
+    Returns:
+        SHA256 hex digest (64 characters)
+    """
+    h = hashlib.sha256()
+    h.update(b"{" + _CANONICAL.encode(key).encode("utf-8") + b":[")
+    sep = b""
+    for item in items:
+        h.update(sep)
+        h.update(_canonical_bytes(item))
+        sep = b","
+    h.update(b"]}")
+    return h.hexdigest()
@@ -1,9 +1,12 @@
 """
 Loader utilities for normalizer configurations.
 """
+import copy
+import threading
 import yaml
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 from .types import (
     SportNormalizerConfig,
@@ -18,6 +21,19 @@ from .types import (
     Primitive,
 )
 
+try:
+    # libyaml-backed parser; same safe subset as yaml.safe_load
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+# Parsed YAML per resolved path, invalidated by (st_mtime_ns, st_size). Only
+# the mapping is cached; every load builds its own config from it, so callers
+# never share the mutable stat_map/meta containers.
+_CACHE_MAX = 100
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
 
 def _parse_distribution_shape(value: str) -> DistributionShape:
     """Parse distribution shape from string."""
@@ -94,8 +110,8 @@ def _parse_yaml_to_config(data: Dict[str, Any]) -> SportNormalizerConfig:
             survivability_score=float(stat_data["survivability_score"]),
         )
 
-    # Parse optional meta
-    meta = data.get("meta")
+    # Parse optional meta (copied: `data` may be the cached mapping)
+    meta = copy.deepcopy(data.get("meta"))
 
     return SportNormalizerConfig(
         schema_version=data["schema_version"],
@@ -115,6 +131,9 @@ def load_normalizer(path: str) -> SportNormalizerConfig:
     """
     Load a normalizer configuration from a YAML file.
 
+    The parsed YAML is cached per file and re-read when its mtime or size
+    changes; each call still returns a new config instance.
+
     Args:
         path: Path to YAML file
 
@@ -126,13 +145,28 @@ def load_normalizer(path: str) -> SportNormalizerConfig:
         ValueError: If YAML is invalid or doesn't match schema
     """
     file_path = Path(path)
-    if not file_path.exists():
-        raise FileNotFoundError(f"Normalizer file not found: {path}")
-
-    with open(file_path, "r") as f:
-        data = yaml.safe_load(f)
-
-    return _parse_yaml_to_config(data)
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Normalizer file not found: {path}") from None
+
+    key = str(file_path.resolve())
+    with _CACHE_LOCK:
+        hit = _YAML_CACHE.get(key)
+        if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            _YAML_CACHE.move_to_end(key)
+            return _parse_yaml_to_config(hit[2])
+
+    # One read of the whole file; the parser then works on an in-memory buffer.
+    data = yaml.load(file_path.read_bytes(), Loader=_SafeLoader)
+    config = _parse_yaml_to_config(data)
+
+    with _CACHE_LOCK:
+        _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+        _YAML_CACHE.move_to_end(key)
+        while len(_YAML_CACHE) > _CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+    return config
 
 
 def load_preset(sport_id: str) -> SportNormalizerConfig:
@@ -1,13 +1,24 @@
 """
 Provenance tracking for normalizer configurations.
 """
+import time
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any
 
 from .types import SportNormalizerConfig
 from .hash import stable_hash_dict
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+def utc_now_iso() -> str:
+    """
+    Current UTC time as a naive ISO-8601 string (the format of
+    ``datetime.utcnow().isoformat()``, without the deprecated call).
+    """
+    return (_EPOCH + timedelta(microseconds=time.time_ns() // 1000)).isoformat()
+
 
 @dataclass(frozen=True)
 class ProvenanceRecord:
@@ -34,7 +45,7 @@ def make_provenance(cfg: SportNormalizerConfig) -> ProvenanceRecord:
     config_hash = stable_hash_dict(config_dict)
 
     return ProvenanceRecord(
-        created_at_iso=datetime.utcnow().isoformat(),
+        created_at_iso=utc_now_iso(),
         schema_version=cfg.schema_version,
         sport_id=cfg.sport_id,
         config_version=cfg.version,
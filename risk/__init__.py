@@ -25,16 +25,18 @@ Usage:
     result = enforce_policy(nba, "ultra_safe", legs)
 """
 
-from .entropy import entropy_score
+from .entropy import entropy_score, entropy_scores, format_breakdown
 from .throttle import recommend_limits, ULTRA_SAFE, BALANCED, CORRELATED, LADDER, MODES
 from .policy import LegSpec, enforce_policy
-from .provenance import RiskProvenanceRecord, make_risk_provenance
+from .provenance import RiskProvenanceRecord, make_risk_provenance, make_risk_provenance_batch
 
 __version__ = "1.0.0"
 
 __all__ = [
     # Entropy
     "entropy_score",
+    "entropy_scores",
+    "format_breakdown",
     # Throttle
     "recommend_limits",
     "ULTRA_SAFE",
@@ -48,4 +50,5 @@ __all__ = [
     # Provenance
     "RiskProvenanceRecord",
     "make_risk_provenance",
+    "make_risk_provenance_batch",
 ]
@@ -4,7 +4,7 @@ Entropy scoring for sport risk profiles.
 Computes deterministic entropy scores from Sport Normalizer configurations
 to quantify the stability and predictability of different sports.
 """
-from typing import Dict, Tuple
+from typing import Dict, Iterable, List, Tuple
 from normalizers.types import SportNormalizerConfig, DistributionShape
 
 
@@ -18,61 +18,43 @@ def _normalize_event_rate(event_rate: float) -> float:
     return _clamp(event_rate / 100.0, 0.0, 1.0)
 
 
+# Built once at import; the lookup itself is the only per-call cost.
+_SHAPE_PENALTIES: Dict[DistributionShape, float] = {
+    DistributionShape.NORMAL: 0.00,
+    DistributionShape.SKEWED: 0.08,
+    DistributionShape.SPIKY: 0.16,
+    DistributionShape.BINARY: 0.28,
+}
+
+
 def _distribution_penalty(shape: DistributionShape) -> float:
     """
     Compute entropy penalty based on distribution shape.
 
     More irregular distributions have higher entropy.
     """
-    penalties = {
-        DistributionShape.NORMAL: 0.00,
-        DistributionShape.SKEWED: 0.08,
-        DistributionShape.SPIKY: 0.16,
-        DistributionShape.BINARY: 0.28,
-    }
-    return penalties[shape]
-
-
-def entropy_score(cfg: SportNormalizerConfig) -> Tuple[float, Dict[str, float]]:
-    """
-    Compute deterministic entropy score for a sport.
+    return _SHAPE_PENALTIES[shape]
 
-    Lower entropy = more stable/predictable (NBA-like)
-    Higher entropy = less stable/predictable (NFL-like)
-
-    Args:
-        cfg: SportNormalizerConfig instance
-
-    Returns:
-        Tuple of (entropy_score, breakdown_dict)
-        - entropy_score: float in [0, 1]
-        - breakdown: dict with component scores for transparency
-    """
-    # Extract normalizer values
-    stability = cfg.opportunity.stability_score
-    concentration = cfg.usage.concentration_score
-    event_rate = cfg.continuity.event_rate
-    distribution_shape = cfg.continuity.distribution_shape
-    per_event_var = cfg.volatility.per_event_variance
-    game_var = cfg.volatility.game_level_variance
 
+def _entropy_parts(cfg: SportNormalizerConfig) -> Tuple[float, float, float, float, float]:
+    """(event_rate_norm, base, shape_penalty, vol_penalty, total) for one config."""
     # Normalize event rate
-    event_rate_norm = _normalize_event_rate(event_rate)
+    event_rate_norm = _normalize_event_rate(cfg.continuity.event_rate)
 
     # Base entropy (inverse of stability indicators)
     # Higher stability/concentration/event_rate → lower base entropy
     base = 1.0 - (
-        0.50 * stability +
-        0.20 * concentration +
+        0.50 * cfg.opportunity.stability_score +
+        0.20 * cfg.usage.concentration_score +
         0.30 * event_rate_norm
     )
 
     # Distribution shape penalty
-    shape_penalty = _distribution_penalty(distribution_shape)
+    shape_penalty = _distribution_penalty(cfg.continuity.distribution_shape)
 
     # Volatility penalty (clamped to max 0.60)
     vol_penalty = _clamp(
-        0.35 * per_event_var + 0.35 * game_var,
+        0.35 * cfg.volatility.per_event_variance + 0.35 * cfg.volatility.game_level_variance,
         0.0,
         0.60
     )
@@ -83,19 +65,74 @@ def entropy_score(cfg: SportNormalizerConfig) -> Tuple[float, Dict[str, float]]:
         0.0,
         1.0
     )
+    return event_rate_norm, base, shape_penalty, vol_penalty, total_entropy
 
-    # Breakdown for transparency
+
+def entropy_score(cfg: SportNormalizerConfig) -> Tuple[float, Dict[str, float]]:
+    """
+    Compute deterministic entropy score for a sport.
+
+    Lower entropy = more stable/predictable (NBA-like)
+    Higher entropy = less stable/predictable (NFL-like)
+
+    Args:
+        cfg: SportNormalizerConfig instance
+
+    Returns:
+        Tuple of (entropy_score, breakdown_dict)
+        - entropy_score: float in [0, 1]
+        - breakdown: dict with unrounded component scores for transparency
+    """
+    event_rate_norm, base, shape_penalty, vol_penalty, total_entropy = _entropy_parts(cfg)
+
+    # Breakdown for transparency (full precision; see format_breakdown)
     breakdown = {
-        "base": round(base, 4),
-        "shape_penalty": round(shape_penalty, 4),
-        "vol_penalty": round(vol_penalty, 4),
-        "total": round(total_entropy, 4),
+        "base": base,
+        "shape_penalty": shape_penalty,
+        "vol_penalty": vol_penalty,
+        "total": total_entropy,
         # Individual components
-        "stability": stability,
-        "concentration": concentration,
-        "event_rate_norm": round(event_rate_norm, 4),
-        "per_event_variance": per_event_var,
-        "game_level_variance": game_var,
+        "stability": cfg.opportunity.stability_score,
+        "concentration": cfg.usage.concentration_score,
+        "event_rate_norm": event_rate_norm,
+        "per_event_variance": cfg.volatility.per_event_variance,
+        "game_level_variance": cfg.volatility.game_level_variance,
     }
 
     return total_entropy, breakdown
+
+
+# Derived components rounded for display; inputs are reported as given.
+_ROUNDED_COMPONENTS = ("base", "shape_penalty", "vol_penalty", "total", "event_rate_norm")
+
+
+def format_breakdown(breakdown: Dict[str, float], ndigits: int = 4) -> Dict[str, float]:
+    """
+    Presentation copy of an entropy_score breakdown.
+
+    Args:
+        breakdown: Breakdown dict from entropy_score
+        ndigits: Decimal places for the derived components
+
+    Returns:
+        New dict with derived components rounded to `ndigits`
+    """
+    out = dict(breakdown)
+    for key in _ROUNDED_COMPONENTS:
+        out[key] = round(out[key], ndigits)
+    return out
+
+
+def entropy_scores(cfgs: Iterable[SportNormalizerConfig]) -> List[float]:
+    """
+    Entropy scores for many configs, without building breakdowns.
+
+    Each value equals ``entropy_score(cfg)[0]`` (same float operations).
+
+    Args:
+        cfgs: SportNormalizerConfig instances
+
+    Returns:
+        List of entropy scores in input order
+    """
+    return [_entropy_parts(cfg)[4] for cfg in cfgs]
@@ -3,9 +3,10 @@ Policy enforcement for parlay risk management.
 
 Validates and filters legs based on entropy-derived limits.
 """
+import heapq
 from dataclasses import dataclass
-from typing import List, Dict, Any
-from collections import Counter
+from typing import List, Dict, Any, Set
+from collections import defaultdict
 from normalizers.types import SportNormalizerConfig
 from .throttle import recommend_limits
 
@@ -58,17 +59,24 @@ def enforce_policy(
     max_same_team = limits["max_same_team_legs"]
     max_high_var = limits["max_high_variance_legs"]
 
+    # Leg fields read once into parallel lists; the checks below index these
+    scores = [leg.survivability_score for leg in legs]
+    teams = [leg.team_id for leg in legs]
+    prims = [leg.primitive for leg in legs]
+    by_score = scores.__getitem__
+
     reasons = []
-    dropped_indices = []
+    # Set for O(1) membership checks; sorted into the returned list at the end
+    dropped: Set[int] = set()
 
     # Check 1: Event primitives in ultra_safe or high entropy
     if not allow_event_primitives:
         event_indices = [
-            i for i, leg in enumerate(legs)
-            if leg.primitive == "event"
+            i for i, prim in enumerate(prims)
+            if prim == "event"
         ]
         if event_indices:
-            dropped_indices.extend(event_indices)
+            dropped.update(event_indices)
             reasons.append(
                 f"Event primitives not allowed in mode '{mode}' "
                 f"(entropy {limits['entropy_score']:.3f}). "
@@ -77,30 +85,21 @@ def enforce_policy(
 
     # Check 2: Survivability below threshold
     low_surv_indices = [
-        i for i, leg in enumerate(legs)
-        if leg.survivability_score < min_survivability
-        and i not in dropped_indices
+        i for i, score in enumerate(scores)
+        if score < min_survivability
+        and i not in dropped
     ]
     if low_surv_indices:
         # In ultra_safe, drop all low survivability
         # In other modes, allow up to max_high_variance_legs
         if mode == "ultra_safe" or len(low_surv_indices) > max_high_var:
-            # Sort by survivability (lowest first) and drop excess
-            low_surv_with_scores = [
-                (i, legs[i].survivability_score)
-                for i in low_surv_indices
-            ]
-            low_surv_with_scores.sort(key=lambda x: x[1])
-
+            # Drop excess, lowest survivability first (ties keep index order)
             num_to_drop = (
                 len(low_surv_indices) if mode == "ultra_safe"
                 else len(low_surv_indices) - max_high_var
             )
 
-            for i in range(num_to_drop):
-                idx = low_surv_with_scores[i][0]
-                if idx not in dropped_indices:
-                    dropped_indices.append(idx)
+            dropped.update(heapq.nsmallest(num_to_drop, low_surv_indices, key=by_score))
 
             reasons.append(
                 f"Survivability below {min_survivability:.2f} threshold. "
@@ -108,33 +107,18 @@ def enforce_policy(
             )
 
     # Check 3: Same-team leg limit
-    remaining_legs = [
-        leg for i, leg in enumerate(legs)
-        if i not in dropped_indices
-    ]
-    team_counts = Counter(leg.team_id for leg in remaining_legs)
-
-    for team_id, count in team_counts.items():
+    # team_id -> surviving leg indices, built in one pass (first-seen team order)
+    team_to_idx: Dict[str, List[int]] = defaultdict(list)
+    for i, team in enumerate(teams):
+        if i not in dropped:
+            team_to_idx[team].append(i)
+
+    for team_id, team_leg_indices in team_to_idx.items():
+        count = len(team_leg_indices)
         if count > max_same_team:
-            # Find legs for this team (not already dropped)
-            team_leg_indices = [
-                i for i, leg in enumerate(legs)
-                if leg.team_id == team_id and i not in dropped_indices
-            ]
-
-            # Sort by survivability (lowest first)
-            team_legs_with_scores = [
-                (i, legs[i].survivability_score)
-                for i in team_leg_indices
-            ]
-            team_legs_with_scores.sort(key=lambda x: x[1])
-
             # Drop excess (lowest survivability first)
             num_to_drop = count - max_same_team
-            for i in range(num_to_drop):
-                idx = team_legs_with_scores[i][0]
-                if idx not in dropped_indices:
-                    dropped_indices.append(idx)
+            dropped.update(heapq.nsmallest(num_to_drop, team_leg_indices, key=by_score))
 
             reasons.append(
                 f"Team '{team_id}' exceeds max {max_same_team} legs. "
@@ -142,27 +126,17 @@ def enforce_policy(
             )
 
     # Check 4: Total leg count
-    remaining_count = len(legs) - len(dropped_indices)
+    remaining_count = len(legs) - len(dropped)
     if remaining_count > max_legs:
         # Need to drop more legs
         remaining_indices = [
             i for i in range(len(legs))
-            if i not in dropped_indices
-        ]
-
-        # Sort by survivability (lowest first)
-        remaining_with_scores = [
-            (i, legs[i].survivability_score)
-            for i in remaining_indices
+            if i not in dropped
         ]
-        remaining_with_scores.sort(key=lambda x: x[1])
 
-        # Drop excess
+        # Drop excess (lowest survivability first)
         num_to_drop = remaining_count - max_legs
-        for i in range(num_to_drop):
-            idx = remaining_with_scores[i][0]
-            if idx not in dropped_indices:
-                dropped_indices.append(idx)
+        dropped.update(heapq.nsmallest(num_to_drop, remaining_indices, key=by_score))
 
         reasons.append(
             f"Total legs ({remaining_count}) exceeds max {max_legs}. "
@@ -170,12 +144,12 @@ def enforce_policy(
         )
 
     # Determine if policy passes
-    ok = len(dropped_indices) == 0
-    passed_count = len(legs) - len(dropped_indices)
-    failed_count = len(dropped_indices)
+    ok = len(dropped) == 0
+    passed_count = len(legs) - len(dropped)
+    failed_count = len(dropped)
 
     # Sort dropped_indices for determinism
-    dropped_indices.sort()
+    dropped_indices = sorted(dropped)
 
     return {
         "ok": ok,
@@ -4,10 +4,10 @@ Provenance tracking for risk policy enforcement.
 import json
 import hashlib
 from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence
 from normalizers.types import SportNormalizerConfig
-from normalizers.hash import stable_hash_dict
+from normalizers.hash import stable_hash_dict, stable_hash_items
+from normalizers.provenance import utc_now_iso
 from .policy import LegSpec
 
 
@@ -38,7 +38,8 @@ def _hash_throttle_limits(limits: Dict[str, Any]) -> str:
 
 def _hash_legs(legs: List[LegSpec]) -> str:
     """Hash leg specifications for provenance."""
-    legs_data = [
+    # Streamed per leg; same digest as stable_hash_dict({"legs": [...]})
+    return stable_hash_items("legs", (
         {
             "sport_id": leg.sport_id,
             "stat_id": leg.stat_id,
@@ -47,8 +48,7 @@ def _hash_legs(legs: List[LegSpec]) -> str:
             "survivability_score": leg.survivability_score,
         }
         for leg in legs
-    ]
-    return stable_hash_dict({"legs": legs_data})
+    ))
 
 
 def make_risk_provenance(
@@ -56,7 +56,9 @@ def make_risk_provenance(
     mode: str,
     entropy_score: float,
     throttle_limits: Dict[str, Any],
-    legs: List[LegSpec]
+    legs: List[LegSpec],
+    *,
+    now_iso: Optional[str] = None,
 ) -> RiskProvenanceRecord:
     """
     Create provenance record for risk policy enforcement.
@@ -67,6 +69,8 @@ def make_risk_provenance(
         entropy_score: Computed entropy score
         throttle_limits: Throttle recommendations
         legs: Leg specifications
+        now_iso: Timestamp to record (from utc_now_iso); batch callers can
+            stamp once and pass it to every record. Defaults to now.
 
     Returns:
         RiskProvenanceRecord with full audit trail
@@ -81,7 +85,7 @@ def make_risk_provenance(
     inputs_hash = _hash_legs(legs)
 
     return RiskProvenanceRecord(
-        created_at_iso=datetime.utcnow().isoformat(),
+        created_at_iso=now_iso if now_iso is not None else utc_now_iso(),
         sport_id=cfg.sport_id,
         mode=mode,
         normalizer_hash=normalizer_hash,
@@ -89,3 +93,50 @@ def make_risk_provenance(
         throttle_hash=throttle_hash,
         inputs_hash=inputs_hash,
     )
+
+
+def make_risk_provenance_batch(
+    cfg: SportNormalizerConfig,
+    mode: str,
+    entropy_scores: Sequence[float],
+    throttle_limits: Dict[str, Any],
+    legs_batches: Sequence[List[LegSpec]],
+    *,
+    now_iso: Optional[str] = None,
+) -> Dict[str, List[Any]]:
+    """
+    Provenance for many leg sets under one config/mode, as columns.
+
+    Equivalent to calling make_risk_provenance per leg set with a shared
+    timestamp, but the config, throttle and timestamp values are computed
+    once and no record objects are built.
+
+    Args:
+        cfg: SportNormalizerConfig instance
+        mode: Policy mode
+        entropy_scores: One entropy score per leg set
+        throttle_limits: Throttle recommendations
+        legs_batches: Leg specification lists
+        now_iso: Timestamp to record (defaults to now)
+
+    Returns:
+        Dict of RiskProvenanceRecord field name -> list (one entry per leg set)
+
+    Raises:
+        ValueError: If entropy_scores and legs_batches differ in length
+    """
+    n = len(legs_batches)
+    if len(entropy_scores) != n:
+        raise ValueError(
+            f"entropy_scores has {len(entropy_scores)} entries, legs_batches has {n}"
+        )
+
+    return {
+        "created_at_iso": [now_iso if now_iso is not None else utc_now_iso()] * n,
+        "sport_id": [cfg.sport_id] * n,
+        "mode": [mode] * n,
+        "normalizer_hash": [stable_hash_dict(cfg.to_dict())] * n,
+        "entropy_score": [round(e, 4) for e in entropy_scores],
+        "throttle_hash": [_hash_throttle_limits(throttle_limits)] * n,
+        "inputs_hash": [_hash_legs(legs) for legs in legs_batches],
+    }
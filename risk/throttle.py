@@ -3,9 +3,11 @@ Throttle recommendations based on entropy scores.
 
 Provides mode-based leg count and quality recommendations for parlays.
 """
-from typing import Dict, Any
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Tuple
 from normalizers.types import SportNormalizerConfig
-from .entropy import entropy_score
+from .entropy import entropy_score, format_breakdown
 
 
 # Mode definitions
@@ -16,51 +18,83 @@ LADDER = "ladder"
 
 MODES = [ULTRA_SAFE, BALANCED, CORRELATED, LADDER]
 
+# _limits_key -> limits, LRU-bounded like the loader cache.
+_LIMITS_CACHE_MAX = 128
+_LIMITS_CACHE: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+_LIMITS_LOCK = threading.Lock()
+
+
+# Entropy bands shared by the limit tables and the notes text.
+_LOW = "low"  # NBA-ish
+_MODERATE = "moderate"  # NHL-ish
+_HIGH = "high"  # NFL-ish
+_VERY_HIGH = "very high"
+
+# Tables built once at import; each getter is a single lookup.
+_MAX_LEGS: Dict[Tuple[str, str], int] = {
+    (_LOW, ULTRA_SAFE): 5, (_LOW, BALANCED): 6,
+    (_LOW, CORRELATED): 5, (_LOW, LADDER): 4,
+    (_MODERATE, ULTRA_SAFE): 4, (_MODERATE, BALANCED): 5,
+    (_MODERATE, CORRELATED): 4, (_MODERATE, LADDER): 3,
+    (_HIGH, ULTRA_SAFE): 3, (_HIGH, BALANCED): 4,
+    (_HIGH, CORRELATED): 4, (_HIGH, LADDER): 3,
+    (_VERY_HIGH, ULTRA_SAFE): 2, (_VERY_HIGH, BALANCED): 3,
+    (_VERY_HIGH, CORRELATED): 3, (_VERY_HIGH, LADDER): 2,
+}
+
+# Event primitives are allowed strictly below this entropy (outside ultra_safe).
+_EVENT_ENTROPY_CUTOFF = 0.80
+
+_MIN_SURVIVABILITY: Dict[str, float] = {
+    ULTRA_SAFE: 0.70,
+    BALANCED: 0.60,
+    CORRELATED: 0.55,
+    LADDER: 0.55,
+}
+
+# Lower entropy allows more same-team correlation.
+_MAX_SAME_TEAM: Dict[Tuple[str, str], int] = {
+    (_LOW, ULTRA_SAFE): 2, (_LOW, BALANCED): 2,
+    (_LOW, CORRELATED): 3, (_LOW, LADDER): 3,
+    (_MODERATE, ULTRA_SAFE): 1, (_MODERATE, BALANCED): 2,
+    (_MODERATE, CORRELATED): 2, (_MODERATE, LADDER): 2,
+    (_HIGH, ULTRA_SAFE): 1, (_HIGH, BALANCED): 1,
+    (_HIGH, CORRELATED): 2, (_HIGH, LADDER): 2,
+    (_VERY_HIGH, ULTRA_SAFE): 1, (_VERY_HIGH, BALANCED): 1,
+    (_VERY_HIGH, CORRELATED): 2, (_VERY_HIGH, LADDER): 2,
+}
+
+_MAX_HIGH_VARIANCE: Dict[str, int] = {
+    ULTRA_SAFE: 0,
+    BALANCED: 1,
+    CORRELATED: 1,
+    LADDER: 0,
+}
+
+
+def _entropy_band(entropy: float) -> str:
+    """Bucket an entropy score into the band used by the limit tables."""
+    if entropy <= 0.35:
+        return _LOW
+    elif entropy <= 0.55:
+        return _MODERATE
+    elif entropy <= 0.75:
+        return _HIGH
+    return _VERY_HIGH
+
 
-def _get_max_legs(entropy: float, mode: str) -> int:
+def _get_max_legs(band: str, mode: str) -> int:
     """
-    Determine max parlay legs based on entropy and mode.
+    Determine max parlay legs based on entropy band and mode.
 
     Lower entropy sports allow more legs.
     """
-    if entropy <= 0.35:  # NBA-ish
-        return {
-            ULTRA_SAFE: 5,
-            BALANCED: 6,
-            CORRELATED: 5,
-            LADDER: 4,
-        }[mode]
-    elif entropy <= 0.55:  # NHL-ish
-        return {
-            ULTRA_SAFE: 4,
-            BALANCED: 5,
-            CORRELATED: 4,
-            LADDER: 3,
-        }[mode]
-    elif entropy <= 0.75:  # NFL-ish
-        return {
-            ULTRA_SAFE: 3,
-            BALANCED: 4,
-            CORRELATED: 4,
-            LADDER: 3,
-        }[mode]
-    else:  # Very high entropy
-        return {
-            ULTRA_SAFE: 2,
-            BALANCED: 3,
-            CORRELATED: 3,
-            LADDER: 2,
-        }[mode]
+    return _MAX_LEGS[band, mode]
 
 
 def _get_min_survivability(mode: str) -> float:
     """Get minimum survivability threshold for mode."""
-    return {
-        ULTRA_SAFE: 0.70,
-        BALANCED: 0.60,
-        CORRELATED: 0.55,
-        LADDER: 0.55,
-    }[mode]
+    return _MIN_SURVIVABILITY[mode]
 
 
 def _allow_event_primitives(entropy: float, mode: str) -> bool:
@@ -72,21 +106,16 @@ def _allow_event_primitives(entropy: float, mode: str) -> bool:
     """
     if mode == ULTRA_SAFE:
         return False
-    return entropy < 0.80
+    return entropy < _EVENT_ENTROPY_CUTOFF
 
 
-def _get_max_same_team_legs(entropy: float, mode: str) -> int:
+def _get_max_same_team_legs(band: str, mode: str) -> int:
     """
     Determine max legs from same team.
 
     Lower entropy allows more same-team correlation.
     """
-    if mode == ULTRA_SAFE:
-        return 1 if entropy > 0.35 else 2
-    elif mode == BALANCED:
-        return 2 if entropy <= 0.55 else 1
-    else:  # CORRELATED, LADDER
-        return 3 if entropy <= 0.35 else 2
+    return _MAX_SAME_TEAM[band, mode]
 
 
 def _get_max_high_variance_legs(mode: str) -> int:
@@ -95,12 +124,7 @@ def _get_max_high_variance_legs(mode: str) -> int:
 
     High variance = stats with survivability < min_survivability
     """
-    return {
-        ULTRA_SAFE: 0,
-        BALANCED: 1,
-        CORRELATED: 1,
-        LADDER: 0,
-    }[mode]
+    return _MAX_HIGH_VARIANCE[mode]
 
 
 def recommend_limits(cfg: SportNormalizerConfig, mode: str) -> Dict[str, Any]:
@@ -127,28 +151,59 @@ def recommend_limits(cfg: SportNormalizerConfig, mode: str) -> Dict[str, Any]:
     if mode not in MODES:
         raise ValueError(f"Invalid mode '{mode}'. Must be one of: {MODES}")
 
+    # Serve repeats from the cache. Callers get their own copy so the cached
+    # dict stays intact.
+    key = _limits_key(cfg, mode)
+    with _LIMITS_LOCK:
+        limits = _LIMITS_CACHE.get(key)
+        if limits is not None:
+            _LIMITS_CACHE.move_to_end(key)
+    if limits is None:
+        limits = _compute_limits(cfg, mode)
+        with _LIMITS_LOCK:
+            _LIMITS_CACHE[key] = limits
+            while len(_LIMITS_CACHE) > _LIMITS_CACHE_MAX:
+                _LIMITS_CACHE.popitem(last=False)
+
+    out = dict(limits)
+    out["entropy_breakdown"] = dict(limits["entropy_breakdown"])
+    return out
+
+
+def _limits_key(cfg: SportNormalizerConfig, mode: str) -> Tuple[Any, ...]:
+    """
+    Everything _compute_limits reads: the entropy inputs (scalars on frozen
+    sub-specs, so they can't change under a cached entry), sport_id for the
+    notes, and mode.
+    """
+    return (
+        cfg.sport_id,
+        cfg.opportunity.stability_score,
+        cfg.usage.concentration_score,
+        cfg.continuity.event_rate,
+        cfg.continuity.distribution_shape,
+        cfg.volatility.per_event_variance,
+        cfg.volatility.game_level_variance,
+        mode,
+    )
+
+
+def _compute_limits(cfg: SportNormalizerConfig, mode: str) -> Dict[str, Any]:
+    """Build the recommend_limits dict for a validated mode (uncached)."""
     # Compute entropy
     entropy, breakdown = entropy_score(cfg)
 
-    # Determine limits
-    max_legs = _get_max_legs(entropy, mode)
+    # Determine limits (classify once; the band also labels the notes)
+    band = _entropy_band(entropy)
+    max_legs = _get_max_legs(band, mode)
     min_survivability = _get_min_survivability(mode)
     allow_events = _allow_event_primitives(entropy, mode)
-    max_same_team = _get_max_same_team_legs(entropy, mode)
+    max_same_team = _get_max_same_team_legs(band, mode)
     max_high_var = _get_max_high_variance_legs(mode)
 
     # Generate notes
-    if entropy <= 0.35:
-        risk_level = "low"
-    elif entropy <= 0.55:
-        risk_level = "moderate"
-    elif entropy <= 0.75:
-        risk_level = "high"
-    else:
-        risk_level = "very high"
-
     notes = (
-        f"{cfg.sport_id} has {risk_level} entropy ({entropy:.3f}). "
+        f"{cfg.sport_id} has {band} entropy ({entropy:.3f}). "
         f"Mode '{mode}' recommends max {max_legs} legs with "
         f"min survivability {min_survivability:.2f}."
     )
@@ -160,6 +215,6 @@ def recommend_limits(cfg: SportNormalizerConfig, mode: str) -> Dict[str, Any]:
         "max_same_team_legs": max_same_team,
         "max_high_variance_legs": max_high_var,
         "entropy_score": round(entropy, 4),
-        "entropy_breakdown": breakdown,
+        "entropy_breakdown": format_breakdown(breakdown),
         "notes": notes,
     }
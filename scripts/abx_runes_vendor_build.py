@@ -31,25 +31,150 @@ import json
 import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 IMPORTER_VERSION = "abx_runes_vendor_build@1"
 
+# --check's stat -> sha256 cache, relative to the repo root. Kept out of the
+# locked vendor tree; .cache/ is gitignored.
+HASH_CACHE_PATH = Path(".cache") / "abx_runes" / "hashcache.json"
+
+
+_HASH_CHUNK = 1 << 16
+
 
 def sha256_hex(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
 
 
+def sha256_file(p: Path) -> str:
+    """sha256 of a file, streamed in 64 KiB chunks (no whole-file buffer)."""
+    h = hashlib.sha256()
+    with p.open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _sha256_file_or_none(p: Path) -> Optional[str]:
+    return sha256_file(p) if p.exists() else None
+
+
+def sha256_files(paths: List[Path]) -> List[Optional[str]]:
+    """
+    sha256 of each path, in input order (None for missing paths).
+
+    Files are hashed on a thread pool; hashlib releases the GIL while
+    digesting, so reads and hashing overlap across files.
+    """
+    if len(paths) < 2:
+        return [_sha256_file_or_none(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as ex:
+        return list(ex.map(_sha256_file_or_none, paths))
+
+
+def first_hash_failure(expected: List[Tuple[Path, str]]) -> Optional[Tuple[int, Optional[str]]]:
+    """
+    Hash (path, expected_sha256) pairs in parallel; return the first failure.
+
+    Returns (index, actual) for the lowest-index path that is missing
+    (actual None) or whose hash differs, else None. Results are consumed in
+    input order, so the reported failure is deterministic; once it is known,
+    files not yet started are cancelled instead of hashed.
+    """
+    if len(expected) < 2:
+        for i, (p, want) in enumerate(expected):
+            actual = _sha256_file_or_none(p)
+            if actual != want:
+                return i, actual
+        return None
+    ex = ThreadPoolExecutor(max_workers=min(len(expected), os.cpu_count() or 1))
+    try:
+        futures = [ex.submit(_sha256_file_or_none, p) for p, _ in expected]
+        for i, (fut, (_, want)) in enumerate(zip(futures, expected)):
+            actual = fut.result()
+            if actual != want:
+                return i, actual
+        return None
+    finally:
+        ex.shutdown(wait=True, cancel_futures=True)
+
+
+def _stat_key(st: os.stat_result) -> List[int]:
+    # ctime is set by the kernel on every write/rename and can't be restored
+    # with utime, so an in-place edit that keeps size and mtime still misses.
+    return [st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino]
+
+
+def load_hash_cache(path: Path, vendor: Path) -> Dict[str, List[Any]]:
+    """
+    rel path -> [*_stat_key, sha256] recorded for `vendor`; empty if the
+    cache is absent, unreadable or was written for another vendor dir.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("vendor") != str(vendor):
+        return {}
+    files = data.get("files")
+    if not isinstance(files, dict):
+        return {}
+    return {
+        k: v for k, v in files.items()
+        if isinstance(v, list) and len(v) == 5
+    }
+
+
+def write_hash_cache(path: Path, vendor: Path, files: Dict[str, List[Any]]) -> None:
+    """Atomically replace the cache file. Best effort: failures are ignored."""
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(
+            json.dumps({"vendor": str(vendor), "files": files}, sort_keys=True) + "\n",
+            encoding="utf-8",
+            newline="\n",
+        )
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _walk_files(root: Path) -> List[str]:
+    """
+    Relative posix paths of files under root, in the order sorted(rglob) gave.
+
+    os.scandir entries carry their type from the directory read, so no extra
+    stat per entry. Like rglob, symlinked directories are not descended into
+    and symlinks to files count as files. Sorting by path components (not by
+    string) keeps e.g. "a/b" before "a-c", matching Path ordering.
+    """
+    out: List[str] = []
+    stack = [(str(root), "")]
+    while stack:
+        path, prefix = stack.pop()
+        with os.scandir(path) as it:
+            for entry in it:
+                rel = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel + "/"))
+                elif entry.is_file():
+                    out.append(rel)
+    out.sort(key=lambda rel: rel.split("/"))
+    return out
+
+
 def compute_files(root: Path) -> List[Dict[str, str]]:
-    files: List[Dict[str, str]] = []
-    for p in sorted(root.rglob("*")):
-        if p.is_file():
-            rel = p.relative_to(root).as_posix()
-            files.append({"path": rel, "sha256": sha256_hex(p.read_bytes())})
-    return files
+    rels = _walk_files(root)
+    return [
+        {"path": rel, "sha256": digest}
+        for rel, digest in zip(rels, sha256_files([root / rel for rel in rels]))
+    ]
 
 
 def resolve_aal_core_src(repo_root: Path) -> Path:
@@ -87,7 +212,7 @@ def verify_export(export_root: Path) -> Dict[str, Any]:
     if not mani.exists():
         raise SystemExit("Export missing sigils/manifest.json")
 
-    if sha256_hex(mani.read_bytes()) != prov.get("manifest_sha256"):
+    if sha256_file(mani) != prov.get("manifest_sha256"):
         raise SystemExit("manifest_sha256 mismatch (export_provenance.json vs manifest.json)")
 
     # Verify every file hash listed in provenance
@@ -95,15 +220,14 @@ def verify_export(export_root: Path) -> Dict[str, Any]:
     if not isinstance(files, list) or not files:
         raise SystemExit("export_provenance.json missing file list")
 
-    for f in files:
-        rel = f["path"]
-        expected = f["sha256"]
-        p = export_root / rel
-        if not p.exists():
+    # Hash in parallel; stop at the first failure in listed order
+    failure = first_hash_failure([(export_root / f["path"], f["sha256"]) for f in files])
+    if failure is not None:
+        i, actual = failure
+        rel = files[i]["path"]
+        if actual is None:
             raise SystemExit(f"Export missing file: {rel}")
-        actual = sha256_hex(p.read_bytes())
-        if actual != expected:
-            raise SystemExit(f"Export hash mismatch: {rel}")
+        raise SystemExit(f"Export hash mismatch: {rel}")
 
     # Sanity: registry.json + definitions
     if not (export_root / "registry.json").exists():
@@ -126,40 +250,72 @@ def ensure_runtime_accessor(aal_src: Path, *, write: bool) -> None:
 
     text = """from __future__ import annotations
 from pathlib import Path
-import json, hashlib
-from typing import Any, Dict, List
+import copy, json, hashlib
+from typing import Any, Dict, List, Tuple
 
 VENDOR_ROOT = Path(__file__).resolve().parents[1] / "vendor" / "abx_runes"
 
 def _sha256_hex(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
 
+def _stat_key(p: Path) -> Tuple[int, int, int, int]:
+    st = p.stat()
+    return (st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino)
+
+# Parsed LOCK.json keyed by its _stat_key, plus vendored path -> _stat_key of
+# the last copy that hashed correctly.
+_LOCK_CACHE: Dict[str, Any] = {}
+
 def verify_lock() -> Dict[str, Any]:
     lock = VENDOR_ROOT / "LOCK.json"
     if not lock.exists():
         raise FileNotFoundError(f"Missing LOCK.json at {lock}")
-    data = json.loads(lock.read_text(encoding="utf-8"))
+    lock_key = _stat_key(lock)
+    if _LOCK_CACHE.get("key") != lock_key:
+        data = json.loads(lock.read_text(encoding="utf-8"))
+        _LOCK_CACHE.update(key=lock_key, data=data, verified={})
+    data = _LOCK_CACHE["data"]
+    verified = _LOCK_CACHE["verified"]
     for f in data["files"]:
         p = VENDOR_ROOT / f["path"]
-        if not p.exists():
-            raise FileNotFoundError(f"Missing vendored file: {p}")
+        try:
+            key = _stat_key(p)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Missing vendored file: {p}") from None
+        if verified.get(f["path"]) == key:
+            continue
         if _sha256_hex(p.read_bytes()) != f["sha256"]:
             raise ValueError(f"Hash mismatch for {f['path']}")
+        verified[f["path"]] = key
     return {"ok": True, "abx_runes_version": data.get("abx_runes_version")}
 
-def _registry() -> Dict[str, Any]:
+# Parsed registry and id index, keyed by registry.json's _stat_key.
+_REGISTRY_CACHE: Dict[str, Any] = {}
+
+def _registry_index() -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
     verify_lock()
     reg = VENDOR_ROOT / "registry.json"
-    return json.loads(reg.read_text(encoding="utf-8"))
+    key = _stat_key(reg)
+    if _REGISTRY_CACHE.get("key") != key:
+        data = json.loads(reg.read_text(encoding="utf-8"))
+        by_id: Dict[str, Dict[str, Any]] = {}
+        for r in data["runes"]:
+            by_id.setdefault(r["id"], r)
+        _REGISTRY_CACHE.update(key=key, registry=data, by_id=by_id)
+    return _REGISTRY_CACHE["registry"], _REGISTRY_CACHE["by_id"]
+
+def _registry() -> Dict[str, Any]:
+    return _registry_index()[0]
 
 def list_runes() -> List[Dict[str, Any]]:
-    return _registry()["runes"]
+    return copy.deepcopy(_registry()["runes"])
 
 def get_rune(rune_id: str) -> Dict[str, Any]:
-    for r in list_runes():
-        if r["id"] == rune_id:
-            return r
-    raise KeyError(f"Unknown rune id: {rune_id}")
+    try:
+        rune = _registry_index()[1][rune_id]
+    except KeyError:
+        raise KeyError(f"Unknown rune id: {rune_id}") from None
+    return copy.deepcopy(rune)
 
 def get_sigil_svg(rune_id: str) -> str:
     r = get_rune(rune_id)
@@ -171,9 +327,43 @@ def get_sigil_svg(rune_id: str) -> str:
         accessor.write_text(text, encoding="utf-8", newline="\n")
 
 
-def import_export_into_vendor(aal_src: Path, export_root: Path, prov: Dict[str, Any], *, write: bool) -> Path:
+def _link_or_copy_function(src_root: Path, dst_parent: Path) -> Callable[[str, str], Any]:
+    """
+    copytree copy_function for --hardlink: hardlink when source and
+    destination share a filesystem (checked once), else copy2. A file that
+    cannot be linked (permissions, link limits) falls back to copy2.
+
+    Hardlinked vendored files ARE the export's files: rebuilding or editing
+    the export in place changes the vendored (git-tracked) copy too, and
+    --check then reports a mismatch. Only use it for throwaway exports.
+    """
+    if os.stat(src_root).st_dev != os.stat(dst_parent).st_dev:
+        return shutil.copy2
+
+    def _link_or_copy(src: str, dst: str) -> Any:
+        try:
+            os.link(src, dst)
+        except OSError:
+            return shutil.copy2(src, dst)
+        return dst
+
+    return _link_or_copy
+
+
+def import_export_into_vendor(
+    aal_src: Path,
+    export_root: Path,
+    prov: Dict[str, Any],
+    *,
+    write: bool,
+    hardlink: bool = False,
+) -> Path:
     """
     Copies export_root into vendor dir with atomic swap and writes LOCK.json.
+
+    Files are copied (shutil.copy2; on Linux the data moves in-kernel via
+    sendfile). With `hardlink`, they are hardlinked instead and alias the
+    export; see _link_or_copy_function.
     """
     vendor = aal_src / "vendor" / "abx_runes"
     tmp = aal_src.parent / ".tmp_abx_runes_import"
@@ -182,7 +372,10 @@ def import_export_into_vendor(aal_src: Path, export_root: Path, prov: Dict[str,
         shutil.rmtree(tmp)
 
     if write:
-        shutil.copytree(export_root, tmp)
+        copy_function = shutil.copy2
+        if hardlink:
+            copy_function = _link_or_copy_function(export_root, tmp.parent)
+        shutil.copytree(export_root, tmp, copy_function=copy_function)
 
         lock = {
             "abx_runes_version": prov.get("abx_runes_version") or export_root.name,
@@ -193,6 +386,8 @@ def import_export_into_vendor(aal_src: Path, export_root: Path, prov: Dict[str,
             "source_hint": str(export_root),
             "source_commit": prov.get("source_commit"),
         }
+        # Unlink first: an export-side LOCK.json may be hardlinked into tmp
+        (tmp / "LOCK.json").unlink(missing_ok=True)
         (tmp / "LOCK.json").write_text(json.dumps(lock, ensure_ascii=False, indent=2) + "\n", encoding="utf-8", newline="\n")
 
         if vendor.exists():
@@ -202,20 +397,57 @@ def import_export_into_vendor(aal_src: Path, export_root: Path, prov: Dict[str,
     return vendor
 
 
-def check_vendor(aal_src: Path) -> None:
+def check_vendor(aal_src: Path, cache_path: Optional[Path] = None) -> None:
+    """
+    Verify every vendored file against LOCK.json.
+
+    With `cache_path`, files whose stat (size, mtime, ctime, inode) matches
+    the cache reuse the recorded hash and only the rest are re-read; without
+    it, every file is hashed.
+    """
     vendor = aal_src / "vendor" / "abx_runes"
     lock = vendor / "LOCK.json"
     if not lock.exists():
         raise SystemExit(f"Missing vendor lock: {lock}")
 
     data = json.loads(lock.read_text(encoding="utf-8"))
-    for f in data.get("files", []):
-        p = vendor / f["path"]
-        if not p.exists():
+    files = data.get("files", [])
+
+    # LOCK.json stays the authority; the cache only skips re-reading files.
+    cache = load_hash_cache(cache_path, vendor) if cache_path is not None else {}
+    stats: List[Optional[List[int]]] = []
+    actuals: List[Optional[str]] = []
+    stale: List[int] = []
+    for i, f in enumerate(files):
+        try:
+            st = (vendor / f["path"]).stat()
+        except FileNotFoundError:
+            stats.append(None)
+            actuals.append(None)
+            continue
+        stat_key = _stat_key(st)
+        stats.append(stat_key)
+        hit = cache.get(f["path"])
+        if hit is not None and hit[:4] == stat_key:
+            actuals.append(hit[4])
+        else:
+            actuals.append(None)
+            stale.append(i)
+    for i, digest in zip(stale, sha256_files([vendor / files[i]["path"] for i in stale])):
+        actuals[i] = digest
+
+    for f, stat_key, actual in zip(files, stats, actuals):
+        if actual is None:
             raise SystemExit(f"Missing vendored file: {f['path']}")
-        if sha256_hex(p.read_bytes()) != f["sha256"]:
+        if actual != f["sha256"]:
             raise SystemExit(f"Vendored hash mismatch: {f['path']}")
 
+    if cache_path is not None and (stale or len(cache) != len(files)):
+        write_hash_cache(cache_path, vendor, {
+            f["path"]: [*stat_key, actual]
+            for f, stat_key, actual in zip(files, stats, actuals)
+        })
+
     # Sanity: access required files
     for rel in ("sigils/manifest.json", "registry.json"):
         if not (vendor / rel).exists():
@@ -229,13 +461,25 @@ def main() -> int:
     ap.add_argument("--import", dest="import_path", default=None, help="Path to dist/abx-runes/<version> export directory")
     ap.add_argument("--write", action="store_true", help="Write changes to disk (used with --import).")
     ap.add_argument("--check", action="store_true", help="Verify current vendor lock and files.")
+    ap.add_argument(
+        "--hardlink",
+        action="store_true",
+        help="With --import --write, hardlink files instead of copying. The vendored files then "
+        "share inodes with the export: editing or rebuilding the export in place changes them.",
+    )
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"With --check, hash every file instead of trusting {HASH_CACHE_PATH} "
+        "for unchanged ones.",
+    )
     args = ap.parse_args()
 
     repo_root = Path.cwd().resolve()
     aal_src = resolve_aal_core_src(repo_root)
 
     if args.check:
-        check_vendor(aal_src)
+        check_vendor(aal_src, None if args.no_cache else repo_root / HASH_CACHE_PATH)
         return 0
 
     if not args.import_path:
@@ -248,7 +492,9 @@ def main() -> int:
     ensure_runtime_accessor(aal_src, write=args.write)
 
     # Import
-    vendor = import_export_into_vendor(aal_src, export_root, prov, write=args.write)
+    vendor = import_export_into_vendor(
+        aal_src, export_root, prov, write=args.write, hardlink=args.hardlink
+    )
 
     if args.write:
         print(f"[DONE] Imported ABX-Runes to: {vendor}")
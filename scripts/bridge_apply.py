@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
@@ -10,6 +11,7 @@ from abx_runes.yggdrasil.hashing import canonical_json_dumps
 from abx_runes.yggdrasil.io import verify_hash
 from abx_runes.yggdrasil.bridge_apply_core import (
     apply_patch_to_link,
+    build_link_index,
     find_link_index,
     relock_manifest_hash,
     validate_patch_fields,
@@ -44,12 +46,16 @@ def main() -> int:
         print("FAIL: manifest.links must be an array")
         return 4
 
-    patches = [load_json(Path(p)) for p in args.patch]
+    # Reads overlap on a small pool; map keeps the command-line order
+    with ThreadPoolExecutor(max_workers=min(8, len(args.patch))) as ex:
+        patches = list(ex.map(load_json, map(Path, args.patch)))
     # deterministic apply order: sort by patch id then from/to
     def _key(p: Dict[str, Any]) -> Tuple[str, str, str]:
         return (str(p.get("id", "")), str(p.get("from_node", "")), str(p.get("to_node", "")))
     patches = sorted(patches, key=_key)
 
+    # Links are indexed once; patches never change id/from_node/to_node
+    link_index = build_link_index(manifest)
     applied = []
     for p in patches:
         ok, reason = validate_patch_fields(p)
@@ -57,7 +63,7 @@ def main() -> int:
             print(f"FAIL: patch invalid: {reason}")
             return 5
 
-        idx = find_link_index(manifest, p)
+        idx = find_link_index(manifest, p, link_index)
         old = links[idx]
         links[idx] = apply_patch_to_link(old, p)
         applied.append({"patch": _key(p), "link_id": str(links[idx].get("id", ""))})
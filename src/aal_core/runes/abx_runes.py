@@ -16,9 +16,10 @@ No network calls. Stdlib only. Deterministic.
 
 from __future__ import annotations
 from pathlib import Path
+import copy
 import json
 import hashlib
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 
 VENDOR_ROOT = Path(__file__).resolve().parents[1] / "vendor" / "abx_runes"
@@ -29,11 +30,24 @@ def _sha256_hex(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
 
 
+def _stat_key(p: Path) -> Tuple[int, int, int, int]:
+    """(size, mtime_ns, ctime_ns, inode): changes on any write or replace."""
+    st = p.stat()
+    return (st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino)
+
+
+# Parsed LOCK.json keyed by its _stat_key, plus vendored path -> _stat_key of
+# the last copy that hashed correctly.
+_LOCK_CACHE: Dict[str, Any] = {}
+
+
 def verify_lock() -> Dict[str, Any]:
     """
     Verify vendor LOCK.json integrity.
 
     Checks that all files listed in LOCK.json exist and match their SHA256 hashes.
+    A file is only re-hashed when its stat key changed since it last matched,
+    so repeat calls cost one stat() per file.
 
     Returns:
         Dict with {"ok": True, "abx_runes_version": <version>}.
@@ -46,28 +60,61 @@ def verify_lock() -> Dict[str, Any]:
     if not lock.exists():
         raise FileNotFoundError(f"Missing LOCK.json at {lock}")
 
-    data = json.loads(lock.read_text(encoding="utf-8"))
+    lock_key = _stat_key(lock)
+    if _LOCK_CACHE.get("key") != lock_key:
+        data = json.loads(lock.read_text(encoding="utf-8"))
+        _LOCK_CACHE.update(key=lock_key, data=data, verified={})
+    data = _LOCK_CACHE["data"]
+    verified: Dict[str, Tuple[int, int, int, int]] = _LOCK_CACHE["verified"]
 
     for f in data["files"]:
         p = VENDOR_ROOT / f["path"]
-        if not p.exists():
-            raise FileNotFoundError(f"Missing vendored file: {p}")
+        # Stat before reading: a write after this point changes the key
+        try:
+            key = _stat_key(p)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Missing vendored file: {p}") from None
+        if verified.get(f["path"]) == key:
+            continue
         if _sha256_hex(p.read_bytes()) != f["sha256"]:
             raise ValueError(f"Hash mismatch for {f['path']}")
+        verified[f["path"]] = key
 
     return {"ok": True, "abx_runes_version": data.get("abx_runes_version")}
 
 
+# Parsed registry and id index, keyed by registry.json's _stat_key.
+_REGISTRY_CACHE: Dict[str, Any] = {}
+
+
+def _registry_index() -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    Verify lock, then return (registry, rune id -> rune).
+
+    The lock is verified on every call; only parsing and indexing are cached,
+    and redone whenever registry.json changes on disk. Both values are shared
+    with the cache: public accessors hand out copies.
+    """
+    verify_lock()
+    reg = VENDOR_ROOT / "registry.json"
+    key = _stat_key(reg)
+    if _REGISTRY_CACHE.get("key") != key:
+        data = json.loads(reg.read_text(encoding="utf-8"))
+        by_id: Dict[str, Dict[str, Any]] = {}
+        for r in data["runes"]:
+            by_id.setdefault(r["id"], r)  # first entry wins, as the old scan did
+        _REGISTRY_CACHE.update(key=key, registry=data, by_id=by_id)
+    return _REGISTRY_CACHE["registry"], _REGISTRY_CACHE["by_id"]
+
+
 def _registry() -> Dict[str, Any]:
     """
     Load vendored registry.json after verifying lock.
 
     Returns:
-        Registry data dict.
+        Registry data dict (shared with the cache; treat as read-only).
     """
-    verify_lock()
-    reg = VENDOR_ROOT / "registry.json"
-    return json.loads(reg.read_text(encoding="utf-8"))
+    return _registry_index()[0]
 
 
 def list_runes() -> List[Dict[str, Any]]:
@@ -75,13 +122,13 @@ def list_runes() -> List[Dict[str, Any]]:
     List all vendored runes.
 
     Returns:
-        List of rune metadata dicts from registry.
+        List of rune metadata dicts from registry (caller-owned copies).
 
     Raises:
         FileNotFoundError: If vendor assets missing.
         ValueError: If lock verification fails.
     """
-    return _registry()["runes"]
+    return copy.deepcopy(_registry()["runes"])
 
 
 def get_rune(rune_id: str) -> Dict[str, Any]:
@@ -92,17 +139,18 @@ def get_rune(rune_id: str) -> Dict[str, Any]:
         rune_id: Rune identifier (e.g., "0001", "0042").
 
     Returns:
-        Rune metadata dict.
+        Rune metadata dict (a caller-owned copy).
 
     Raises:
         KeyError: If rune ID not found.
         FileNotFoundError: If vendor assets missing.
         ValueError: If lock verification fails.
     """
-    for r in list_runes():
-        if r["id"] == rune_id:
-            return r
-    raise KeyError(f"Unknown rune id: {rune_id}")
+    try:
+        rune = _registry_index()[1][rune_id]
+    except KeyError:
+        raise KeyError(f"Unknown rune id: {rune_id}") from None
+    return copy.deepcopy(rune)
 
 
 def get_sigil_svg(rune_id: str) -> str:
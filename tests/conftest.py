@@ -0,0 +1,41 @@
+"""Shared fixtures: keep test runs out of the repo's own log files."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+
+import pytest
+
+_LOGS_DIR: str | None = None
+
+
+def pytest_configure(config):
+    # main.py opens its provenance/event logs at import time, which happens
+    # during collection, so the override has to be in place before that.
+    global _LOGS_DIR
+    if "AAL_LOGS_DIR" not in os.environ:
+        _LOGS_DIR = tempfile.mkdtemp(prefix="aal-test-logs-")
+        os.environ["AAL_LOGS_DIR"] = _LOGS_DIR
+
+
+def pytest_unconfigure(config):
+    if _LOGS_DIR is not None:
+        shutil.rmtree(_LOGS_DIR, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def _tmp_drift_log(tmp_path, monkeypatch):
+    """Send oracle drift events under tmp_path instead of data/logs/."""
+    monkeypatch.setattr(
+        "abraxas.oracle.drift.DRIFT_LOG_PATH", tmp_path / "logs" / "anchor_drift.log.jsonl"
+    )
+
+
+@pytest.fixture(autouse=True)
+def _tmp_evidence_ledger(tmp_path, monkeypatch):
+    """Send EvidenceLedger() without an explicit path under tmp_path."""
+    path = tmp_path / ".aal" / "evidence_ledger.jsonl"
+    monkeypatch.setattr("aal_core.ledger.ledger.DEFAULT_LEDGER_PATH", path)
+    monkeypatch.setattr("aal_core.governance.promotion_executor.DEFAULT_LEDGER_PATH", path)
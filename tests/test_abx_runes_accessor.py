@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pytest
+
+from aal_core.runes import abx_runes
+
+
+def _write_vendor(root, runes):
+    (root / "sigils").mkdir(parents=True)
+    (root / "registry.json").write_text(json.dumps({"runes": runes}), encoding="utf-8")
+    for r in runes:
+        svg = root / "sigils" / f'{r["id"]}_{r["short_name"]}.svg'
+        svg.write_text(f"<svg>{r['id']}</svg>", encoding="utf-8")
+    files = [
+        {
+            "path": p.relative_to(root).as_posix(),
+            "sha256": hashlib.sha256(p.read_bytes()).hexdigest(),
+        }
+        for p in sorted(root.rglob("*"))
+        if p.is_file()
+    ]
+    (root / "LOCK.json").write_text(json.dumps({"files": files}), encoding="utf-8")
+
+
+def test_get_rune_by_id_and_lock_still_checked(tmp_path, monkeypatch):
+    runes = [
+        {"id": "0001", "short_name": "a"},
+        {"id": "0002", "short_name": "b"},
+        {"id": "0001", "short_name": "dup"},
+    ]
+    _write_vendor(tmp_path, runes)
+    monkeypatch.setattr(abx_runes, "VENDOR_ROOT", tmp_path)
+    monkeypatch.setattr(abx_runes, "_REGISTRY_CACHE", {})
+    monkeypatch.setattr(abx_runes, "_LOCK_CACHE", {})
+
+    # First entry wins for duplicate ids, as with the linear scan
+    assert abx_runes.get_rune("0001")["short_name"] == "a"
+    assert abx_runes.get_sigil_svg("0002") == "<svg>0002</svg>"
+    assert [r["id"] for r in abx_runes.list_runes()] == ["0001", "0002", "0001"]
+    with pytest.raises(KeyError):
+        abx_runes.get_rune("9999")
+
+    # Cached registry does not bypass lock verification
+    (tmp_path / "sigils" / "0001_a.svg").write_text("<svg>tampered</svg>", encoding="utf-8")
+    with pytest.raises(ValueError):
+        abx_runes.get_rune("0001")
+
+
+def test_accessors_return_copies_and_rehash_only_changed_files(tmp_path, monkeypatch):
+    _write_vendor(tmp_path, [{"id": "0001", "short_name": "a", "tags": ["x"]}])
+    monkeypatch.setattr(abx_runes, "VENDOR_ROOT", tmp_path)
+    monkeypatch.setattr(abx_runes, "_REGISTRY_CACHE", {})
+    monkeypatch.setattr(abx_runes, "_LOCK_CACHE", {})
+
+    rune = abx_runes.get_rune("0001")
+    rune["tags"].append("mutated")
+    abx_runes.list_runes()[0]["short_name"] = "mutated"
+    assert abx_runes.get_rune("0001") == {"id": "0001", "short_name": "a", "tags": ["x"]}
+
+    hashed = []
+    real = abx_runes._sha256_hex
+    monkeypatch.setattr(abx_runes, "_sha256_hex", lambda b: hashed.append(b) or real(b))
+    abx_runes.verify_lock()
+    assert hashed == []
+
+    # Same-size rewrite: only the touched file is hashed again, and caught
+    (tmp_path / "sigils" / "0001_a.svg").write_text("<svg>9999</svg>", encoding="utf-8")
+    with pytest.raises(ValueError, match="0001_a.svg"):
+        abx_runes.verify_lock()
+    assert hashed == [b"<svg>9999</svg>"]
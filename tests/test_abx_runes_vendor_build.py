@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "abx_runes_vendor_build.py"
+_spec = importlib.util.spec_from_file_location("abx_runes_vendor_build", _SCRIPT)
+vb = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(vb)
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _make_export(root: Path) -> Path:
+    files = {
+        "sigils/manifest.json": b"{}",
+        "sigils/0001_a.svg": b"<svg>a</svg>",
+        "registry.json": b'{"runes": []}',
+        "definitions/0001.json": b"{}",
+    }
+    for rel, data in files.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_bytes(data)
+    prov = {
+        "manifest_sha256": _sha(files["sigils/manifest.json"]),
+        "files": [{"path": rel, "sha256": _sha(data)} for rel, data in sorted(files.items())],
+    }
+    (root / "export_provenance.json").write_text(json.dumps(prov), encoding="utf-8")
+    return root
+
+
+def _import(tmp_path: Path):
+    export = _make_export(tmp_path / "dist" / "v1")
+    aal_src = tmp_path / "src" / "aal_core"
+    aal_src.mkdir(parents=True)
+    vendor = vb.import_export_into_vendor(aal_src, export, vb.verify_export(export), write=True)
+    return export, aal_src, vendor
+
+
+def test_walk_files_matches_sorted_rglob(tmp_path):
+    for rel in ("a/b", "a-c", "a/z/q", "b", "A", "a.b/x"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text(rel)
+    os.symlink(tmp_path / "a", tmp_path / "lnkdir")
+    os.symlink(tmp_path / "b", tmp_path / "lnkfile")
+
+    expected = [
+        p.relative_to(tmp_path).as_posix() for p in sorted(tmp_path.rglob("*")) if p.is_file()
+    ]
+    assert vb._walk_files(tmp_path) == expected
+    assert [f["path"] for f in vb.compute_files(tmp_path)] == expected
+
+
+def test_verify_export_reports_first_failure_in_order(tmp_path):
+    export = _make_export(tmp_path / "exp")
+    assert vb.verify_export(export)["files"]
+
+    (export / "sigils" / "0001_a.svg").write_bytes(b"tampered")
+    (export / "registry.json").unlink()
+    # registry.json sorts before sigils/0001_a.svg in the provenance list
+    with pytest.raises(SystemExit, match="Export missing file: registry.json"):
+        vb.verify_export(export)
+
+
+def test_check_vendor_cache_lives_outside_vendor_and_reuses_hashes(tmp_path, monkeypatch):
+    _, aal_src, vendor = _import(tmp_path)
+    cache = tmp_path / ".cache" / "hashcache.json"
+
+    before = vb._walk_files(vendor)
+    vb.check_vendor(aal_src, cache)
+    assert cache.exists()
+    assert vb._walk_files(vendor) == before  # nothing written into the locked tree
+
+    hashed = []
+    real = vb.sha256_file
+    monkeypatch.setattr(vb, "sha256_file", lambda p: hashed.append(p) or real(p))
+    vb.check_vendor(aal_src, cache)
+    assert hashed == []
+
+    # Without a cache path every file is hashed again
+    vb.check_vendor(aal_src, None)
+    assert len(hashed) == len(json.loads((vendor / "LOCK.json").read_text())["files"])
+
+
+def test_check_vendor_catches_same_size_edit_with_restored_mtime(tmp_path):
+    _, aal_src, vendor = _import(tmp_path)
+    cache = tmp_path / ".cache" / "hashcache.json"
+    vb.check_vendor(aal_src, cache)
+
+    svg = vendor / "sigils" / "0001_a.svg"
+    st = svg.stat()
+    svg.write_bytes(b"<svg>b</svg>")  # same length
+    os.utime(svg, ns=(st.st_atime_ns, st.st_mtime_ns))
+    with pytest.raises(SystemExit, match="Vendored hash mismatch: sigils/0001_a.svg"):
+        vb.check_vendor(aal_src, cache)
+
+
+def test_import_copies_by_default_and_hardlinks_only_on_request(tmp_path):
+    export, aal_src, vendor = _import(tmp_path)
+    svg = "sigils/0001_a.svg"
+    assert (vendor / svg).stat().st_ino != (export / svg).stat().st_ino
+
+    # Editing the export in place leaves a copied vendor tree intact
+    (export / svg).write_bytes(b"<svg>rebuilt</svg>")
+    vb.check_vendor(aal_src)
+
+    (export / svg).write_bytes(b"<svg>a</svg>")
+    prov = vb.verify_export(export)
+    vendor = vb.import_export_into_vendor(aal_src, export, prov, write=True, hardlink=True)
+    assert (vendor / svg).stat().st_ino == (export / svg).stat().st_ino
+    vb.check_vendor(aal_src)
@@ -124,6 +124,42 @@ class TestBacktestSmoke(unittest.TestCase):
         self.assertEqual(result["n"], 1)
         self.assertIsInstance(result["mae_before"], float)
 
+    def test_backtest_modifier_effect_accepts_generator(self):
+        """Verify non-sized row iterables match the list result."""
+        rows = [
+            {"base": 10.0, "modified": 11.0, "actual": 11.0},
+            {"base": 20.0, "modified": 19.0, "actual": 21.0},
+        ]
+
+        def base_fn(row):
+            return row["base"]
+
+        def mod_fn(row):
+            return row["modified"]
+
+        expected = backtest_modifier_effect(rows, base_fn, mod_fn)
+        result = backtest_modifier_effect((r for r in rows), base_fn, mod_fn)
+
+        self.assertEqual(result, expected)
+
+    def test_backtest_modifier_effect_matches_evaluate_mae(self):
+        """Verify the MAEs are summed exactly as evaluate_mae sums them."""
+        base = [1e8 + 0.1, 1e-8, 3.3, 1e8 + 0.7, 0.1]
+        modified = [0.2, 1e8 + 0.3, 1e-9, 0.4, 2.2]
+        actual = [0.5, 1.0, 0.25, 2.0, 1.5]
+        rows = [{"base": b, "modified": m, "actual": a} for b, m, a in zip(base, modified, actual)]
+
+        def base_fn(row):
+            return row["base"]
+
+        def mod_fn(row):
+            return row["modified"]
+
+        for source in (rows, iter(rows)):
+            result = backtest_modifier_effect(source, base_fn, mod_fn)
+            self.assertEqual(result["mae_before"], round(evaluate_mae(base, actual), 4))
+            self.assertEqual(result["mae_after"], round(evaluate_mae(modified, actual), 4))
+
 
 if __name__ == "__main__":
     unittest.main()
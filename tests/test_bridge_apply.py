@@ -35,9 +35,54 @@ def test_bridge_apply_semantics_minimal():
     }
 
     # Apply inline using the same core functions as the script
-    from abx_runes.yggdrasil.bridge_apply_core import apply_patch_to_link, relock_manifest_hash, find_link_index
+    from abx_runes.yggdrasil.bridge_apply_core import (
+        apply_patch_to_link,
+        find_link_index,
+        relock_manifest_hash,
+    )
     idx = find_link_index(manifest, patch)
     manifest["links"][idx] = apply_patch_to_link(manifest["links"][idx], patch)
     manifest2 = relock_manifest_hash(manifest)
     assert verify_hash(manifest2) is True
     assert manifest2["links"][0]["allowed_lanes"] == ["shadow->forecast"]
+
+
+def test_relock_matches_round_trip_and_leaves_input_untouched():
+    from abx_runes.yggdrasil.bridge_apply_core import relock_manifest_hash
+
+    manifest = {
+        "provenance": {"schema_version": "yggdrasil-ir/0.1", "manifest_hash": "stale"},
+        "nodes": [{"id": "n", "w": 0.1}],
+        "links": [{"id": "link.aaaa", "allowed_lanes": ["a"]}],
+    }
+    before = canonical_json_dumps(manifest)
+    relocked = relock_manifest_hash(manifest)
+    assert relocked == _relock_like_script(manifest)
+    assert canonical_json_dumps(manifest) == before
+
+    # Non-dict provenance is replaced, as before
+    assert verify_hash(relock_manifest_hash({"provenance": None, "nodes": []})) is True
+
+
+def test_find_link_index_with_prebuilt_index():
+    import pytest
+
+    from abx_runes.yggdrasil.bridge_apply_core import build_link_index, find_link_index
+
+    manifest = {
+        "links": [
+            {"id": "link.a", "from_node": "x", "to_node": "y"},
+            {"id": "link.b", "from_node": "y", "to_node": "z"},
+            {"id": "link.c", "from_node": "y", "to_node": "z"},
+        ]
+    }
+    index = build_link_index(manifest)
+    # Same link by id and by edge counts once
+    assert find_link_index(manifest, {"id": "link.a", "from_node": "x", "to_node": "y"}, index) == 0
+    assert find_link_index(manifest, {"id": "link.c"}, index) == 2
+    with pytest.raises(ValueError, match="Ambiguous"):
+        find_link_index(manifest, {"from_node": "y", "to_node": "z"}, index)
+    with pytest.raises(ValueError, match="Ambiguous"):
+        find_link_index(manifest, {"id": "link.a", "from_node": "y", "to_node": "z"}, index)
+    with pytest.raises(ValueError, match="No matching"):
+        find_link_index(manifest, {"id": "link.zz"}, index)
@@ -0,0 +1,251 @@
+import hashlib
+
+from bus._hash import HASH_ALGO, digest_hex
+from bus.provenance import canonical_json, hash_event
+
+
+def test_default_digest_is_sha256():
+    raw = b'{"a":1}'
+    assert digest_hex(raw, "sha256") == hashlib.sha256(raw).hexdigest()
+    if HASH_ALGO == "sha256":
+        assert digest_hex(raw) == hashlib.sha256(raw).hexdigest()
+
+
+def test_blake2b_digest_is_256_bit():
+    raw = b'{"a":1}'
+    h = digest_hex(raw, "blake2b")
+    assert h == hashlib.blake2b(raw, digest_size=32).hexdigest()
+    assert len(h) == 64
+
+
+def test_hash_event_uses_configured_digest():
+    event = {"b": 2, "a": "é"}
+    assert hash_event(event) == digest_hex(canonical_json(event).encode("utf-8"))
+
+
+def test_append_and_hash_matches_separate_calls(tmp_path):
+    from bus.provenance import append_and_hash, append_jsonl
+
+    event = {"z": [1, 2], "a": "ünï"}
+    h = append_and_hash(tmp_path / "a.jsonl", event)
+    append_jsonl(tmp_path / "b.jsonl", event)
+
+    assert h == hash_event(event)
+    assert (tmp_path / "a.jsonl").read_bytes() == (tmp_path / "b.jsonl").read_bytes()
+    assert (tmp_path / "a.jsonl").read_text(encoding="utf-8") == canonical_json(event) + "\n"
+
+
+def test_background_writer_flush_and_reopen(tmp_path):
+    from bus.provenance import BackgroundJsonlWriter, append_jsonl
+
+    path = tmp_path / "logs" / "provenance.jsonl"
+    writer = BackgroundJsonlWriter(path, batch_max=4)
+    events = [{"i": i, "v": "é"} for i in range(10)]
+    for e in events:
+        writer.append(e)
+    writer.flush()
+    for e in events:
+        append_jsonl(tmp_path / "ref.jsonl", e)
+    assert path.read_bytes() == (tmp_path / "ref.jsonl").read_bytes()
+
+    # A deleted log is recreated rather than written to the orphaned inode.
+    path.unlink()
+    writer.append(events[0])
+    writer.close()
+    assert path.read_bytes() == canonical_json(events[0]).encode("utf-8") + b"\n"
+    assert writer.errors == 0
+
+
+def test_check_algo_rejects_unknown_names():
+    import pytest
+
+    from bus._hash import check_algo
+
+    assert check_algo("sha256") == "sha256"
+    with pytest.raises(ValueError, match="AAL_HASH_ALGO"):
+        check_algo("md5", "AAL_HASH_ALGO")
+
+
+def test_fast_json_round_trips_and_falls_back():
+    import json
+
+    from bus._json import dumps, loads
+
+    event = {"z": 1, "a": ["é", 2.5, None], "big": 2**70}
+    assert loads(dumps(event)) == event
+    assert list(loads(dumps(event))) == ["z", "a", "big"]
+    assert dumps({1: "x"}) == b'{"1":"x"}'
+    assert loads(b"[NaN]")[0] != loads(b"[NaN]")[0]
+    assert loads(json.dumps({"k": "v"})) == {"k": "v"}
+
+
+def test_fast_json_dumps_line_and_append_record(tmp_path):
+    from bus._json import dumps, dumps_line
+    from bus.provenance import BackgroundJsonlWriter
+
+    event = {"a": "é", "n": [1, 2.5]}
+    assert dumps_line(event) == dumps(event) + b"\n"
+    assert dumps_line({1: "x"}) == b'{"1":"x"}\n'
+
+    path = tmp_path / "log.jsonl"
+    writer = BackgroundJsonlWriter(path)
+    writer.append_record(dumps_line(event))
+    writer.append_line(dumps(event))
+    writer.close()
+    assert path.read_bytes() == (dumps(event) + b"\n") * 2
+
+
+def test_tail_lines_matches_readlines(tmp_path):
+    from bus.provenance import tail_lines
+
+    path = tmp_path / "log.jsonl"
+    for content in [b"", b"a\n", b"a\nb\n", b"a\nb", b"a\n\nc\n", b"\n", b"x" * 5000 + b"\ny\n"]:
+        path.write_bytes(content)
+        with path.open("rb") as f:
+            expected = f.readlines()
+        for limit in range(1, 5):
+            assert tail_lines(path, limit) == expected[-limit:], (content, limit)
+
+
+def test_background_writer_rotates_and_compresses(tmp_path):
+    import json
+
+    from bus.provenance import (
+        BackgroundJsonlWriter,
+        list_segments,
+        read_segment_lines,
+        tail_lines_rotated,
+    )
+
+    path = tmp_path / "provenance.jsonl"
+    writer = BackgroundJsonlWriter(path, batch_max=1, max_bytes=200)
+    events = [{"i": i, "pad": "x" * 40, "timestamp_ms": 1000 + i} for i in range(20)]
+    for e in events:
+        writer.append(e)
+    writer.close()
+
+    segments = list_segments(path)
+    assert len(segments) > 1
+    assert all(s.suffix in (".zst", ".gz") for s in segments)
+    assert not list(tmp_path.glob("*.tmp"))
+
+    lines = [line for s in segments for line in read_segment_lines(s)]
+    lines += path.read_bytes().splitlines(keepends=True)
+    assert [json.loads(line) for line in lines] == events
+    assert [json.loads(line) for line in tail_lines_rotated(path, 15)] == events[-15:]
+    assert len(tail_lines_rotated(path, 100)) == 20
+
+    index_lines = (tmp_path / "provenance.index.jsonl").read_bytes().splitlines()
+    index = [json.loads(line) for line in index_lines]
+    assert [e["segment"] for e in index] == [s.name.rsplit(".", 1)[0] for s in segments]
+    assert index[0]["start_ms"] == 1000
+    assert writer.errors == 0
+
+
+def test_tail_lines_rotated_survives_concurrent_compression(tmp_path, monkeypatch):
+    from bus import provenance
+
+    path = tmp_path / "provenance.jsonl"
+    raw = tmp_path / "provenance.1.jsonl"
+    raw.write_bytes(b"a\nb\n")
+    path.write_bytes(b"c\n")
+
+    # Listed while still raw, then compressed (and unlinked) before it is opened.
+    stale = provenance.list_segments(path)
+    assert stale == [raw]
+    provenance.compress_segment(raw)
+    assert not raw.exists()
+    monkeypatch.setattr(provenance, "list_segments", lambda _: stale)
+
+    assert provenance.tail_lines_rotated(path, 3) == [b"a\n", b"b\n", b"c\n"]
+
+
+def test_writev_all_chunks_and_resumes_short_writes(tmp_path, monkeypatch):
+    import os
+
+    from bus import provenance
+
+    chunks = [b"line-%d\n" % i for i in range(3000)]
+    real_writev = os.writev
+    calls = []
+
+    def short_writev(fd, bufs):
+        calls.append(len(bufs))
+        # Stop partway through the second buffer to force a resume.
+        first = bytes(bufs[0]) + bytes(bufs[1])[:2] if len(bufs) > 1 else bytes(bufs[0])
+        return real_writev(fd, [first])
+
+    monkeypatch.setattr(provenance, "_IOV_MAX", 1024)
+    monkeypatch.setattr(os, "writev", short_writev)
+    path = tmp_path / "out.jsonl"
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+    try:
+        provenance._writev_all(fd, chunks)
+    finally:
+        os.close(fd)
+    assert path.read_bytes() == b"".join(chunks)
+    assert max(calls) <= 1024
+
+
+def _rotating_writer_proc(path, proc, count):
+    from bus.provenance import BackgroundJsonlWriter
+
+    writer = BackgroundJsonlWriter(path, batch_max=3, max_bytes=600)
+    for i in range(count):
+        writer.append({"p": proc, "i": i, "pad": "x" * 30})
+    writer.close()
+    assert writer.errors == 0
+
+
+def test_background_writer_rotation_across_processes(tmp_path):
+    import json
+    import multiprocessing
+    import sys
+
+    import pytest
+
+    from bus.provenance import list_segments, read_segment_lines
+
+    if sys.platform == "win32":
+        pytest.skip("flock-based rotation is POSIX-only")
+
+    path = tmp_path / "provenance.jsonl"
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_rotating_writer_proc, args=(path, p, 150)) for p in range(4)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+        assert proc.exitcode == 0
+
+    lines = [line for s in list_segments(path) for line in read_segment_lines(s)]
+    lines += path.read_bytes().splitlines(keepends=True)
+    seen = sorted((e["p"], e["i"]) for e in map(json.loads, lines))
+    # Every record lands exactly once, none lost to a rotated-away inode
+    assert seen == sorted((p, i) for p in range(4) for i in range(150))
+
+
+def test_background_writer_failures_are_logged_and_release_flush(tmp_path, caplog):
+    from bus.provenance import BackgroundJsonlWriter
+
+    writer = BackgroundJsonlWriter(tmp_path / "out.jsonl")
+
+    def boom(chunks):
+        raise RuntimeError("disk on fire")
+
+    writer._write = boom
+    writer.append({"a": 1})
+    writer.append({"a": 2})
+    with caplog.at_level("ERROR", logger="bus.provenance"):
+        assert writer.flush(timeout=5) is True
+    stats = writer.stats()
+    assert stats["alive"] is True
+    assert stats["errors"] >= 1 and stats["dropped_lines"] == 2
+    assert "disk on fire" in stats["last_error"]
+    assert "dropped" in caplog.text
+
+    # The thread survives: later batches still get written
+    del writer._write
+    writer.append({"a": 3})
+    writer.close()
+    assert (tmp_path / "out.jsonl").read_bytes() == b'{"a":3}\n'
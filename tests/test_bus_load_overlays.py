@@ -0,0 +1,112 @@
+import json
+from pathlib import Path
+
+from bus.overlay_registry import load_one, load_overlays
+
+
+def _write_overlay(root: Path, name: str, **extra) -> None:
+    d = root / name
+    d.mkdir(parents=True, exist_ok=True)
+    data = {
+        "name": name,
+        "version": "0.1.0",
+        "status": "active",
+        "phases": ["OPEN", "SEAL"],
+        "entrypoint": "python run.py",
+        "capabilities": [],
+    }
+    data.update(extra)
+    (d / "manifest.json").write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_load_overlays_parallel_matches_serial(tmp_path):
+    for i in range(12):
+        _write_overlay(tmp_path, f"ov{i:02d}", timeout_ms=100 + i)
+    (tmp_path / "not_an_overlay").mkdir()
+
+    many = load_overlays(tmp_path, use_cache=False)
+    assert sorted(many) == [f"ov{i:02d}" for i in range(12)]
+    for i in range(12):
+        overlay_dir, mf, manifest_hash = many[f"ov{i:02d}"]
+        assert overlay_dir == tmp_path / f"ov{i:02d}"
+        assert mf.timeout_ms == 100 + i
+        assert len(manifest_hash) == 64
+
+    # Cached reload yields identical manifests and hashes.
+    again = load_overlays(tmp_path)
+    assert {k: v[2] for k, v in again.items()} == {k: v[2] for k, v in many.items()}
+
+
+def test_load_overlays_rereads_only_changed_manifests(tmp_path, monkeypatch):
+    import os
+
+    from bus import overlay_registry
+
+    for name in ("a", "b"):
+        _write_overlay(tmp_path, name)
+    first = load_overlays(tmp_path)
+
+    reads = []
+    real_read = overlay_registry._read_manifest
+    monkeypatch.setattr(
+        overlay_registry, "_read_manifest", lambda p: reads.append(p.parent.name) or real_read(p)
+    )
+
+    assert load_overlays(tmp_path) == first
+    assert reads == []
+
+    _write_overlay(tmp_path, "b", timeout_ms=999)
+    st = (tmp_path / "b" / "manifest.json").stat()
+    os.utime(tmp_path / "b" / "manifest.json", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    again = load_overlays(tmp_path)
+    assert reads == ["b"]
+    assert again["a"] == first["a"] and again["b"][1].timeout_ms == 999
+
+
+def test_load_overlays_rejects_invalid_phase(tmp_path):
+    _write_overlay(tmp_path, "good")
+    _write_overlay(tmp_path, "bad", phases=["NOPE"])
+    try:
+        load_overlays(tmp_path, use_cache=False)
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert "Invalid phase" in str(e)
+
+
+def test_manifest_hash_matches_stdlib_canonical_json(tmp_path):
+    import hashlib
+
+    _write_overlay(tmp_path, "uni", status="ünïcode", op_policy={"b": ["x"], "a": []}, scale=1e16)
+    raw = json.loads((tmp_path / "uni" / "manifest.json").read_text(encoding="utf-8"))
+    expected = hashlib.sha256(
+        json.dumps(raw, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+    _, mf, manifest_hash = load_overlays(tmp_path, use_cache=False)["uni"]
+    assert manifest_hash == expected
+    assert mf.status == "ünïcode"
+
+
+def test_manifest_hash_keeps_stdlib_float_form():
+    import hashlib
+
+    from bus.overlay_registry import _hash_manifest
+
+    # Floats keep the stdlib repr (1e+16), not another serializer's 1e16
+    assert _hash_manifest({"scale": 1e16}) == hashlib.sha256(b'{"scale":1e+16}').hexdigest()
+
+
+def test_manifest_identity_strings_are_interned(tmp_path):
+    import sys
+
+    _write_overlay(tmp_path, "caps", capabilities=["exec", "writes"])
+    _, mf, _ = load_overlays(tmp_path, use_cache=False)["caps"]
+    assert mf.name is sys.intern("caps")
+    assert all(c is sys.intern(c) for c in mf.capabilities)
+    assert all(p is sys.intern(p) for p in mf.phases)
+
+
+def test_load_one_matches_load_overlays(tmp_path):
+    _write_overlay(tmp_path, "solo", timeout_ms=1234)
+    expected = load_overlays(tmp_path, use_cache=False)["solo"]
+    assert load_one(tmp_path / "solo" / "manifest.json") == expected
@@ -2,11 +2,14 @@
 Bus-only regression test for overlay invocation.
 Prevents spine breakage by testing the AAL-Core bus independently.
 """
-import os
 import json
+import os
 import subprocess
 from pathlib import Path
+
+import pytest
 from fastapi.testclient import TestClient
+
 from main import app
 
 
@@ -50,7 +53,8 @@ def test_invalid_phase():
         "/invoke/abraxas",
         json={"phase": "INVALID", "data": {"prompt": "test"}}
     )
-    assert r.status_code == 400
+    assert r.status_code == 422
+    assert r.json()["detail"][0]["loc"] == ["body", "phase"]
 
 
 def test_list_overlays():
@@ -80,12 +84,15 @@ def test_provenance_logging():
     )
     assert r.status_code == 200
     request_id = r.json()["request_id"]
+    assert request_id.startswith("abraxas-")
 
     # Check provenance log
     r = c.get("/provenance?limit=10")
     assert r.status_code == 200
+    assert r.headers["content-type"] == "application/json"
     out = r.json()
     assert "events" in out
+    assert out["count"] == len(out["events"]) <= 10
 
     # Find our event
     matching = [e for e in out["events"] if e.get("request_id") == request_id]
@@ -94,6 +101,8 @@ def test_provenance_logging():
     assert event["overlay"] == "abraxas"
     assert event["phase"] == "CLEAR"
     assert "payload_hash" in event
+    import main
+    assert event["payload_hash_algo"] == main.PAYLOAD_HASH_ALGO
     # Payload presence depends on AAL_DEV_LOG_PAYLOAD env var
     if os.environ.get("AAL_DEV_LOG_PAYLOAD") == "1":
         assert "payload" in event
@@ -149,7 +158,8 @@ def test_replay_functionality():
     c = TestClient(app)
 
     # Clear provenance log
-    log_path = Path(__file__).parent.parent / "logs" / "provenance.jsonl"
+    import main
+    log_path = main.PROVENANCE_LOG
     if log_path.exists():
         log_path.unlink()
 
@@ -161,6 +171,9 @@ def test_replay_functionality():
     assert r.status_code == 200
     original_payload_hash = r.json()["payload_hash"]
 
+    # Provenance is written by a background thread; wait for it on disk
+    main.provenance_writer.flush()
+
     # Replay line 1
     result = subprocess.run(
         ["python3", "TOOLS/replay.py", "1"],
@@ -177,3 +190,254 @@ def test_replay_functionality():
 
     # Cleanup
     os.environ.pop("AAL_DEV_LOG_PAYLOAD", None)
+
+
+def test_manifest_cache_invalidates_on_change(tmp_path, monkeypatch):
+    """Manifests are served from cache until mtime/size change."""
+    import asyncio
+
+    import main
+
+    overlay_dir = tmp_path / "demo"
+    overlay_dir.mkdir()
+    manifest_path = overlay_dir / "manifest.json"
+    manifest_path.write_text(json.dumps({"name": "demo", "version": "1"}))
+    monkeypatch.setattr(main, "OVERLAYS_DIR", tmp_path)
+
+    first = main.load_overlay_manifest("demo")
+    assert main.load_overlay_manifest("demo") is first
+
+    manifest_path.write_text(json.dumps({"name": "demo", "version": "22", "phases": ["OPEN"]}))
+    assert main.load_overlay_manifest("demo")["version"] == "22"
+    prepared = main.load_prepared_manifest("demo")
+    assert os.path.basename(prepared.argv[0]) == "python"
+    assert prepared.argv[1:] == ("src/run.py",)
+    assert prepared.phases == frozenset({"OPEN"})
+
+    manifest_path.unlink()
+    assert asyncio.run(main.list_overlays()) == {"overlays": []}
+
+
+def test_subprocess_timeout_is_reported(tmp_path, monkeypatch):
+    """A slow overlay is killed at timeout_ms without blocking the loop."""
+    import asyncio
+    import sys
+
+    import main
+
+    overlay_dir = tmp_path / "slow"
+    overlay_dir.mkdir()
+    (overlay_dir / "run.py").write_text("import time\ntime.sleep(5)\n")
+    monkeypatch.setattr(main, "OVERLAYS_DIR", tmp_path)
+
+    manifest = {"entrypoint": f"{sys.executable} run.py", "timeout_ms": 200}
+    out = asyncio.run(main.invoke_overlay_subprocess("slow", manifest, "OPEN", {}, "slow-1"))
+    assert out["ok"] is False
+    assert out["error"] == "Overlay timeout (200ms)"
+    assert out["error_type"] == "TimeoutExpired"
+
+
+def test_overlay_request_splices_canonical_payload(tmp_path, monkeypatch):
+    """The payload bytes that are hashed are the ones the overlay receives."""
+    import asyncio
+    import sys
+
+    import main
+
+    overlay_dir = tmp_path / "echo"
+    overlay_dir.mkdir()
+    (overlay_dir / "run.py").write_text(
+        "import json, sys\n"
+        "raw = sys.stdin.buffer.read()\n"
+        "result = {'raw': raw.decode('utf-8'), 'req': json.loads(raw)}\n"
+        "print(json.dumps({'ok': True, 'result': result}))\n"
+    )
+    monkeypatch.setattr(main, "OVERLAYS_DIR", tmp_path)
+
+    data = {"b": [1, 2.5], "a": "é"}
+    manifest = {"entrypoint": f"{sys.executable} run.py", "version": "1"}
+    out = asyncio.run(main.invoke_overlay_subprocess("echo", manifest, "OPEN", data, "echo-1"))
+
+    req = out["result"]["req"]
+    assert req["payload"] == data
+    envelope = (req["overlay"], req["version"], req["phase"], req["request_id"])
+    assert envelope == ("echo", "1", "OPEN", "echo-1")
+    raw = out["result"]["raw"].encode("utf-8")
+    assert raw.endswith(b',"payload":' + main.canonical_payload(data) + b"}")
+
+
+def test_invoke_envelope_matches_full_encode(tmp_path, monkeypatch):
+    """The spliced request is byte-identical to encoding the whole envelope."""
+    import asyncio
+    import sys
+
+    import main
+
+    overlay_dir = tmp_path / "echo"
+    overlay_dir.mkdir()
+    (overlay_dir / "run.py").write_text(
+        "import json, sys\n"
+        "raw = sys.stdin.buffer.read().decode('utf-8')\n"
+        "print(json.dumps({'ok': True, 'result': {'raw': raw}}))\n"
+    )
+    monkeypatch.setattr(main, "OVERLAYS_DIR", tmp_path)
+
+    data = {"q": 'say "hi"'}
+    manifest = {"entrypoint": f"{sys.executable} run.py", "version": "0.1.0"}
+    metadata = {"kv_shrink_factor": 0.5}
+    out = asyncio.run(main.invoke_overlay_subprocess(
+        "echo", manifest, "OPEN", data, "r\u00e9q-1", timestamp_ms=1234, metadata=metadata
+    ))
+    expected = main.json_dumps_fast({
+        "overlay": "echo",
+        "version": "0.1.0",
+        "phase": "OPEN",
+        "request_id": "r\u00e9q-1",
+        "timestamp_ms": 1234,
+        "metadata": metadata,
+        "payload": data,
+    })
+    assert out["result"]["raw"].encode("utf-8") == expected
+
+
+def test_invoke_rejects_malformed_body():
+    """Body validation errors keep FastAPI's 422 shape."""
+    c = TestClient(app)
+    r = c.post("/invoke/abraxas", json={"phase": "OPEN"})
+    assert r.status_code == 422
+    assert r.json()["detail"][0]["loc"] == ["body", "data"]
+
+    r = c.post("/invoke/abraxas", json={"phase": "OPEN", "data": {}, "extra": 1})
+    assert r.status_code == 422
+
+    headers = {"content-type": "application/json"}
+    r = c.post("/invoke/abraxas", content=b"{not json", headers=headers)
+    assert r.status_code == 422
+
+
+def test_overlay_index_rebuilds_only_on_change(tmp_path):
+    """The /overlays listing is reused until a manifest changes."""
+    import main
+
+    index = main.OverlayIndex()
+    (tmp_path / "a").mkdir()
+    manifest_path = tmp_path / "a" / "manifest.json"
+    manifest_path.write_text(json.dumps({"name": "a", "version": "1", "phases": ["OPEN"]}))
+    (tmp_path / "no_manifest").mkdir()
+
+    first = index.get(tmp_path)
+    assert first == [
+        {"name": "a", "version": "1", "status": None, "phases": ["OPEN"], "capabilities": []}
+    ]
+    assert index.get(tmp_path) is first
+
+    manifest_path.write_text(json.dumps({"name": "a", "version": "2.0"}))
+    assert index.get(tmp_path)[0]["version"] == "2.0"
+
+
+def test_watched_overlay_index_serves_prepared_manifests(tmp_path):
+    """A clean watched index answers manifest lookups from its snapshot."""
+    import main
+
+    index = main.OverlayIndex()
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "manifest.json").write_text(json.dumps({"name": "a", "version": "1"}))
+    assert index.prepared(tmp_path, "a") is None  # not watched: callers stat
+
+    index._watched = tmp_path  # as watch() would, without needing watchdog
+    prepared = index.prepared(tmp_path, "a")
+    assert prepared.manifest["version"] == "1"
+    assert index.prepared(tmp_path, "missing") is None
+
+    # Edits are only seen after a filesystem event invalidates the snapshot.
+    (tmp_path / "a" / "manifest.json").write_text(json.dumps({"name": "a", "version": "22"}))
+    assert index.prepared(tmp_path, "a") is prepared
+    index.invalidate()
+    assert index.prepared(tmp_path, "a").manifest["version"] == "22"
+
+
+def test_overlay_index_skips_broken_manifest_and_retries_failed_scan(tmp_path, monkeypatch):
+    """One unparseable manifest is left out; a failed scan stays dirty."""
+    import main
+
+    index = main.OverlayIndex()
+    index._watched = tmp_path
+    for name in ("a", "bad"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "a" / "manifest.json").write_text(json.dumps({"name": "a", "version": "1"}))
+    (tmp_path / "bad" / "manifest.json").write_text("{not json")
+
+    assert [o["name"] for o in index.get(tmp_path)] == ["a"]
+    assert index.prepared(tmp_path, "a").manifest["version"] == "1"
+    assert index.prepared(tmp_path, "bad") is None
+
+    index.invalidate()
+    def denied(root):
+        raise PermissionError(root)
+
+    monkeypatch.setattr(main.os, "scandir", denied)
+    with pytest.raises(PermissionError):
+        index.get(tmp_path)
+    monkeypatch.undo()
+    (tmp_path / "a" / "manifest.json").write_text(json.dumps({"name": "a", "version": "22"}))
+    assert index.prepared(tmp_path, "a").manifest["version"] == "22"
+
+
+def test_memory_endpoint():
+    c = TestClient(app)
+    r = c.get("/memory")
+    assert r.status_code == 200
+    assert r.json()["tier"] in {"NORMAL", "SOFT", "HARD"}
+
+
+def test_nonzero_exit_caps_stderr(tmp_path, monkeypatch):
+    """Failing overlays without a JSON error report at most 4 KiB of stderr."""
+    import asyncio
+    import sys
+
+    import main
+
+    overlay_dir = tmp_path / "fails"
+    overlay_dir.mkdir()
+    (overlay_dir / "run.py").write_text(
+        "import sys\nsys.stdout.write('[1]')\nsys.stderr.write('e' * 10000)\nsys.exit(2)\n"
+    )
+    monkeypatch.setattr(main, "OVERLAYS_DIR", tmp_path)
+
+    manifest = {"entrypoint": f"{sys.executable} run.py"}
+    out = asyncio.run(main.invoke_overlay_subprocess("fails", manifest, "OPEN", {}, "fails-1"))
+    assert out["ok"] is False
+    assert out["exit_code"] == 2
+    assert out["error"] == "e" * main.STDERR_CAP_BYTES
+
+
+def test_append_jsonl_appends_one_line_per_record(tmp_path):
+    import main
+
+    path = tmp_path / "events.jsonl"
+    main.append_jsonl(path, {"i": 1})
+    main.append_jsonl(path, {"i": 2, "s": "é"})
+    records = [json.loads(line) for line in path.read_bytes().splitlines()]
+    assert records == [{"i": 1}, {"i": 2, "s": "é"}]
+
+
+def test_provenance_skips_torn_lines(tmp_path, monkeypatch):
+    """A corrupt line in the log is dropped instead of breaking the response."""
+    import main
+
+    log = tmp_path / "provenance.jsonl"
+    log.write_bytes(b'{"i":1}\n{"i":2,"s":"\xc3\xa9"}\n[1]\n{"i":3,"trunc\n\n{"i":4}\n')
+    monkeypatch.setattr(main, "PROVENANCE_LOG", log)
+
+    for limit in (10, 0):
+        out = TestClient(app).get(f"/provenance?limit={limit}").json()
+        assert out == {"events": [{"i": 1}, {"i": 2, "s": "é"}, {"i": 4}], "count": 3}
+
+
+def test_health_reports_provenance_writer():
+    """Health check exposes the provenance writer's failure counters."""
+    c = TestClient(app)
+    body = c.get("/").json()
+    assert body["status"] in ("ok", "degraded")
+    assert {"alive", "errors", "dropped_lines", "last_error"} <= set(body["provenance_writer"])
+    assert body["status"] == ("degraded" if body["provenance_writer"]["errors"] else "ok")
@@ -0,0 +1,33 @@
+from bus.policy import PolicyDecision, enforce_phase_policy
+
+
+def test_non_ascend_phases_pass_without_caps():
+    for phase in ("OPEN", "ALIGN", "CLEAR", "SEAL"):
+        d = enforce_phase_policy(phase, [])
+        assert d.ok is True
+        assert d.reason == "Policy check passed"
+
+
+def test_ascend_requires_exec():
+    d = enforce_phase_policy("ASCEND", ["writes"])
+    assert d == PolicyDecision(False, "ASCEND requires explicit 'exec' capability")
+    assert enforce_phase_policy("ASCEND", ["exec", "writes"]).ok is True
+
+
+def test_declared_caps_are_not_rejected():
+    # v0.6+: declaring a capability is a permission, not proof of use.
+    assert enforce_phase_policy("CLEAR", ["exec", "writes", "external_io"]).ok is True
+
+
+def test_list_and_frozenset_caps_agree():
+    for phase in ("OPEN", "ALIGN", "ASCEND", "CLEAR", "SEAL"):
+        for caps in ([], ["exec"], ["writes", "exec"]):
+            assert enforce_phase_policy(phase, caps) == enforce_phase_policy(phase, frozenset(caps))
+
+
+def test_repeated_decisions_are_shared():
+    enforce_phase_policy.cache_clear()
+    first = enforce_phase_policy("ASCEND", ["writes"])
+    assert enforce_phase_policy("ASCEND", ("writes",)) is first
+    enforce_phase_policy.cache_clear()
+    assert enforce_phase_policy("ASCEND", ["writes"]) == first
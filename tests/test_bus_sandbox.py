@@ -0,0 +1,99 @@
+import json
+import sys
+
+from bus.sandbox import run_overlay
+from bus.types import OverlayManifest
+
+
+def _manifest(entrypoint: str, timeout_ms: int = 5000) -> OverlayManifest:
+    return OverlayManifest(
+        name="echo",
+        version="0.1.0",
+        status="active",
+        phases=["OPEN"],
+        entrypoint=entrypoint,
+        capabilities=[],
+        op_policy={},
+        timeout_ms=timeout_ms,
+    )
+
+
+def _write_script(tmp_path, body: str) -> str:
+    script = tmp_path / "run.py"
+    script.write_text(body, encoding="utf-8")
+    return f"{sys.executable} run.py"
+
+
+def test_run_overlay_roundtrips_utf8_json(tmp_path):
+    entry = _write_script(
+        tmp_path,
+        "import json, sys\n"
+        "req = json.load(sys.stdin)\n"
+        "print(json.dumps({'ok': True, 'echo': req['payload']['text']}))\n",
+    )
+    res = run_overlay(tmp_path, _manifest(entry), "h", "OPEN", {"text": "héllo ✓"}, "r1", 1)
+
+    assert res.ok is True
+    assert res.exit_code == 0
+    assert res.output_json == {"ok": True, "echo": "héllo ✓"}
+    assert json.loads(res.stdout) == res.output_json
+
+
+def test_run_overlay_non_json_stdout(tmp_path):
+    entry = _write_script(tmp_path, "import sys\nprint('plain')\nsys.exit(3)\n")
+    res = run_overlay(tmp_path, _manifest(entry), "h", "OPEN", {}, "r2", 1)
+
+    assert res.ok is False
+    assert res.exit_code == 3
+    assert res.stdout.strip() == "plain"
+    assert res.output_json is None
+
+
+def test_run_overlay_timeout(tmp_path):
+    entry = _write_script(
+        tmp_path,
+        "import sys, time\nsys.stdout.write('partial')\nsys.stdout.flush()\ntime.sleep(5)\n",
+    )
+    res = run_overlay(tmp_path, _manifest(entry, timeout_ms=500), "h", "OPEN", {}, "r3", 1)
+
+    assert res.ok is False
+    assert res.exit_code == 124
+    assert res.stderr == "TIMEOUT"
+    assert isinstance(res.stdout, str)
+
+
+def test_clean_env_tracks_inherited_vars(monkeypatch):
+    from bus.sandbox import _clean_env
+
+    monkeypatch.setenv("PYTHONPATH", "/a")
+    monkeypatch.setenv("AAL_NOISE", "x")
+    env = _clean_env()
+    assert env["PYTHONPATH"] == "/a"
+    assert "AAL_NOISE" not in env
+    env["MUTATED"] = "1"
+    assert "MUTATED" not in _clean_env()
+
+    monkeypatch.delenv("PYTHONPATH")
+    assert "PYTHONPATH" not in _clean_env()
+
+
+def test_run_overlay_envelopes_match_canonical_json(tmp_path):
+    from bus.provenance import canonical_json, hash_event
+
+    entry = _write_script(tmp_path, "import sys\nsys.stdout.write(sys.stdin.read())\n")
+    mf = _manifest(entry)
+    payload = {"z": [1, 2.5, None], "a": {"é": "✓", "b": True}}
+    res = run_overlay(tmp_path, mf, "mh", "OPEN", payload, "r5", 1700000000000)
+
+    stdin_obj = {
+        "overlay": mf.name,
+        "version": mf.version,
+        "phase": "OPEN",
+        "request_id": "r5",
+        "timestamp_ms": 1700000000000,
+        "payload": payload,
+    }
+    assert res.stdout == canonical_json(stdin_obj)
+    assert res.provenance_hash == hash_event(
+        dict(stdin_obj, manifest_hash="mh", entrypoint=mf.entrypoint)
+    )
@@ -0,0 +1,108 @@
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from bus.worker_pool import OverlayWorkerPool, WorkerError
+
+WORKER = textwrap.dedent(
+    """
+    import json, os, sys, time
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    while True:
+        header = stdin.readline()
+        if not header:
+            break
+        req = json.loads(stdin.read(int(header)))
+        if req.get("sleep"):
+            time.sleep(req["sleep"])
+        if req.get("die"):
+            sys.exit(3)
+        env = {k: os.environ.get(k) for k in ("AAL_SANDBOX", "AAL_TEST_SECRET")}
+        out = {"ok": True, "pid": os.getpid(), "echo": req.get("x"), "env": env}
+        data = json.dumps(out).encode()
+        stdout.write(b"%d\\n" % len(data) + data)
+        stdout.flush()
+    """
+)
+
+
+@pytest.fixture
+def pool(tmp_path):
+    (tmp_path / "worker.py").write_text(WORKER)
+    p = OverlayWorkerPool(size=1)
+    yield p, [sys.executable, "worker.py"], tmp_path
+    p.close()
+
+
+def test_worker_is_reused_across_calls(pool):
+    p, cmd, cwd = pool
+    first = p.get("demo", cmd, cwd).call({"x": "é"}, 5.0)
+    second = p.get("demo", cmd, cwd).call({"x": 2}, 5.0)
+    assert first["echo"] == "é" and second["echo"] == 2
+    assert first["pid"] == second["pid"]
+
+
+def test_timeout_kills_and_respawns(pool):
+    p, cmd, cwd = pool
+    pid = p.get("demo", cmd, cwd).call({}, 5.0)["pid"]
+    with pytest.raises(subprocess.TimeoutExpired):
+        p.get("demo", cmd, cwd).call({"sleep": 2}, 0.2)
+    assert p.get("demo", cmd, cwd).call({}, 5.0)["pid"] != pid
+
+
+def test_dead_worker_reports_error_then_recovers(pool):
+    p, cmd, cwd = pool
+    with pytest.raises(WorkerError):
+        p.get("demo", cmd, cwd).call({"die": True}, 5.0)
+    assert p.get("demo", cmd, cwd).call({"x": 1}, 5.0)["echo"] == 1
+
+
+def test_affinity_routes_keys_to_their_worker(tmp_path):
+    from bus.worker_pool import dispatch_key
+
+    (tmp_path / "worker.py").write_text(WORKER)
+    p = OverlayWorkerPool(size=2)
+    cmd = [sys.executable, "worker.py"]
+    try:
+        # Hold worker 0 busy so key "b" lands on a second worker.
+        w0 = p.get("demo", cmd, tmp_path)
+        key_a, key_b = dispatch_key({"op": "a", "x": 1}), dispatch_key({"op": "b"})
+        pid_a = p.call_raw("demo", cmd, tmp_path, b"{}", 5.0, key_a)["pid"]
+        with w0.lock:
+            pid_b = p.call_raw("demo", cmd, tmp_path, b"{}", 5.0, key_b)["pid"]
+        assert pid_a != pid_b
+        for _ in range(3):
+            assert p.call_raw("demo", cmd, tmp_path, b"{}", 5.0, key_b)["pid"] == pid_b
+            assert p.call_raw("demo", cmd, tmp_path, b"{}", 5.0, key_a)["pid"] == pid_a
+
+        stats = p.stats()["demo"]
+        assert [(s["hits"], s["misses"], s["inflight"]) for s in stats] == [(3, 1, 0), (3, 1, 0)]
+        assert dispatch_key({"x": 1}) is None
+    finally:
+        p.close()
+
+
+def test_workers_get_the_sandbox_env(pool, monkeypatch):
+    p, cmd, cwd = pool
+    monkeypatch.setenv("AAL_TEST_SECRET", "leak")
+    env = p.get("demo", cmd, cwd).call({}, 5.0)["env"]
+    assert env == {"AAL_SANDBOX": "1", "AAL_TEST_SECRET": None}
+
+
+def test_write_to_worker_that_never_reads_times_out(tmp_path):
+    import time
+
+    (tmp_path / "stuck.py").write_text("import time\ntime.sleep(30)\n")
+    p = OverlayWorkerPool(size=1)
+    try:
+        worker = p.get("stuck", [sys.executable, "stuck.py"], tmp_path)
+        started = time.monotonic()
+        # Far larger than a pipe buffer: the write itself has to give up
+        with pytest.raises(subprocess.TimeoutExpired):
+            worker.call_raw(b'{"pad": "' + b"x" * (4 << 20) + b'"}', 0.5)
+        assert time.monotonic() - started < 5.0
+        assert not worker.alive
+    finally:
+        p.close()
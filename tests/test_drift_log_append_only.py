@@ -12,40 +12,40 @@ from pathlib import Path
 # Add repo root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from abraxas.oracle import drift
 from abraxas.oracle.engine import generate_oracle
-from abraxas.oracle.drift import DRIFT_LOG_PATH
 
 
 def test_drift_log_created():
     """Test that drift log is created on first oracle run."""
     # Clean up any existing log for this test
-    if DRIFT_LOG_PATH.exists():
-        DRIFT_LOG_PATH.unlink()
+    if drift.DRIFT_LOG_PATH.exists():
+        drift.DRIFT_LOG_PATH.unlink()
 
     # Ensure parent directory exists
-    DRIFT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    drift.DRIFT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
     # Generate oracle (should create log)
     generate_oracle()
 
-    assert DRIFT_LOG_PATH.exists(), "Drift log not created"
+    assert drift.DRIFT_LOG_PATH.exists(), "Drift log not created"
     print("[PASS] Drift log created on first run")
 
 
 def test_drift_log_append_only():
     """Test that drift log appends (not overwrites) on multiple runs."""
     # Clean start
-    if DRIFT_LOG_PATH.exists():
-        DRIFT_LOG_PATH.unlink()
+    if drift.DRIFT_LOG_PATH.exists():
+        drift.DRIFT_LOG_PATH.unlink()
 
-    DRIFT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    drift.DRIFT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
     # Run oracle twice
     generate_oracle(anchor="test anchor alpha")
     generate_oracle(anchor="test anchor beta")
 
     # Read log lines
-    lines = DRIFT_LOG_PATH.read_text(encoding="utf-8").strip().split("\n")
+    lines = drift.DRIFT_LOG_PATH.read_text(encoding="utf-8").strip().split("\n")
 
     assert len(lines) == 2, f"Expected 2 log lines, got {len(lines)}"
 
@@ -67,10 +67,10 @@ def test_drift_log_append_only():
 def test_drift_log_contains_required_fields():
     """Test that drift log entries contain all required fields."""
     # Clean start
-    if DRIFT_LOG_PATH.exists():
-        DRIFT_LOG_PATH.unlink()
+    if drift.DRIFT_LOG_PATH.exists():
+        drift.DRIFT_LOG_PATH.unlink()
 
-    DRIFT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    drift.DRIFT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
     # Generate oracle with history to trigger drift detection
     outputs_history = [
@@ -85,7 +85,7 @@ def test_drift_log_contains_required_fields():
     )
 
     # Read and parse log
-    lines = DRIFT_LOG_PATH.read_text(encoding="utf-8").strip().split("\n")
+    lines = drift.DRIFT_LOG_PATH.read_text(encoding="utf-8").strip().split("\n")
     entry = json.loads(lines[-1])  # Last entry
 
     # Required fields
@@ -121,17 +121,17 @@ def test_drift_log_contains_required_fields():
 def test_multiple_runs_unique_timestamps():
     """Test that multiple oracle runs produce unique timestamps."""
     # Clean start
-    if DRIFT_LOG_PATH.exists():
-        DRIFT_LOG_PATH.unlink()
+    if drift.DRIFT_LOG_PATH.exists():
+        drift.DRIFT_LOG_PATH.unlink()
 
-    DRIFT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    drift.DRIFT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
     # Run oracle 3 times
     for i in range(3):
         generate_oracle(anchor=f"anchor {i}")
 
     # Read log
-    lines = DRIFT_LOG_PATH.read_text(encoding="utf-8").strip().split("\n")
+    lines = drift.DRIFT_LOG_PATH.read_text(encoding="utf-8").strip().split("\n")
     entries = [json.loads(line) for line in lines]
 
     # Extract timestamps
@@ -70,7 +70,10 @@ class TestEntropyScore(unittest.TestCase):
         self.assertIn("shape_penalty", breakdown)
         self.assertIn("vol_penalty", breakdown)
         self.assertIn("total", breakdown)
-        self.assertEqual(breakdown["total"], round(entropy, 4))
+        self.assertEqual(breakdown["total"], entropy)
+
+        from risk import format_breakdown
+        self.assertEqual(format_breakdown(breakdown)["total"], round(entropy, 4))
 
     def test_entropy_deterministic(self):
         """Verify entropy is deterministic across calls."""
@@ -92,6 +95,14 @@ class TestEntropyScore(unittest.TestCase):
         self.assertIn("per_event_variance", breakdown)
         self.assertIn("game_level_variance", breakdown)
 
+    def test_entropy_scores_batch_matches_single(self):
+        """Verify batch scores equal entropy_score totals, in order."""
+        from risk import entropy_scores
+
+        cfgs = [load_preset(s) for s in ("NFL", "NBA", "NHL", "NBA")]
+        self.assertEqual(entropy_scores(cfgs), [entropy_score(c)[0] for c in cfgs])
+        self.assertEqual(entropy_scores([]), [])
+
 
 if __name__ == "__main__":
     unittest.main()
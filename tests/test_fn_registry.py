@@ -249,6 +249,46 @@ def test_function_registry_tick_no_event_if_unchanged(mock_bus, temp_overlays_di
     assert len(mock_bus.events) == 1  # No new event
 
 
+def test_function_registry_prime_does_not_emit(mock_bus, temp_overlays_dir):
+    """Test prime() builds the catalog silently and suppresses the next tick event."""
+    registry = FunctionRegistry(mock_bus, temp_overlays_dir)
+
+    snapshot = registry.prime()
+    assert snapshot.count == 0
+    registry.tick()
+    assert mock_bus.events == []
+
+
+def test_function_registry_request_tick_coalesces(mock_bus, temp_overlays_dir):
+    """Test request_tick() reruns once for callers that arrive mid-rebuild."""
+    import threading
+
+    registry = FunctionRegistry(mock_bus, temp_overlays_dir)
+    started, release = threading.Event(), threading.Event()
+    builds = []
+    real_build = registry.build_catalog
+
+    def slow_build():
+        builds.append(1)
+        if len(builds) == 1:
+            started.set()
+            release.wait(5)
+        return real_build()
+
+    registry.build_catalog = slow_build
+    worker = threading.Thread(target=registry.request_tick)
+    worker.start()
+    started.wait(5)
+
+    assert registry.request_tick() is False
+    assert registry.request_tick() is False
+    release.set()
+    worker.join(5)
+
+    assert len(builds) == 2
+    assert registry.request_tick() is True
+
+
 def test_function_registry_get_snapshot(mock_bus, temp_overlays_dir):
     """Test get_snapshot() returns current snapshot."""
     registry = FunctionRegistry(mock_bus, temp_overlays_dir)
@@ -0,0 +1,94 @@
+"""
+Tests for game-state input fingerprinting.
+"""
+import json
+import unittest
+
+from bus._hash import digest_hex
+from engines.game_state.provenance import fingerprint_inputs, make_provenance
+from engines.game_state.reset import new_game_state
+from engines.game_state.types import GameContext, MarketLine, Modifier
+
+
+def _reference_fingerprint(ctx, lines, mods):
+    inputs = {
+        "context": {
+            "game_id": ctx.game_id,
+            "venue_id": ctx.venue_id,
+            "home_away": ctx.home_away,
+            "coach_id_home": ctx.coach_id_home,
+            "coach_id_away": ctx.coach_id_away,
+            "game_date": ctx.game_date,
+            "days_rest_home": ctx.days_rest_home,
+            "days_rest_away": ctx.days_rest_away,
+            "travel_km_home": ctx.travel_km_home,
+            "travel_km_away": ctx.travel_km_away,
+        },
+        "lines": [
+            {"stat_name": ln.stat_name, "line": ln.line, "direction": ln.direction} for ln in lines
+        ],
+        "modifiers": [
+            {
+                "name": m.name,
+                "key": m.key,
+                "key_value": m.key_value,
+                "applies_to": sorted(m.applies_to),
+                "weight": m.weight,
+            }
+            for m in mods
+        ],
+    }
+    canonical = json.dumps(inputs, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return digest_hex(canonical.encode("utf-8"))
+
+
+class TestFingerprintInputs(unittest.TestCase):
+    """Streamed fingerprint must equal the canonical-JSON document hash."""
+
+    def test_matches_canonical_json_document(self):
+        ctx = GameContext(
+            game_id="g1",
+            venue_id="Café \"Arena\"",
+            home_away="home",
+            coach_id_home="a",
+            coach_id_away="b",
+            game_date="2025-01-01",
+            days_rest_home=2,
+            travel_km_away=1e16,
+        )
+        lines = [MarketLine("points", 21.5, "over"), MarketLine("rebounds", 8.0, "under")]
+        mods = [
+            Modifier("m1", "venue_id", "Café \"Arena\"", ["rebounds", "points"], 0.03),
+            Modifier("m2", "home_away", "home", [], -0.01),
+        ]
+
+        self.assertEqual(
+            fingerprint_inputs(ctx, lines, mods), _reference_fingerprint(ctx, lines, mods)
+        )
+
+    def test_empty_lines_and_mods(self):
+        ctx = GameContext("g2", "v", "away", "a", "b", "2025-01-02")
+        self.assertEqual(fingerprint_inputs(ctx, [], []), _reference_fingerprint(ctx, [], []))
+
+    def test_modifier_set_hash_matches_sorted_name_json(self):
+        ctx = GameContext("g3", "v", "home", "a", "b", "2025-01-03")
+        mods = [
+            Modifier("zeta", "venue_id", "v", ["points"], 0.01),
+            Modifier("älpha", "venue_id", "v", ["points"], 0.02),
+            Modifier("beta", "venue_id", "v", ["points"], 0.03),
+        ]
+        record = make_provenance(new_game_state("g3", ctx), ctx, [], mods)
+
+        names = sorted(m.name for m in mods)
+        expected = digest_hex(
+            json.dumps(names, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        )
+        self.assertEqual(record.modifier_set_hash, expected)
+        self.assertEqual(
+            make_provenance(new_game_state("g3", ctx), ctx, [], []).modifier_set_hash,
+            digest_hex(b"[]"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -99,6 +99,23 @@ class TestGameStateReset(unittest.TestCase):
         self.assertEqual(state1.internal_state, {})
         self.assertEqual(state2.internal_state, {})
 
+    def test_new_state_timestamp_is_integer_ms(self):
+        """Verify creation time is stored as unix ms and formatted lazily."""
+        ctx = GameContext(
+            game_id="test_007",
+            venue_id="ARENA_A",
+            home_away="home",
+            coach_id_home="coach_a",
+            coach_id_away="coach_b",
+            game_date="2025-01-07"
+        )
+
+        state = new_game_state("test_007", ctx)
+
+        self.assertIsInstance(state.created_at_ms, int)
+        self.assertTrue(state.created_at.endswith("+00:00"))
+        self.assertIn("T", state.created_at)
+
 
 if __name__ == "__main__":
     unittest.main()
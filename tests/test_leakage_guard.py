@@ -13,7 +13,7 @@ class TestLeakageGuard(unittest.TestCase):
         """Verify clean state passes guard."""
         state = GameState(
             game_id="test_001",
-            created_at="2025-01-01T00:00:00",
+            created_at_ms=1735689600000,
             context_key="abc123",
             applied_modifiers=[],
             internal_state={}
@@ -26,7 +26,7 @@ class TestLeakageGuard(unittest.TestCase):
         """Verify mismatched game_id raises error."""
         state = GameState(
             game_id="test_001",
-            created_at="2025-01-01T00:00:00",
+            created_at_ms=1735689600000,
             context_key="abc123",
             applied_modifiers=[],
             internal_state={}
@@ -42,7 +42,7 @@ class TestLeakageGuard(unittest.TestCase):
         """Verify forbidden key 'prior_game_tempo' raises error."""
         state = GameState(
             game_id="test_003",
-            created_at="2025-01-01T00:00:00",
+            created_at_ms=1735689600000,
             context_key="abc123",
             applied_modifiers=[],
             internal_state={"prior_game_tempo": 98.5}
@@ -58,7 +58,7 @@ class TestLeakageGuard(unittest.TestCase):
         """Verify forbidden key 'carryover' raises error."""
         state = GameState(
             game_id="test_004",
-            created_at="2025-01-01T00:00:00",
+            created_at_ms=1735689600000,
             context_key="abc123",
             applied_modifiers=[],
             internal_state={"carryover": {"some": "data"}}
@@ -74,7 +74,7 @@ class TestLeakageGuard(unittest.TestCase):
         """Verify non-forbidden keys are allowed."""
         state = GameState(
             game_id="test_005",
-            created_at="2025-01-01T00:00:00",
+            created_at_ms=1735689600000,
             context_key="abc123",
             applied_modifiers=[],
             internal_state={
@@ -91,7 +91,7 @@ class TestLeakageGuard(unittest.TestCase):
         """Verify multiple forbidden keys are detected."""
         state = GameState(
             game_id="test_006",
-            created_at="2025-01-01T00:00:00",
+            created_at_ms=1735689600000,
             context_key="abc123",
             applied_modifiers=[],
             internal_state={
@@ -53,3 +53,29 @@ def test_parse_full_profile():
 def test_ram_stress_range():
     value = compute_instant_ram_stress()
     assert 0.0 <= value <= 1.0
+
+
+def test_rss_tiers_and_degradation():
+    from abx_runes.rss_watch import classify_rss, degradation_for, read_rss_mb
+
+    profile = parse_memory_profile(
+        "MEM[SOFT=100,HARD=200,VOL=MED]; PRIORITY=5; "
+        "DEGRADE{STEP1:SHRINK_KV(0.5),STEP2:CONTEXT(4096),STEP3:DISABLE(X),STEP4:OFFLOAD(COLD)}"
+    )
+    assert classify_rss(50.0, profile) == "NORMAL"
+    assert classify_rss(150.0, profile) == "SOFT"
+    assert classify_rss(250.0, profile) == "HARD"
+    assert classify_rss(None, profile) == "NORMAL"
+    assert classify_rss(250.0, None) == "NORMAL"
+
+    assert degradation_for(profile, "NORMAL") == {}
+    assert degradation_for(profile, "SOFT") == {"kv_shrink_factor": 0.5, "max_context_tokens": 4096}
+    assert degradation_for(profile, "HARD") == {
+        "kv_shrink_factor": 0.5,
+        "max_context_tokens": 4096,
+        "disabled_features": ["X"],
+        "offload_tier": "COLD",
+    }
+
+    rss = read_rss_mb()
+    assert rss is None or rss > 0
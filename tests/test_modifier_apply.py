@@ -3,7 +3,7 @@ Tests for modifier selection and application.
 """
 import unittest
 from engines.game_state.types import GameContext, MarketLine, Modifier
-from engines.game_state.modifiers import select_modifiers, apply_modifiers
+from engines.game_state.modifiers import select_modifiers, apply_modifiers, build_index
 
 
 class TestModifierApply(unittest.TestCase):
@@ -54,6 +54,76 @@ class TestModifierApply(unittest.TestCase):
         self.assertIn("thibs_mod", names)
         self.assertIn("pop_mod", names)
 
+    def test_select_modifiers_repeat_and_catalog_growth(self):
+        """Verify repeated selection is stable and sees appended modifiers."""
+        ctx = GameContext(
+            game_id="test_003",
+            venue_id="MSG",
+            home_away="home",
+            coach_id_home="coach_a",
+            coach_id_away="coach_b",
+            game_date="2025-01-03"
+        )
+
+        catalog = [Modifier("mod1", "venue_id", "MSG", ["points"], 0.03)]
+
+        first = select_modifiers(ctx, catalog)
+        first.append("caller-owned")
+        second = select_modifiers(ctx, catalog)
+        self.assertEqual([m.name for m in second], ["mod1"])
+
+        catalog.append(Modifier("mod2", "home_away", "home", ["points"], 0.01))
+        third = select_modifiers(ctx, catalog)
+        self.assertEqual([m.name for m in third], ["mod1", "mod2"])
+
+        # In-place edits that keep the length are seen too
+        catalog[0] = Modifier("mod1", "venue_id", "STAPLES", ["points"], 0.03)
+        self.assertEqual([m.name for m in select_modifiers(ctx, catalog)], ["mod2"])
+
+    def test_select_modifiers_index_is_a_memoized_snapshot(self):
+        """Verify a CatalogIndex keeps its build-time catalog and hands out copies."""
+        ctx = GameContext(
+            game_id="test_005",
+            venue_id="MSG",
+            home_away="home",
+            coach_id_home="coach_a",
+            coach_id_away="coach_b",
+            game_date="2025-01-05"
+        )
+
+        catalog = [Modifier("mod1", "venue_id", "MSG", ["points"], 0.03)]
+        index = build_index(catalog)
+
+        first = select_modifiers(ctx, index)
+        first.append("caller-owned")
+        catalog[0] = Modifier("mod1", "venue_id", "STAPLES", ["points"], 0.03)
+        self.assertEqual([m.name for m in select_modifiers(ctx, index)], ["mod1"])
+        self.assertEqual(select_modifiers(ctx, build_index(catalog)), [])
+
+    def test_select_modifiers_index_preserves_catalog_order(self):
+        """Verify indexed selection matches a catalog scan, in catalog order."""
+        ctx = GameContext(
+            game_id="test_004",
+            venue_id="MSG",
+            home_away="home",
+            coach_id_home="coach_a",
+            coach_id_away="coach_b",
+            game_date="2025-01-04",
+            days_rest_home=2,
+        )
+
+        catalog = [
+            Modifier("rest", "days_rest_home", "2", ["points"], 0.01),
+            Modifier("venue", "venue_id", "MSG", ["points"], 0.03),
+            Modifier("other", "venue_id", "STAPLES", ["points"], 0.02),
+            Modifier("coach", "coach_id_away", "coach_b", ["assists"], -0.01),
+            Modifier("venue2", "venue_id", "MSG", ["rebounds"], 0.02),
+        ]
+
+        expected = ["rest", "venue", "coach", "venue2"]
+        self.assertEqual([m.name for m in select_modifiers(ctx, catalog)], expected)
+        self.assertEqual([m.name for m in select_modifiers(ctx, build_index(catalog))], expected)
+
     def test_apply_modifiers_positive_weight(self):
         """Verify positive weight application."""
         lines = [MarketLine("points", 20.0, "over")]
@@ -0,0 +1,29 @@
+from aal_core.models import ResonanceFrame
+from modules.noctis_stub.main import _compile_keywords, handle_frame
+
+
+def test_handle_frame_tags_archetypes():
+    frame = ResonanceFrame(
+        source="test",
+        channel="text",
+        text="A prank in a DARK room",
+        symbolic_state=["x", "anima"],
+        tags=["t", "t"],
+    )
+    out = handle_frame(frame, bus=None)[0]
+    assert out.symbolic_state == ["x", "anima", "shadow", "trickster"]
+    assert out.tags == ["t", "noctis_analysis"]
+    assert (out.source, out.channel) == ("noctis_stub", "dream")
+    assert (frame.source, frame.channel, frame.symbolic_state) == ("test", "text", ["x", "anima"])
+    assert out.id == frame.id
+
+
+def test_compiled_keywords_match_substring_checks():
+    # "ro" is a prefix of "room" and "oo" sits inside it: all three must count.
+    table = {"a": ["room"], "b": ["ro"], "c": ["oo"], "d": ["zz"]}
+    pattern, implied = _compile_keywords(table)
+    for text in ["", "room", "ro", "xroomx", "zoo", "rozz"]:
+        matched = set()
+        for m in pattern.finditer(text):
+            matched |= implied[m.group(1)]
+        assert matched == {a for a, kws in table.items() if any(kw in text for kw in kws)}, text
@@ -79,6 +79,75 @@ class TestNormalizerHash(unittest.TestCase):
         # (Tested by comparing different presets above)
         self.assertEqual(len(original_hash), 64)
 
+    def test_golden_hashes_pinned(self):
+        """Hashes match the stdlib canonical JSON form, float edge cases included."""
+        self.assertEqual(
+            stable_hash_dict(load_preset("NBA").to_dict()),
+            "39daa1b310cc34e9017064078106d826d0ed2b33ce993dbdca69fa8b6a2d3744",
+        )
+        edge = {
+            "big": 1e16,
+            "small": 1e-05,
+            "tiny": 5e-324,
+            "nan": float("nan"),
+            "inf": float("-inf"),
+            "none": None,
+            "s": "\u00e9",
+            "n": [0.1, 2**70],
+        }
+        self.assertEqual(
+            stable_hash_dict(edge),
+            "23fccef2bcc82f1a92fec27f2c2950e6e410db9a432023976f401b96e8fcf9d0",
+        )
+
+    def test_unserializable_values_still_raise(self):
+        """Types the stdlib encoder rejects are not silently hashed."""
+        import enum
+
+        class Color(enum.Enum):
+            RED = "red"
+
+        for bad in ({"k": {1, 2}}, {1: "x", "a": "y"}, {"c": Color.RED}):
+            with self.assertRaises(TypeError):
+                stable_hash_dict(bad)
+
+    def test_stable_hash_items_matches_dict_hash(self):
+        """Verify streamed list hashing equals hashing the whole dict."""
+        from normalizers import stable_hash_items
+
+        items = [{"b": 0.5, "a": "LAL"}, {"a": "é", "n": None, "x": 1e-7}, {}]
+        for key, value in (("legs", items), ("legs", []), ('k"\u00e9', items[:1])):
+            self.assertEqual(
+                stable_hash_items(key, iter(value)),
+                stable_hash_dict({key: value}),
+            )
+
+    def test_provenance_hash_tracks_mutation(self):
+        """Verify provenance hashes follow the config's current contents."""
+        from normalizers import cfg_fingerprint, make_provenance
+
+        config = load_preset("NHL")
+        h = stable_hash_dict(config.to_dict())
+        self.assertEqual(make_provenance(config).config_hash, h)
+        self.assertEqual(cfg_fingerprint(config)["hash"], h)
+
+        config.meta["edited"] = True
+        self.assertNotEqual(make_provenance(config).config_hash, h)
+        self.assertEqual(cfg_fingerprint(config)["hash"], stable_hash_dict(config.to_dict()))
+
+    def test_provenance_timestamp_format(self):
+        """Verify created_at_iso keeps the naive utcnow().isoformat() shape."""
+        import time
+        from datetime import datetime, timedelta
+
+        from normalizers import make_provenance
+
+        created = make_provenance(load_preset("NBA")).created_at_iso
+        parsed = datetime.fromisoformat(created)
+        self.assertIsNone(parsed.tzinfo)
+        now = datetime(1970, 1, 1) + timedelta(seconds=time.time())
+        self.assertLess(abs(now - parsed), timedelta(seconds=5))
+
 
 if __name__ == "__main__":
     unittest.main()
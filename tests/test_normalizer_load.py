@@ -69,6 +69,44 @@ class TestNormalizerLoad(unittest.TestCase):
         self.assertIsNotNone(config.meta)
         self.assertIn("notes", config.meta)
 
+    def test_load_normalizer_cached_until_file_changes(self):
+        """Verify repeated loads reuse the parsed YAML until the file changes."""
+        import os
+        import shutil
+        import tempfile
+        from pathlib import Path
+        from unittest import mock
+
+        from normalizers import load_normalizer, loader
+
+        preset = Path(__file__).resolve().parent.parent / "normalizers" / "presets" / "nba.yaml"
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "custom.yaml"
+            shutil.copy(preset, path)
+            first = load_normalizer(str(path))
+            with mock.patch.object(loader.yaml, "load", side_effect=AssertionError("re-parsed")):
+                again = load_normalizer(str(path))
+            self.assertEqual(again, first)
+
+            path.write_text(path.read_text().replace('\nversion: "1.0"', '\nversion: "1.1"', 1))
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            second = load_normalizer(str(path))
+            self.assertIsNot(second, first)
+            self.assertEqual(second.version, "1.1")
+
+    def test_loaded_configs_do_not_share_mutable_state(self):
+        """Verify mutating one loaded config doesn't leak into later loads."""
+        first = load_preset("NBA")
+        first.meta["leaked"] = 1
+        first.stat_map.pop("points")
+        first.failure_modes.bad_script_effects.suppresses.append("leaked")
+
+        second = load_preset("NBA")
+        self.assertNotIn("leaked", second.meta)
+        self.assertIn("points", second.stat_map)
+        self.assertNotIn("leaked", second.failure_modes.bad_script_effects.suppresses)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import pytest
+
+from bus.phase_policy import PolicyRegistry, PolicyViolation
+
+POLICY_FILE = Path(__file__).resolve().parents[1] / "policies" / "phase_constraints.yaml"
+
+
+def test_check_execution_allows_compliant_invocation():
+    reg = PolicyRegistry(POLICY_FILE)
+    reg.check_execution("OPEN", "python run.py", 1000, ["file_read", "network_io"])
+    reg.check_execution("CLEAR", "python run.py", 100, None)
+
+
+def test_check_execution_matches_phase_policy_methods():
+    reg = PolicyRegistry(POLICY_FILE)
+    cases = [
+        ("OPEN", "rm -rf /", 10, None),
+        ("CLEAR", "python run.py", 999_999, None),
+        ("ALIGN", "python run.py", 10, ["network_io"]),
+        ("ALIGN", "python run.py", 10, ["unknown_cap"]),
+    ]
+    for phase, entrypoint, timeout_ms, caps in cases:
+        policy = reg.get(phase)
+        with pytest.raises(PolicyViolation) as direct:
+            policy.check_entrypoint(entrypoint)
+            policy.check_duration(timeout_ms)
+            for cap in caps or []:
+                policy.check_capability(cap)
+        with pytest.raises(PolicyViolation) as via_registry:
+            reg.check_execution(phase, entrypoint, timeout_ms, caps)
+        assert str(via_registry.value) == str(direct.value)
+        assert via_registry.value.details == direct.value.details
+
+
+def test_check_execution_follows_policy_edits():
+    reg = PolicyRegistry(POLICY_FILE)
+    reg.check_execution("CLEAR", "python run.py", 100, None)
+
+    reg.get("CLEAR").max_duration_ms = 50
+    with pytest.raises(PolicyViolation, match="exceeds max 50ms"):
+        reg.check_execution("CLEAR", "python run.py", 100, None)
+
+    reg.get("OPEN").forbidden_patterns.append("run.py")
+    with pytest.raises(PolicyViolation, match="forbidden pattern 'run.py'"):
+        reg.check_execution("OPEN", "python run.py", 10, None)
+
+
+def test_check_execution_unknown_phase():
+    reg = PolicyRegistry(POLICY_FILE)
+    with pytest.raises(ValueError):
+        reg.check_execution("NOPE", "python run.py", 10)  # type: ignore[arg-type]
@@ -2,13 +2,14 @@
 Tests for risk provenance tracking.
 """
 import unittest
+
 from normalizers import load_preset
 from risk import (
+    ULTRA_SAFE,
     LegSpec,
-    recommend_limits,
-    make_risk_provenance,
     RiskProvenanceRecord,
-    ULTRA_SAFE,
+    make_risk_provenance,
+    recommend_limits,
 )
 
 
@@ -112,6 +113,56 @@ class TestProvenanceRisk(unittest.TestCase):
         # ISO format check (basic)
         self.assertIn("T", provenance.created_at_iso)
 
+    def test_batch_timestamp_passthrough(self):
+        """Verify a caller-supplied timestamp is recorded as given."""
+        nba = load_preset("NBA")
+        limits = recommend_limits(nba, ULTRA_SAFE)
+        legs = [LegSpec("NBA", "points", "LAL", "usage", 0.80)]
+        stamp = "2024-01-02T03:04:05.000006"
+
+        records = [
+            make_risk_provenance(
+                nba, ULTRA_SAFE, limits["entropy_score"], limits, legs, now_iso=stamp
+            )
+            for _ in range(3)
+        ]
+
+        self.assertEqual({r.created_at_iso for r in records}, {stamp})
+
+    def test_batch_columns_match_per_record(self):
+        """Verify batch columns equal the per-record fields, in order."""
+        from dataclasses import asdict
+
+        from risk import make_risk_provenance_batch
+
+        nba = load_preset("NBA")
+        limits = recommend_limits(nba, ULTRA_SAFE)
+        batches = [
+            [LegSpec("NBA", "points", "LAL", "usage", 0.80)],
+            [
+                LegSpec("NBA", "assists", "BOS", "usage", 0.75),
+                LegSpec("NBA", "rebounds", "LAL", "hybrid", 0.66),
+            ],
+            [],
+        ]
+        entropies = [0.123456, 0.3, 0.99999]
+        stamp = "2024-01-02T03:04:05.000006"
+
+        columns = make_risk_provenance_batch(
+            nba, ULTRA_SAFE, entropies, limits, batches, now_iso=stamp
+        )
+        records = [
+            asdict(make_risk_provenance(nba, ULTRA_SAFE, e, limits, legs, now_iso=stamp))
+            for e, legs in zip(entropies, batches)
+        ]
+
+        self.assertEqual(list(columns), list(records[0]))
+        for name, values in columns.items():
+            self.assertEqual(values, [r[name] for r in records])
+
+        with self.assertRaises(ValueError):
+            make_risk_provenance_batch(nba, ULTRA_SAFE, entropies[:1], limits, batches)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -114,6 +114,36 @@ class TestThrottleRecommendations(unittest.TestCase):
             nfl_limits["max_same_team_legs"]
         )
 
+    def test_repeat_calls_return_independent_copies(self):
+        """Verify cached limits are equal across calls and not shared."""
+        nba = load_preset("NBA")
+
+        first = recommend_limits(nba, BALANCED)
+        first["max_legs"] = -1
+        first["entropy_breakdown"]["total"] = -1.0
+
+        second = recommend_limits(nba, BALANCED)
+        self.assertNotEqual(second["max_legs"], -1)
+        self.assertNotEqual(second["entropy_breakdown"]["total"], -1.0)
+        self.assertEqual(second, recommend_limits(nba, BALANCED))
+
+    def test_cache_keyed_on_entropy_inputs(self):
+        """Verify cached limits follow the fields entropy is computed from."""
+        from dataclasses import replace
+
+        from risk import entropy_score
+
+        nba = load_preset("NBA")
+        before = recommend_limits(nba, BALANCED)
+
+        nba.meta["edited"] = True  # not an entropy input: same limits
+        self.assertEqual(recommend_limits(nba, BALANCED), before)
+
+        shifted = replace(nba, opportunity=replace(nba.opportunity, stability_score=0.0))
+        limits = recommend_limits(shifted, BALANCED)
+        self.assertEqual(limits["entropy_score"], round(entropy_score(shifted)[0], 4))
+        self.assertNotEqual(limits["entropy_score"], before["entropy_score"])
+
 
 if __name__ == "__main__":
     unittest.main()
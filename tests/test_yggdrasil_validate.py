@@ -72,3 +72,65 @@ def test_allows_shadow_to_forecast_only_if_link_explicit():
         ),
     )
     validate_manifest(m)
+
+
+def _root():
+    return YggdrasilNode(
+        id="root",
+        kind=NodeKind.ROOT_POLICY,
+        realm=Realm.MIDGARD,
+        lane=Lane.NEUTRAL,
+        authority_level=100,
+        parent=None,
+    )
+
+
+def _rune(nid, *depends_on):
+    return YggdrasilNode(
+        id=nid,
+        kind=NodeKind.RUNE,
+        realm=Realm.MIDGARD,
+        lane=Lane.NEUTRAL,
+        authority_level=50,
+        parent="root",
+        depends_on=depends_on,
+    )
+
+
+def test_node_index_is_built_once_per_manifest():
+    m = YggdrasilManifest(
+        provenance=_prov(),
+        nodes=(
+            _root(),
+        ),
+        links=(),
+    )
+    idx = m.node_index()
+    validate_manifest(m)
+    assert m.node_index() is idx
+    assert m == YggdrasilManifest(provenance=_prov(), nodes=m.nodes, links=())
+
+
+def test_rejects_depends_on_cycle():
+    m = YggdrasilManifest(
+        provenance=_prov(),
+        nodes=(
+            _root(),
+            _rune("a", "b"),
+            _rune("b", "root", "a"),
+        ),
+        links=(),
+    )
+    with pytest.raises(ValidationError, match="Cycle detected in depends_on graph at 'a'"):
+        validate_manifest(m)
+
+
+def test_accepts_deep_dependency_chain():
+    n = 5000
+    nodes = [_root()]
+    prev = "root"
+    for i in range(n):
+        nid = f"n{i:05d}"
+        nodes.append(_rune(nid, prev))
+        prev = nid
+    validate_manifest(YggdrasilManifest(provenance=_prov(), nodes=tuple(nodes), links=()))